@@ -574,38 +574,41 @@ def main():
         # =====================================================================
         # SAVE TO PROJECT MEMORY
         # =====================================================================
-        if manager.save_feature_history(feature):
-            result["details"]["feature_saved"] = True
-            result["details"]["feature_slug"] = feature_slug
-            result["details"]["data_summary"] = {
-                "title": title,
-                "complexity": complexity,
-                "files": len(files_modified),
-                "loc": f"+{loc_added}/-{loc_removed}",
-                "agents": agents_used,
-                "commit": commit_hash,
-            }
-        else:
-            result["status"] = "warning"
-            result["message"] = "Failed to save feature history"
-            print(json.dumps(result))
-            return
-
-        # Update velocity metrics
-        if manager.update_velocity_from_feature(feature):
-            result["details"]["velocity_updated"] = True
-
-        # Trigger calibration if times available
-        if feature.estimated_time and feature.actual_time:
-            if manager.trigger_calibration(feature):
-                result["details"]["calibration_triggered"] = True
-
-        # Update context with features count
-        ctx = manager.load_context()
-        ctx.epci.features_completed += 1
-        ctx.epci.last_session = now
-        manager.save_context(ctx)
-        result["details"]["features_completed"] = ctx.epci.features_completed
+        # One transaction with the SQLite backend (feature, velocity,
+        # calibration and context written together)
+        with manager.transaction():
+            if manager.save_feature_history(feature):
+                result["details"]["feature_saved"] = True
+                result["details"]["feature_slug"] = feature_slug
+                result["details"]["data_summary"] = {
+                    "title": title,
+                    "complexity": complexity,
+                    "files": len(files_modified),
+                    "loc": f"+{loc_added}/-{loc_removed}",
+                    "agents": agents_used,
+                    "commit": commit_hash,
+                }
+            else:
+                result["status"] = "warning"
+                result["message"] = "Failed to save feature history"
+                print(json.dumps(result))
+                return
+
+            # Update velocity metrics
+            if manager.update_velocity_from_feature(feature):
+                result["details"]["velocity_updated"] = True
+
+            # Trigger calibration if times available
+            if feature.estimated_time and feature.actual_time:
+                if manager.trigger_calibration(feature):
+                    result["details"]["calibration_triggered"] = True
+
+            # Update context with features count
+            ctx = manager.load_context()
+            ctx.epci.features_completed += 1
+            ctx.epci.last_session = now
+            manager.save_context(ctx)
+            result["details"]["features_completed"] = ctx.epci.features_completed
 
         result["message"] = (
             f"Feature '{feature_slug}' saved to Project Memory "
@@ -281,17 +281,23 @@ class CalibrationManager:
     based on actual vs estimated time measurements.
     """
 
-    def __init__(self, memory_dir: Path, alpha: float = DEFAULT_ALPHA):
+    # Document key of the calibration data in the project memory storage
+    STORAGE_KEY = "learning/calibration.json"
+
+    def __init__(self, memory_dir: Path, alpha: float = DEFAULT_ALPHA, storage=None):
         """
         Initialize the calibration manager.
 
         Args:
             memory_dir: Path to .project-memory directory.
             alpha: EMA smoothing factor.
+            storage: Project memory storage backend (JSON files or SQLite).
+                If None, calibration.json is read and written directly.
         """
         self.memory_dir = Path(memory_dir)
         self.calibration_file = self.memory_dir / "learning" / "calibration.json"
         self.alpha = alpha
+        self.storage = storage
         self._data: Optional[CalibrationData] = None
 
     def load(self) -> CalibrationData:
@@ -304,6 +310,14 @@ class CalibrationManager:
         if self._data is not None:
             return self._data
 
+        if self.storage is not None:
+            try:
+                data = self.storage.read(self.STORAGE_KEY)
+            except Exception:
+                data = None
+            self._data = CalibrationData.from_dict(data) if data else CalibrationData()
+            return self._data
+
         if not self.calibration_file.exists():
             self._data = CalibrationData()
             return self._data
@@ -331,6 +345,9 @@ class CalibrationManager:
         try:
             self._data.updated_at = datetime.utcnow().isoformat() + "Z"
 
+            if self.storage is not None:
+                return self.storage.write(self.STORAGE_KEY, self._data.to_dict())
+
             # Ensure directory exists
             self.calibration_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -508,10 +525,16 @@ class CalibrationManager:
         Returns:
             True if reset successful.
         """
-        if backup and self.calibration_file.exists():
-            backup_path = self.calibration_file.with_suffix(
-                f'.backup-{datetime.now().strftime("%Y%m%d-%H%M%S")}.json'
-            )
+        suffix = f'.backup-{datetime.now().strftime("%Y%m%d-%H%M%S")}.json'
+        if backup and self.storage is not None:
+            try:
+                data = self.storage.read(self.STORAGE_KEY)
+                if data is not None:
+                    self.storage.write(self.STORAGE_KEY.replace('.json', suffix), data)
+            except Exception:
+                pass
+        elif backup and self.calibration_file.exists():
+            backup_path = self.calibration_file.with_suffix(suffix)
             try:
                 self.calibration_file.rename(backup_path)
             except Exception:
@@ -401,16 +401,23 @@ class LearningAnalyzer:
     Handles preference tracking, pattern detection, and scoring.
     """
 
-    def __init__(self, memory_dir: Path):
+    # Document keys in the project memory storage
+    PREFERENCES_KEY = "learning/preferences.json"
+    CORRECTIONS_KEY = "learning/corrections.json"
+
+    def __init__(self, memory_dir: Path, storage=None):
         """
         Initialize the learning analyzer.
 
         Args:
             memory_dir: Path to .project-memory directory.
+            storage: Project memory storage backend (JSON files or SQLite).
+                If None, the learning files are read and written directly.
         """
         self.memory_dir = Path(memory_dir)
         self.preferences_file = self.memory_dir / "learning" / "preferences.json"
         self.corrections_file = self.memory_dir / "learning" / "corrections.json"
+        self.storage = storage
         self._preferences: Optional[LearningPreferences] = None
         self._corrections: Optional[CorrectionsData] = None
 
@@ -419,6 +426,11 @@ class LearningAnalyzer:
         if self._preferences is not None:
             return self._preferences
 
+        if self.storage is not None:
+            data = self._read_document(self.PREFERENCES_KEY)
+            self._preferences = LearningPreferences.from_dict(data) if data else LearningPreferences()
+            return self._preferences
+
         if not self.preferences_file.exists():
             self._preferences = LearningPreferences()
             return self._preferences
@@ -439,6 +451,9 @@ class LearningAnalyzer:
 
         try:
             self._preferences.updated_at = datetime.utcnow().isoformat() + "Z"
+            if self.storage is not None:
+                return self.storage.write(self.PREFERENCES_KEY, self._preferences.to_dict())
+
             self.preferences_file.parent.mkdir(parents=True, exist_ok=True)
 
             temp_file = self.preferences_file.with_suffix('.tmp')
@@ -455,6 +470,11 @@ class LearningAnalyzer:
         if self._corrections is not None:
             return self._corrections
 
+        if self.storage is not None:
+            data = self._read_document(self.CORRECTIONS_KEY)
+            self._corrections = CorrectionsData.from_dict(data) if data else CorrectionsData()
+            return self._corrections
+
         if not self.corrections_file.exists():
             self._corrections = CorrectionsData()
             return self._corrections
@@ -475,6 +495,9 @@ class LearningAnalyzer:
 
         try:
             self._corrections.updated_at = datetime.utcnow().isoformat() + "Z"
+            if self.storage is not None:
+                return self.storage.write(self.CORRECTIONS_KEY, self._corrections.to_dict())
+
             self.corrections_file.parent.mkdir(parents=True, exist_ok=True)
 
             temp_file = self.corrections_file.with_suffix('.tmp')
@@ -640,6 +663,13 @@ class LearningAnalyzer:
         """
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
 
+        if backup and self.storage is not None:
+            for key in (self.PREFERENCES_KEY, self.CORRECTIONS_KEY):
+                data = self._read_document(key)
+                if data is not None:
+                    self.storage.write(key.replace('.json', f'.backup-{timestamp}.json'), data)
+            backup = False
+
         # Backup and reset preferences
         if backup and self.preferences_file.exists():
             backup_path = self.preferences_file.with_suffix(f'.backup-{timestamp}.json')
@@ -661,6 +691,13 @@ class LearningAnalyzer:
 
         return self.save_preferences() and self.save_corrections()
 
+    def _read_document(self, key: str) -> Optional[dict]:
+        """Read a document from storage (None if missing or unreadable)."""
+        try:
+            return self.storage.read(key)
+        except Exception:
+            return None
+
 
 # =============================================================================
 # MODULE EXPORTS
@@ -12,16 +12,24 @@ Usage:
     manager = ProjectMemoryManager()
     context = manager.load_context()
     manager.save_feature_history(feature_data)
+
+    # Same API on a SQLite database (.project-memory/memory.db)
+    manager = ProjectMemoryManager(backend="sqlite")
+    with manager.transaction():
+        manager.save_feature_history(feature_data)
+        manager.update_velocity_from_feature(feature)
 """
 
 import json
 import os
 import shutil
+import sqlite3
 import tempfile
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 
 
 # =============================================================================
@@ -47,6 +55,16 @@ CORE_FILES = [
     "settings.json",
 ]
 
+# Feature metadata index (one file instead of one read per feature)
+FEATURE_INDEX_FILE = "history/index.json"
+
+# FeatureHistory fields kept in the index (used by similarity matching)
+FEATURE_INDEX_FIELDS = ['slug', 'title', 'complexity', 'files_modified', 'completed_at']
+
+# Storage backends ("json": one file per document, "sqlite": one database)
+STORAGE_BACKENDS = ["json", "sqlite"]
+SQLITE_DB_FILE = "memory.db"
+
 
 # =============================================================================
 # DATACLASSES
@@ -374,6 +392,484 @@ def get_migration_path(from_version: str, to_version: str) -> List[tuple]:
     return []
 
 
+# =============================================================================
+# STORAGE BACKENDS
+# =============================================================================
+#
+# Documents are addressed by their path relative to .project-memory/
+# ("context.json", "learning/calibration.json", ...); feature histories by
+# slug. Both backends hold the same JSON data.
+
+def _feature_metadata(data: dict) -> Dict[str, Any]:
+    """Index entry of a feature (FeatureHistory defaults applied)."""
+    feature = FeatureHistory.from_dict(data)
+    return {name: getattr(feature, name) for name in FEATURE_INDEX_FIELDS}
+
+
+def _matches_query(
+    metadata: Dict[str, Any],
+    complexity: Optional[str],
+    since: Optional[str],
+    until: Optional[str],
+    file: Optional[str]
+) -> bool:
+    """Whether a feature's metadata matches query_features() filters."""
+    completed_at = metadata.get('completed_at')
+    if complexity and metadata.get('complexity') != complexity:
+        return False
+    if since and (not completed_at or completed_at < since):
+        return False
+    if until and (not completed_at or completed_at >= until):
+        return False
+    if file and file not in (metadata.get('files_modified') or []):
+        return False
+    return True
+
+
+class JsonFileStorage:
+    """
+    One JSON file per document under .project-memory/ (default backend).
+
+    Feature metadata is served from history/index.json, kept up to date
+    by write_feature(). Each entry records the (mtime_ns, size) of its
+    feature file, so files changed behind the index are read again.
+    """
+
+    name = "json"
+
+    def __init__(self, memory_dir: Path):
+        self.memory_dir = Path(memory_dir)
+
+    def initialize(self) -> None:
+        """Create the directory layout and an empty feature index."""
+        self.memory_dir.mkdir(exist_ok=True)
+        for subdir in SUBDIRS:
+            (self.memory_dir / subdir).mkdir(parents=True, exist_ok=True)
+        if not self.exists(FEATURE_INDEX_FILE):
+            self._write_index({})
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Each file is written atomically on its own; nothing to group."""
+        yield
+
+    def close(self) -> None:
+        pass
+
+    # Documents
+
+    def exists(self, key: str) -> bool:
+        return (self.memory_dir / key).exists()
+
+    def read(self, key: str) -> Optional[dict]:
+        """Parsed document, None if missing (json.JSONDecodeError if corrupted)."""
+        path = self.memory_dir / key
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def write(self, key: str, data: dict) -> bool:
+        return self._atomic_write(self.memory_dir / key, data)
+
+    def stamp(self, key: str) -> Optional[Tuple[int, ...]]:
+        """Change marker of a document: one stat() (None if missing)."""
+        try:
+            st = os.stat(self.memory_dir / key)
+        except OSError:
+            return None
+        # Atomic writes replace the file, so the inode changes too
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def keys(self) -> List[str]:
+        """Every document key (feature histories and their index excluded)."""
+        if not self.memory_dir.exists():
+            return []
+        features_dir = self.memory_dir / "history" / "features"
+        return sorted(
+            path.relative_to(self.memory_dir).as_posix()
+            for path in self.memory_dir.rglob("*.json")
+            if path.parent != features_dir and path != self.memory_dir / FEATURE_INDEX_FILE
+        )
+
+    # Features
+
+    def list_features(self) -> List[str]:
+        features_dir = self.memory_dir / "history" / "features"
+        if not features_dir.exists():
+            return []
+        return [f.stem for f in features_dir.glob("*.json")]
+
+    def read_feature(self, slug: str) -> Optional[dict]:
+        return self.read(f"history/features/{slug}.json")
+
+    def write_feature(self, data: dict) -> bool:
+        """Save a feature's history and its entry in the feature index."""
+        key = f"history/features/{data['slug']}.json"
+        if not self.write(key, data):
+            return False
+
+        index = self._load_index()
+        stamp = self.stamp(key)
+        index[data['slug']] = {**_feature_metadata(data), 'stamp': list(stamp[:2]) if stamp else None}
+        # The feature file is saved; a stale index is repaired on the next read
+        self._write_index(index)
+        return True
+
+    def feature_metadata(self) -> List[Dict[str, Any]]:
+        """
+        Metadata of every feature, from history/index.json.
+
+        Features written or edited without updating the index (older plugin
+        versions, manual edits) are read again, and entries whose file was
+        removed are dropped.
+        """
+        index = self._load_index()
+        stamps = self._feature_stamps()
+
+        if len(index) != len(stamps) or any(
+            index.get(slug, {}).get('stamp') != stamp for slug, stamp in stamps.items()
+        ):
+            index = self._sync_index(index, stamps)
+
+        return [
+            {name: value for name, value in index[slug].items() if name != 'stamp'}
+            for slug in stamps if slug in index
+        ]
+
+    def query_features(
+        self,
+        complexity: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        file: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        return [
+            metadata for metadata in self.feature_metadata()
+            if _matches_query(metadata, complexity, since, until, file)
+        ]
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the feature index (slug -> metadata), empty if missing or corrupted."""
+        try:
+            features = (self.read(FEATURE_INDEX_FILE) or {}).get('features', {})
+            return features if isinstance(features, dict) else {}
+        except Exception:
+            return {}
+
+    def _feature_stamps(self) -> Dict[str, List[int]]:
+        """Slug -> [mtime_ns, size] of every feature file, from one directory listing."""
+        try:
+            entries = list(os.scandir(self.memory_dir / "history" / "features"))
+        except OSError:
+            return {}
+        stamps = {}
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.name.endswith('.json'):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            stamps[entry.name[:-len('.json')]] = [st.st_mtime_ns, st.st_size]
+        return stamps
+
+    def _sync_index(
+        self,
+        index: Dict[str, Dict[str, Any]],
+        stamps: Dict[str, List[int]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Bring the index in line with history/features/ and save it.
+
+        Only features missing from the index, or whose file changed since
+        their entry was written, are read.
+        """
+        synced = {}
+        for slug, stamp in stamps.items():
+            if slug in index and index[slug].get('stamp') == stamp:
+                synced[slug] = index[slug]
+                continue
+            try:
+                data = self.read_feature(slug)
+            except Exception:
+                data = None
+            if data:
+                synced[slug] = {**_feature_metadata(data), 'stamp': stamp}
+
+        self._write_index(synced)
+        return synced
+
+    def _write_index(self, index: Dict[str, Dict[str, Any]]) -> bool:
+        """Save the feature index atomically."""
+        return self.write(FEATURE_INDEX_FILE, {
+            'version': CURRENT_SCHEMA_VERSION,
+            'features': index,
+            'updated_at': datetime.utcnow().isoformat() + "Z",
+        })
+
+    def _atomic_write(self, path: Path, data: dict) -> bool:
+        """
+        Write JSON file atomically to prevent corruption.
+
+        Writes to a temp file first, then moves to target.
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write to temp file
+            fd, temp_path = tempfile.mkstemp(suffix='.json', dir=path.parent)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+
+                # Atomic move
+                shutil.move(temp_path, path)
+                return True
+            except Exception:
+                # Clean up temp file on error
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+        except Exception as e:
+            print(f"Error writing {path}: {e}")
+            return False
+
+
+class SqliteStorage:
+    """
+    All documents and feature histories in .project-memory/memory.db.
+
+    Features are rows indexed by complexity and completion date, with the
+    files they touched in an indexed table. Writes made inside
+    transaction() are committed together.
+    """
+
+    name = "sqlite"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            key TEXT PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS features (
+            slug TEXT PRIMARY KEY,
+            title TEXT,
+            complexity TEXT,
+            created_at TEXT,
+            completed_at TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS features_complexity ON features (complexity);
+        CREATE INDEX IF NOT EXISTS features_completed_at ON features (completed_at);
+        CREATE TABLE IF NOT EXISTS feature_files (
+            slug TEXT NOT NULL REFERENCES features (slug) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            path TEXT NOT NULL,
+            PRIMARY KEY (slug, position)
+        );
+        CREATE INDEX IF NOT EXISTS feature_files_path ON feature_files (path);
+    """
+
+    def __init__(self, memory_dir: Path):
+        self.memory_dir = Path(memory_dir)
+        self.db_path = self.memory_dir / SQLITE_DB_FILE
+        self._conn: Optional[sqlite3.Connection] = None
+        self._depth = 0
+
+    def _db(self, create: bool = False) -> Optional[sqlite3.Connection]:
+        """Open connection; None if the database does not exist and create is False."""
+        if self._conn is None:
+            if not create and not self.db_path.exists():
+                return None
+            self.memory_dir.mkdir(parents=True, exist_ok=True)
+            # Autocommit outside transaction(); BEGIN/COMMIT are issued explicitly
+            self._conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.executescript(self.SCHEMA)
+        return self._conn
+
+    def initialize(self) -> None:
+        """Create the database and its tables."""
+        self._db(create=True)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Commit every write of the block at once (nested blocks join the outer one)."""
+        conn = self._db(create=True)
+        if self._depth == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        self._depth += 1
+        try:
+            yield
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                conn.execute("ROLLBACK")
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._depth = 0
+
+    # Documents
+
+    def exists(self, key: str) -> bool:
+        conn = self._db()
+        return conn is not None and conn.execute(
+            "SELECT 1 FROM documents WHERE key = ?", (key,)
+        ).fetchone() is not None
+
+    def read(self, key: str) -> Optional[dict]:
+        conn = self._db()
+        row = conn and conn.execute("SELECT data FROM documents WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def stamp(self, key: str) -> Optional[Tuple[int, ...]]:
+        """
+        Change marker of the database (None if it does not exist).
+
+        data_version changes when another connection commits, total_changes
+        when this one writes; either way every document is considered changed.
+        """
+        conn = self._db()
+        if conn is None:
+            return None
+        return (conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes)
+
+    def write(self, key: str, data: dict) -> bool:
+        """Save a document (raises inside transaction(), like write_feature())."""
+        try:
+            self._db(create=True).execute(
+                "INSERT OR REPLACE INTO documents (key, data) VALUES (?, ?)",
+                (key, json.dumps(data, ensure_ascii=False)),
+            )
+            return True
+        except sqlite3.Error as e:
+            if self._depth:
+                raise
+            print(f"Error writing {key} to {self.db_path}: {e}")
+            return False
+
+    def keys(self) -> List[str]:
+        conn = self._db()
+        if conn is None:
+            return []
+        return [row[0] for row in conn.execute("SELECT key FROM documents ORDER BY key")]
+
+    # Features
+
+    def list_features(self) -> List[str]:
+        conn = self._db()
+        if conn is None:
+            return []
+        return [row[0] for row in conn.execute("SELECT slug FROM features ORDER BY slug")]
+
+    def read_feature(self, slug: str) -> Optional[dict]:
+        conn = self._db()
+        row = conn and conn.execute("SELECT data FROM features WHERE slug = ?", (slug,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def write_feature(self, data: dict) -> bool:
+        """
+        Save a feature's history and the files it touched.
+
+        Inside an outer transaction() a database error is raised, so that
+        the whole block is rolled back rather than committed half-written.
+        """
+        try:
+            with self.transaction():
+                conn = self._db()
+                conn.execute(
+                    "INSERT OR REPLACE INTO features "
+                    "(slug, title, complexity, created_at, completed_at, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (data['slug'], data.get('title'), data.get('complexity'),
+                     data.get('created_at'), data.get('completed_at'),
+                     json.dumps(data, ensure_ascii=False)),
+                )
+                conn.execute("DELETE FROM feature_files WHERE slug = ?", (data['slug'],))
+                conn.executemany(
+                    "INSERT INTO feature_files (slug, position, path) VALUES (?, ?, ?)",
+                    [(data['slug'], i, path) for i, path in enumerate(data.get('files_modified') or [])],
+                )
+            return True
+        except sqlite3.Error as e:
+            if self._depth:
+                raise
+            print(f"Error writing feature {data['slug']} to {self.db_path}: {e}")
+            return False
+
+    def feature_metadata(self) -> List[Dict[str, Any]]:
+        return self.query_features()
+
+    def query_features(
+        self,
+        complexity: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        file: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        conn = self._db()
+        if conn is None:
+            return []
+
+        where, params = [], []
+        if complexity:
+            where.append("complexity = ?")
+            params.append(complexity)
+        if since:
+            where.append("completed_at >= ?")
+            params.append(since)
+        if until:
+            where.append("completed_at < ?")
+            params.append(until)
+        if file:
+            where.append("slug IN (SELECT slug FROM feature_files WHERE path = ?)")
+            params.append(file)
+        sql = "SELECT slug, title, complexity, completed_at FROM features"
+        files_sql = "SELECT slug, path FROM feature_files"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+            # Only the files of the matching features (primary key lookups)
+            files_sql += f" WHERE slug IN (SELECT slug FROM features WHERE {' AND '.join(where)})"
+
+        features = {}
+        for row in conn.execute(sql + " ORDER BY slug", params):
+            features[row[0]] = {'slug': row[0], 'title': row[1], 'complexity': row[2],
+                                'files_modified': [], 'completed_at': row[3]}
+        for slug, path in conn.execute(files_sql + " ORDER BY slug, position", params):
+            features[slug]['files_modified'].append(path)
+        return list(features.values())
+
+
+def open_storage(memory_dir: Path, backend: Optional[str] = None):
+    """
+    Storage for a .project-memory directory.
+
+    Args:
+        memory_dir: Path to .project-memory directory.
+        backend: "json" or "sqlite". Defaults to "sqlite" if memory.db
+            exists, else "json".
+
+    Raises:
+        ValueError: If backend is not one of STORAGE_BACKENDS.
+    """
+    if backend is None:
+        backend = "sqlite" if (Path(memory_dir) / SQLITE_DB_FILE).exists() else "json"
+    if backend == "json":
+        return JsonFileStorage(memory_dir)
+    if backend == "sqlite":
+        return SqliteStorage(memory_dir)
+    raise ValueError(f"Unknown storage backend: {backend} (expected one of {STORAGE_BACKENDS})")
+
+
 # =============================================================================
 # PROJECT MEMORY MANAGER
 # =============================================================================
@@ -382,27 +878,38 @@ class ProjectMemoryManager:
     """
     Manages project memory in target projects.
 
-    The memory is stored in .project-memory/ directory at the project root.
+    The memory is stored in .project-memory/ directory at the project root,
+    as JSON files or in a SQLite database (memory.db).
+
+    Loaded context, conventions, settings and velocity are kept in memory and
+    returned again while their file is unchanged. The same object is returned
+    to every caller: save it after modifying it.
     """
 
-    def __init__(self, project_root: Optional[Path] = None):
+    def __init__(self, project_root: Optional[Path] = None, backend: Optional[str] = None):
         """
         Initialize the manager.
 
         Args:
             project_root: Path to project root. Defaults to current directory.
+            backend: Storage backend, "json" or "sqlite". Defaults to "sqlite"
+                if .project-memory/memory.db exists, else "json".
         """
         self.project_root = Path(project_root) if project_root else Path.cwd()
         self.memory_dir = self.project_root / MEMORY_DIR_NAME
+        self.storage = open_storage(self.memory_dir, backend)
         self._templates_dir = Path(__file__).parent / "templates"
 
+        # relative_path -> (storage stamp, loaded dataclass)
+        self._loaded: Dict[str, Tuple[Any, Any]] = {}
+
     # -------------------------------------------------------------------------
     # Initialization
     # -------------------------------------------------------------------------
 
     def is_initialized(self) -> bool:
         """Check if project memory is initialized."""
-        return self.memory_dir.exists() and (self.memory_dir / "context.json").exists()
+        return self.memory_dir.exists() and self.storage.exists("context.json")
 
     def init_memory(self, detected_context: Optional[Dict] = None) -> bool:
         """
@@ -415,60 +922,58 @@ class ProjectMemoryManager:
             True if initialization successful.
         """
         try:
-            # Create main directory
-            self.memory_dir.mkdir(exist_ok=True)
-
-            # Create subdirectories
-            for subdir in SUBDIRS:
-                (self.memory_dir / subdir).mkdir(parents=True, exist_ok=True)
-
-            # Create core files from templates
-            now = datetime.utcnow().isoformat() + "Z"
-
-            # Context
-            context = self._load_template("context.json")
-            context['epci']['initialized_at'] = now
-            context['project']['root_path'] = str(self.project_root)
-
-            if detected_context:
-                # Merge detected values
-                if 'project' in detected_context:
-                    context['project'].update(detected_context['project'])
-                    context['project']['detected_at'] = now
-                if 'team' in detected_context:
-                    context['team'].update(detected_context['team'])
-
-            self._atomic_write(self.memory_dir / "context.json", context)
-
-            # Conventions
-            conventions = self._load_template("conventions.json")
-            if detected_context and 'conventions' in detected_context:
-                self._deep_merge(conventions, detected_context['conventions'])
-                conventions['detected_at'] = now
-            self._atomic_write(self.memory_dir / "conventions.json", conventions)
-
-            # Settings
-            settings = self._load_template("settings.json")
-            self._atomic_write(self.memory_dir / "settings.json", settings)
-
-            # Velocity (in metrics/)
-            velocity = self._load_template("velocity.json")
-            self._atomic_write(self.memory_dir / "metrics" / "velocity.json", velocity)
-
-            # Create empty pattern files
-            self._atomic_write(self.memory_dir / "patterns" / "detected.json", {"patterns": [], "detected_at": now})
-            self._atomic_write(self.memory_dir / "patterns" / "custom.json", {"patterns": []})
-
-            # Create empty learning files
-            self._atomic_write(self.memory_dir / "learning" / "corrections.json", {"corrections": []})
-            self._atomic_write(self.memory_dir / "learning" / "preferences.json", {"preferences": {}})
-
-            # Create quality metrics placeholder
-            self._atomic_write(self.memory_dir / "metrics" / "quality.json", {
-                "version": CURRENT_SCHEMA_VERSION,
-                "metrics": {},
-                "updated_at": None
-            })
+            # Create main directory and subdirectories (or database)
+            self.storage.initialize()
+            self._loaded.clear()
+
+            # Create core files from templates (one transaction with SQLite)
+            with self.storage.transaction():
+                now = datetime.utcnow().isoformat() + "Z"
+
+                # Context
+                context = self._load_template("context.json")
+                context['epci']['initialized_at'] = now
+                context['project']['root_path'] = str(self.project_root)
+
+                if detected_context:
+                    # Merge detected values
+                    if 'project' in detected_context:
+                        context['project'].update(detected_context['project'])
+                        context['project']['detected_at'] = now
+                    if 'team' in detected_context:
+                        context['team'].update(detected_context['team'])
+
+                self.storage.write("context.json", context)
+
+                # Conventions
+                conventions = self._load_template("conventions.json")
+                if detected_context and 'conventions' in detected_context:
+                    self._deep_merge(conventions, detected_context['conventions'])
+                    conventions['detected_at'] = now
+                self.storage.write("conventions.json", conventions)
+
+                # Settings
+                settings = self._load_template("settings.json")
+                self.storage.write("settings.json", settings)
+
+                # Velocity (in metrics/)
+                velocity = self._load_template("velocity.json")
+                self.storage.write("metrics/velocity.json", velocity)
+
+                # Create empty pattern files
+                self.storage.write("patterns/detected.json", {"patterns": [], "detected_at": now})
+                self.storage.write("patterns/custom.json", {"patterns": []})
+
+                # Create empty learning files
+                self.storage.write("learning/corrections.json", {"corrections": []})
+                self.storage.write("learning/preferences.json", {"preferences": {}})
+
+                # Create quality metrics placeholder
+                self.storage.write("metrics/quality.json", {
+                    "version": CURRENT_SCHEMA_VERSION,
+                    "metrics": {},
+                    "updated_at": None
+                })
 
             return True
 
@@ -498,43 +1003,55 @@ class ProjectMemoryManager:
 
     def load_feature_history(self, slug: str) -> Optional[FeatureHistory]:
         """Load a specific feature's history."""
-        file_path = self.memory_dir / "history" / "features" / f"{slug}.json"
-        if not file_path.exists():
-            return None
         try:
-            data = self._read_json(file_path)
-            return FeatureHistory.from_dict(data)
+            data = self.storage.read_feature(slug)
+            return FeatureHistory.from_dict(data) if data is not None else None
         except Exception:
             return None
 
     def list_features(self) -> List[str]:
         """List all feature slugs in history."""
-        features_dir = self.memory_dir / "history" / "features"
-        if not features_dir.exists():
-            return []
-        return [f.stem for f in features_dir.glob("*.json")]
+        return self.storage.list_features()
 
     def get_all_feature_metadata(self) -> List[Dict[str, Any]]:
         """
         Get metadata for all features (for similarity matching).
 
+        Read from history/index.json (JSON backend) or the features table
+        (SQLite backend), without loading each feature's history.
+
         Returns:
             List of dicts with slug, title, complexity, files_modified.
             Empty list if Project Memory unavailable (graceful degradation).
         """
         try:
-            features = []
-            for slug in self.list_features():
-                feature = self.load_feature_history(slug)
-                if feature:
-                    features.append({
-                        'slug': feature.slug,
-                        'title': feature.title,
-                        'complexity': feature.complexity,
-                        'files_modified': feature.files_modified,
-                        'completed_at': feature.completed_at,
-                    })
-            return features
+            return self.storage.feature_metadata()
+        except Exception:
+            # Graceful degradation
+            return []
+
+    def query_features(
+        self,
+        complexity: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        file: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get metadata of the features matching all given filters.
+
+        Args:
+            complexity: Complexity category (TINY, SMALL, STANDARD, LARGE).
+            since: Completed at or after this ISO timestamp.
+            until: Completed before this ISO timestamp.
+            file: Path listed in the feature's files_modified.
+
+        Returns:
+            List of dicts with slug, title, complexity, files_modified.
+            Empty list if Project Memory unavailable (graceful degradation).
+        """
+        try:
+            return self.storage.query_features(complexity, since, until, file)
         except Exception:
             # Graceful degradation
             return []
@@ -592,11 +1109,10 @@ class ProjectMemoryManager:
             Empty list if unavailable (graceful degradation).
         """
         try:
-            patterns_file = self.memory_dir / "patterns" / "detected.json"
-            if not patterns_file.exists():
+            data = self.storage.read("patterns/detected.json")
+            if data is None:
                 return []
 
-            data = self._read_json(patterns_file)
             all_patterns = data.get('patterns', [])
 
             # Domain-pattern mapping
@@ -618,23 +1134,33 @@ class ProjectMemoryManager:
             return []
 
     def _load_file(self, relative_path: str, dataclass_type):
-        """Generic file loader with graceful degradation."""
-        file_path = self.memory_dir / relative_path
+        """
+        Generic file loader with graceful degradation.
 
-        if not file_path.exists():
-            # Return default instance
-            print(f"Warning: {relative_path} not found, using defaults")
-            return dataclass_type()
+        The loaded instance is cached until the file's (mtime, size) changes
+        or it is saved through this manager; defaults are not cached.
+        """
+        stamp = self.storage.stamp(relative_path)
+        cached = self._loaded.get(relative_path)
+        if stamp is not None and cached and cached[0] == stamp and isinstance(cached[1], dataclass_type):
+            return cached[1]
 
         try:
-            data = self._read_json(file_path)
+            data = self.storage.read(relative_path)
+            if data is None:
+                # Return default instance
+                print(f"Warning: {relative_path} not found, using defaults")
+                return dataclass_type()
 
             # Check version and migrate if needed
             file_version = data.get('version', '1.0.0')
             if file_version != CURRENT_SCHEMA_VERSION:
                 data = self._migrate(data, file_version, CURRENT_SCHEMA_VERSION)
 
-            return dataclass_type.from_dict(data)
+            loaded = dataclass_type.from_dict(data)
+            if stamp is not None:
+                self._loaded[relative_path] = (stamp, loaded)
+            return loaded
 
         except json.JSONDecodeError as e:
             print(f"Warning: {relative_path} is corrupted ({e}), using defaults")
@@ -665,17 +1191,38 @@ class ProjectMemoryManager:
         return self._save_file("metrics/velocity.json", velocity.to_dict())
 
     def save_feature_history(self, feature: Union[FeatureHistory, dict]) -> bool:
-        """Save a feature's history."""
+        """Save a feature's history (and its feature index entry)."""
         if isinstance(feature, dict):
             feature = FeatureHistory.from_dict(feature)
 
-        file_path = self.memory_dir / "history" / "features" / f"{feature.slug}.json"
-        return self._atomic_write(file_path, feature.to_dict())
+        return self.storage.write_feature(feature.to_dict())
 
     def _save_file(self, relative_path: str, data: dict) -> bool:
-        """Generic file saver with atomic write."""
-        file_path = self.memory_dir / relative_path
-        return self._atomic_write(file_path, data)
+        """Generic document saver (atomic file write or database row)."""
+        self._loaded.pop(relative_path, None)
+        return self.storage.write(relative_path, data)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group saves into a single commit.
+
+        With the SQLite backend the writes of the block are one transaction;
+        with JSON files each file is still written atomically on its own.
+        If the block fails, the load cache is cleared: a rollback changes
+        no stamp, so objects loaded inside the block would stay cached.
+
+        Example:
+            with manager.transaction():
+                manager.save_feature_history(feature)
+                manager.update_velocity_from_feature(feature)
+        """
+        try:
+            with self.storage.transaction():
+                yield
+        except BaseException:
+            self._loaded.clear()
+            raise
 
     # -------------------------------------------------------------------------
     # Export / Reset
@@ -689,13 +1236,53 @@ class ProjectMemoryManager:
             'settings': self.load_settings().to_dict(),
             'velocity': self.load_velocity().to_dict(),
             'features': {
-                slug: self.load_feature_history(slug).to_dict()
-                for slug in self.list_features()
-                if self.load_feature_history(slug)
+                feature.slug: feature.to_dict()
+                for feature in map(self.load_feature_history, self.list_features())
+                if feature
             },
             'exported_at': datetime.utcnow().isoformat() + "Z",
         }
 
+    def convert_storage(self, backend: str) -> bool:
+        """
+        Copy all memory data to another storage backend and switch to it.
+
+        The previous data is kept: JSON files stay in place, and memory.db
+        is renamed to a backup when converting back to JSON (so that the
+        backend detection picks the JSON files).
+
+        Args:
+            backend: Target backend, "json" or "sqlite".
+
+        Returns:
+            True if conversion successful.
+        """
+        target = open_storage(self.memory_dir, backend)
+        if target.name == self.storage.name:
+            return True
+
+        try:
+            target.initialize()
+            with target.transaction():
+                for key in self.storage.keys():
+                    target.write(key, self.storage.read(key))
+                for slug in self.storage.list_features():
+                    target.write_feature(self.storage.read_feature(slug))
+        except Exception as e:
+            print(f"Error converting project memory to {backend}: {e}")
+            target.close()
+            return False
+
+        self.storage.close()
+        if backend == "json":
+            db_path = self.memory_dir / SQLITE_DB_FILE
+            db_path.rename(db_path.with_name(
+                f"{SQLITE_DB_FILE}.backup-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            ))
+        self.storage = target
+        self._loaded.clear()
+        return True
+
     def reset(self, backup: bool = True) -> bool:
         """
         Reset project memory.
@@ -710,6 +1297,8 @@ class ProjectMemoryManager:
             return True
 
         try:
+            self.storage.close()
+            self._loaded.clear()
             if backup:
                 backup_path = self.memory_dir.parent / f".project-memory-backup-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
                 shutil.copytree(self.memory_dir, backup_path)
@@ -767,7 +1356,7 @@ class ProjectMemoryManager:
         """
         try:
             from .calibration import CalibrationManager
-            return CalibrationManager(self.memory_dir)
+            return CalibrationManager(self.memory_dir, storage=self.storage)
         except ImportError:
             return None
 
@@ -780,7 +1369,7 @@ class ProjectMemoryManager:
         """
         try:
             from .learning_analyzer import LearningAnalyzer
-            return LearningAnalyzer(self.memory_dir)
+            return LearningAnalyzer(self.memory_dir, storage=self.storage)
         except ImportError:
             return None
 
@@ -990,33 +1579,6 @@ class ProjectMemoryManager:
         with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
-    def _atomic_write(self, path: Path, data: dict) -> bool:
-        """
-        Write JSON file atomically to prevent corruption.
-
-        Writes to a temp file first, then moves to target.
-        """
-        try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write to temp file
-            fd, temp_path = tempfile.mkstemp(suffix='.json', dir=path.parent)
-            try:
-                with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-
-                # Atomic move
-                shutil.move(temp_path, path)
-                return True
-            except Exception:
-                # Clean up temp file on error
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-                raise
-        except Exception as e:
-            print(f"Error writing {path}: {e}")
-            return False
-
     def _deep_merge(self, base: dict, override: dict) -> dict:
         """Deep merge two dictionaries."""
         for key, value in override.items():
@@ -1048,16 +1610,20 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='EPCI Project Memory Manager')
-    parser.add_argument('command', choices=['init', 'status', 'export', 'reset'],
+    parser.add_argument('command', choices=['init', 'status', 'export', 'reset', 'convert'],
                         help='Command to execute')
     parser.add_argument('--project', '-p', type=str, default='.',
                         help='Project root directory')
     parser.add_argument('--force', '-f', action='store_true',
                         help='Force operation without confirmation')
+    parser.add_argument('--backend', '-b', choices=STORAGE_BACKENDS, default=None,
+                        help='Storage backend (default: sqlite if memory.db exists, else json); '
+                             'target backend for convert')
 
     args = parser.parse_args()
 
-    manager = ProjectMemoryManager(Path(args.project))
+    manager = ProjectMemoryManager(Path(args.project),
+                                   backend=None if args.command == 'convert' else args.backend)
 
     if args.command == 'init':
         if manager.is_initialized() and not args.force:
@@ -1082,6 +1648,7 @@ def main():
         print(f"Features completed: {velocity.total_features}")
         print(f"Features in history: {len(features)}")
         print(f"Initialized: {context.epci.initialized_at}")
+        print(f"Storage: {manager.storage.name}")
         return 0
 
     elif args.command == 'export':
@@ -1109,6 +1676,20 @@ def main():
             return 0
         return 1
 
+    elif args.command == 'convert':
+        if not manager.is_initialized():
+            print("Project memory not initialized.")
+            return 1
+        if not args.backend:
+            print("Target backend required: --backend json|sqlite")
+            return 1
+
+        source = manager.storage.name
+        if manager.convert_storage(args.backend):
+            print(f"Project memory converted from {source} to {args.backend}.")
+            return 0
+        return 1
+
 
 if __name__ == "__main__":
     import sys
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for EPCI Project Memory Manager
+
+Run with: pytest test_manager.py -v
+"""
+
+import json
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ..manager import (
+    FEATURE_INDEX_FILE,
+    SQLITE_DB_FILE,
+    FeatureHistory,
+    ProjectMemoryManager,
+)
+
+
+@pytest.fixture
+def manager():
+    """Manager on an initialized temporary project."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = ProjectMemoryManager(Path(tmpdir))
+        manager.init_memory()
+        yield manager
+
+
+@pytest.fixture
+def sqlite_manager():
+    """Manager on an initialized temporary project using the SQLite backend."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = ProjectMemoryManager(Path(tmpdir), backend="sqlite")
+        manager.init_memory()
+        yield manager
+        manager.storage.close()
+
+
+def make_feature(
+    slug: str,
+    complexity: str = "STANDARD",
+    completed_at: str = "2025-01-02T10:00:00Z"
+) -> FeatureHistory:
+    return FeatureHistory(
+        slug=slug,
+        title=slug.replace("-", " ").title(),
+        created_at="2025-01-01T10:00:00Z",
+        complexity=complexity,
+        completed_at=completed_at,
+        files_modified=[f"src/{slug}.py", "src/shared.py"],
+    )
+
+
+def save_sample_features(manager) -> None:
+    with manager.transaction():
+        manager.save_feature_history(make_feature("user-auth", "STANDARD", "2025-01-05T10:00:00Z"))
+        manager.save_feature_history(make_feature("user-profile", "SMALL", "2025-01-10T10:00:00Z"))
+        manager.save_feature_history(make_feature("api-limits", "SMALL", "2025-02-01T10:00:00Z"))
+
+
+def stable_export(manager) -> dict:
+    """export_all() without the fields that depend on the run."""
+    data = manager.export_all()
+    del data['exported_at']
+    del data['context']['epci']['initialized_at']
+    del data['context']['project']['root_path']
+    return data
+
+
+class TestFeatureIndex:
+    """Tests for the history/index.json feature metadata index."""
+
+    def test_save_updates_index(self, manager):
+        """Test that saving a feature adds its index entry."""
+        manager.save_feature_history(make_feature("user-auth"))
+
+        index = json.loads((manager.memory_dir / FEATURE_INDEX_FILE).read_text())
+        st = (manager.memory_dir / "history" / "features" / "user-auth.json").stat()
+        assert index["features"]["user-auth"] == {
+            "slug": "user-auth",
+            "title": "User Auth",
+            "complexity": "STANDARD",
+            "files_modified": ["src/user-auth.py", "src/shared.py"],
+            "completed_at": "2025-01-02T10:00:00Z",
+            "stamp": [st.st_mtime_ns, st.st_size],
+        }
+        assert "stamp" not in manager.get_all_feature_metadata()[0]
+
+    def test_metadata_read_from_index(self, manager, monkeypatch):
+        """Test that metadata queries do not read feature files."""
+        manager.save_feature_history(make_feature("user-auth"))
+        manager.save_feature_history(make_feature("user-profile", "SMALL"))
+
+        monkeypatch.setattr(manager.storage, "read_feature", lambda slug: pytest.fail(slug))
+        metadata = manager.get_all_feature_metadata()
+
+        assert sorted(m["slug"] for m in metadata) == ["user-auth", "user-profile"]
+
+    def test_unindexed_feature_added(self, manager):
+        """Test that a feature file written without the index is picked up."""
+        manager.save_feature_history(make_feature("user-auth"))
+        legacy = make_feature("legacy-export")
+        (manager.memory_dir / "history" / "features" / "legacy-export.json").write_text(
+            json.dumps(legacy.to_dict())
+        )
+
+        slugs = {m["slug"] for m in manager.get_all_feature_metadata()}
+
+        assert slugs == {"user-auth", "legacy-export"}
+        index = json.loads((manager.memory_dir / FEATURE_INDEX_FILE).read_text())
+        assert "legacy-export" in index["features"]
+
+    def test_edited_feature_reread(self, manager, monkeypatch):
+        """Test that a feature file edited in place is read again, and only that one."""
+        manager.save_feature_history(make_feature("user-auth"))
+        manager.save_feature_history(make_feature("user-profile"))
+        path = manager.memory_dir / "history" / "features" / "user-auth.json"
+        data = json.loads(path.read_text())
+        data["complexity"] = "LARGE"
+        with open(path, "r+", encoding="utf-8") as f:
+            f.write(json.dumps(data))
+            f.truncate()
+
+        read = []
+        read_feature = manager.storage.read_feature
+        monkeypatch.setattr(manager.storage, "read_feature", lambda slug: read.append(slug) or read_feature(slug))
+        metadata = {m["slug"]: m for m in manager.get_all_feature_metadata()}
+
+        assert read == ["user-auth"]
+        assert metadata["user-auth"]["complexity"] == "LARGE"
+        assert metadata["user-profile"]["complexity"] == "STANDARD"
+
+        manager.get_all_feature_metadata()
+        assert read == ["user-auth"]
+
+    def test_index_without_stamps_rebuilt(self, manager):
+        """Test that entries from an index written before stamps are read again once."""
+        manager.save_feature_history(make_feature("user-auth"))
+        index_path = manager.memory_dir / FEATURE_INDEX_FILE
+        index = json.loads(index_path.read_text())
+        del index["features"]["user-auth"]["stamp"]
+        index["features"]["user-auth"]["title"] = "Stale"
+        index_path.write_text(json.dumps(index))
+
+        metadata = manager.get_all_feature_metadata()
+
+        assert metadata[0]["title"] == "User Auth"
+        assert "stamp" in json.loads(index_path.read_text())["features"]["user-auth"]
+
+    def test_removed_feature_dropped(self, manager):
+        """Test that an entry whose feature file was deleted is dropped."""
+        manager.save_feature_history(make_feature("user-auth"))
+        manager.save_feature_history(make_feature("user-profile"))
+        (manager.memory_dir / "history" / "features" / "user-auth.json").unlink()
+
+        slugs = [m["slug"] for m in manager.get_all_feature_metadata()]
+
+        assert slugs == ["user-profile"]
+
+    def test_missing_index_rebuilt(self, manager):
+        """Test that a missing or corrupted index is rebuilt from the feature files."""
+        manager.save_feature_history(make_feature("user-auth"))
+        (manager.memory_dir / FEATURE_INDEX_FILE).write_text("{not json")
+
+        slugs = [m["slug"] for m in manager.get_all_feature_metadata()]
+
+        assert slugs == ["user-auth"]
+
+
+class TestSqliteStorage:
+    """Tests for the SQLite storage backend."""
+
+    def test_initialized_in_database(self, sqlite_manager):
+        """Test that init creates memory.db and no JSON files."""
+        assert sqlite_manager.is_initialized()
+        assert (sqlite_manager.memory_dir / SQLITE_DB_FILE).exists()
+        assert not (sqlite_manager.memory_dir / "context.json").exists()
+
+    def test_backend_detected(self, sqlite_manager):
+        """Test that a new manager picks the SQLite backend when memory.db exists."""
+        reopened = ProjectMemoryManager(sqlite_manager.project_root)
+        assert reopened.storage.name == "sqlite"
+        assert reopened.load_context().to_dict() == sqlite_manager.load_context().to_dict()
+        reopened.storage.close()
+
+    def test_feature_round_trip(self, sqlite_manager):
+        """Test that a feature is loaded back unchanged."""
+        feature = make_feature("user-auth")
+        sqlite_manager.save_feature_history(feature)
+
+        assert sqlite_manager.list_features() == ["user-auth"]
+        assert sqlite_manager.load_feature_history("user-auth") == feature
+
+    def test_export_matches_json(self, manager, sqlite_manager):
+        """Test that both backends export the same data."""
+        save_sample_features(manager)
+        save_sample_features(sqlite_manager)
+
+        assert stable_export(sqlite_manager) == stable_export(manager)
+
+    @pytest.mark.parametrize("filters,expected", [
+        ({"complexity": "SMALL"}, ["api-limits", "user-profile"]),
+        ({"since": "2025-01-10"}, ["api-limits", "user-profile"]),
+        ({"until": "2025-01-10"}, ["user-auth"]),
+        ({"file": "src/user-auth.py"}, ["user-auth"]),
+        ({"file": "src/shared.py", "complexity": "STANDARD"}, ["user-auth"]),
+    ])
+    def test_query_features(self, manager, sqlite_manager, filters, expected):
+        """Test that feature queries give the same results on both backends."""
+        for m in (manager, sqlite_manager):
+            save_sample_features(m)
+            assert sorted(f["slug"] for f in m.query_features(**filters)) == expected
+
+    def test_query_reads_only_matching_files(self, sqlite_manager):
+        """Test that a filtered query returns full file lists, reading only those of the matches."""
+        save_sample_features(sqlite_manager)
+        statements = []
+        sqlite_manager.storage._db().set_trace_callback(statements.append)
+
+        features = sqlite_manager.query_features(file="src/user-auth.py")
+
+        assert features == [{
+            "slug": "user-auth",
+            "title": "User Auth",
+            "complexity": "STANDARD",
+            "files_modified": ["src/user-auth.py", "src/shared.py"],
+            "completed_at": "2025-01-05T10:00:00Z",
+        }]
+        files_query = next(sql for sql in statements if "FROM feature_files" in sql.split("WHERE")[0])
+        plan = " ".join(row[-1] for row in sqlite_manager.storage._db().execute("EXPLAIN QUERY PLAN " + files_query))
+        assert "SCAN feature_files" not in plan
+
+    def test_failed_feature_write_rolls_back_transaction(self, sqlite_manager):
+        """Test that a database error in write_feature() aborts the outer transaction."""
+        bad = make_feature("user-auth").to_dict()
+        bad["files_modified"] = [{"path": "src/user-auth.py"}]  # Cannot be bound
+
+        assert not sqlite_manager.save_feature_history(bad)
+        assert sqlite_manager.list_features() == []
+
+        with pytest.raises(sqlite3.Error):
+            with sqlite_manager.transaction():
+                sqlite_manager.save_feature_history(make_feature("user-profile"))
+                sqlite_manager.save_feature_history(bad)
+
+        assert sqlite_manager.list_features() == []
+
+    def test_failed_document_write_rolls_back_transaction(self, sqlite_manager):
+        """Test that a database error in write() aborts the outer transaction."""
+        sqlite_manager.storage._db().execute(
+            "CREATE TRIGGER velocity_fails BEFORE INSERT ON documents "
+            "WHEN NEW.key = 'metrics/velocity.json' BEGIN SELECT RAISE(ABORT, 'disk full'); END"
+        )
+        velocity = sqlite_manager.load_velocity()
+        velocity.total_features += 1
+
+        assert not sqlite_manager.save_velocity(velocity)
+
+        with pytest.raises(sqlite3.Error):
+            with sqlite_manager.transaction():
+                sqlite_manager.save_feature_history(make_feature("user-auth"))
+                sqlite_manager.save_velocity(velocity)
+
+        assert sqlite_manager.list_features() == []
+        assert sqlite_manager.load_velocity().total_features == 0
+
+    def test_transaction_rolled_back(self, sqlite_manager):
+        """Test that writes of a failed transaction are discarded."""
+        with pytest.raises(RuntimeError):
+            with sqlite_manager.transaction():
+                sqlite_manager.save_feature_history(make_feature("user-auth"))
+                raise RuntimeError("phase 3 failed")
+
+        assert sqlite_manager.list_features() == []
+
+    def test_convert_from_json(self, manager):
+        """Test that converting keeps all data and switches the backend."""
+        save_sample_features(manager)
+        before = stable_export(manager)
+
+        assert manager.convert_storage("sqlite")
+        reopened = ProjectMemoryManager(manager.project_root)
+
+        assert reopened.storage.name == "sqlite"
+        assert stable_export(reopened) == before
+        reopened.storage.close()
+        manager.storage.close()
+
+
+class TestLoadCache:
+    """Tests for the in-process cache of loaded memory files."""
+
+    def test_unchanged_file_not_read(self, manager, monkeypatch):
+        """Test that a second load returns the cached instance without reading."""
+        settings = manager.load_settings()
+
+        monkeypatch.setattr(manager.storage, "read", lambda key: pytest.fail(key))
+
+        assert manager.load_settings() is settings
+
+    def test_external_change_reloaded(self, manager):
+        """Test that a file changed by another process is read again."""
+        manager.load_context()
+        context_file = manager.memory_dir / "context.json"
+        data = json.loads(context_file.read_text())
+        data['project']['name'] = "renamed-by-hook"
+        context_file.write_text(json.dumps(data))
+
+        assert manager.load_context().project.name == "renamed-by-hook"
+
+    def test_save_invalidates(self, manager):
+        """Test that a saved object is loaded back with its changes."""
+        velocity = manager.load_velocity()
+        velocity.total_features = 7
+        manager.save_velocity(velocity)
+
+        reloaded = manager.load_velocity()
+        assert reloaded is not velocity
+        assert reloaded.total_features == 7
+
+    def test_sqlite_write_invalidates(self, sqlite_manager):
+        """Test that another connection's commit invalidates the SQLite cache."""
+        conventions = sqlite_manager.load_conventions()
+        other = ProjectMemoryManager(sqlite_manager.project_root)
+        changed = other.load_conventions()
+        changed.naming.services = "{Name}Handler"
+        other.save_conventions(changed)
+        other.storage.close()
+
+        reloaded = sqlite_manager.load_conventions()
+        assert reloaded is not conventions
+        assert reloaded.naming.services == "{Name}Handler"
+
+    def test_sqlite_rollback_invalidates(self, sqlite_manager):
+        """Test that objects loaded inside a rolled-back transaction are not served afterwards."""
+        name = sqlite_manager.load_context().project.name
+
+        with pytest.raises(RuntimeError):
+            with sqlite_manager.transaction():
+                context = sqlite_manager.load_context()
+                context.project.name = "uncommitted"
+                sqlite_manager.save_context(context)
+                assert sqlite_manager.load_context().project.name == "uncommitted"
+                raise RuntimeError("phase 3 failed")
+
+        assert sqlite_manager.load_context().project.name == name
+
+    def test_missing_file_not_cached(self, manager):
+        """Test that defaults for a missing file are not kept once it exists."""
+        (manager.memory_dir / "settings.json").unlink()
+        assert manager.load_settings().flags['auto_uc_threshold'] == 0.75
+
+        settings = manager.load_settings()
+        settings.flags['auto_uc_threshold'] = 0.5
+        manager.save_settings(settings)
+
+        assert manager.load_settings().flags['auto_uc_threshold'] == 0.5
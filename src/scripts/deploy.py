@@ -6,20 +6,49 @@ Copies src/ to build/epci/, validates structure, and checks version consistency.
 
 Usage:
     python deploy.py [--dry-run] [--force] [--verbose]
+    python deploy.py --incremental    # Sync only changed files (manifest-based)
+    python deploy.py --rollback       # Swap the previous build back in
+    python deploy.py --watch          # Redeploy changed files on save
+    python deploy.py --copy-strategy hardlink   # Link unchanged files to the previous build
+    python deploy.py --verify         # Check build/epci against its manifest
+    python deploy.py --profile        # Print per-stage timings and slowest files
+    python deploy.py --timings-json timings.json   # Same data as JSON (for CI)
+
+Exclusions come from EXCLUDE_PATTERNS plus an optional src/.deployignore,
+both using gitignore syntax (globs, `**`, trailing `/` for directories,
+leading `/` to anchor, `!` to re-include).
+
+Every deployed build carries a .manifest.json listing the relative path,
+size, mtime and SHA-256 of each file. --verify re-hashes the build in
+parallel and compares it to that manifest without reading src/.
+
+Builds are assembled in a sibling staging directory, validated there, then
+swapped into place with a rename. The last --keep-releases builds are kept
+next to the destination for instant rollback.
 
 Exit Codes:
     0: Success
     1: Validation failed
     2: Copy failed
     3: Version mismatch
+    4: Manifest verification failed
 """
 
 import argparse
+import errno
+import hashlib
 import json
+import os
 import re
 import shutil
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 # ANSI color codes for console output
 class Colors:
@@ -31,7 +60,7 @@ class Colors:
     BOLD = "\033[1m"
 
 
-# Patterns to exclude from copy
+# Patterns to exclude from copy (gitignore syntax, see IgnoreMatcher)
 EXCLUDE_PATTERNS = [
     "__pycache__",
     "*.pyc",
@@ -40,6 +69,38 @@ EXCLUDE_PATTERNS = [
     "*.egg-info",
 ]
 
+# Number of slowest validated files kept in a timing report
+DEFAULT_SLOWEST_FILES = 10
+
+# Extra exclusion rules read from the root of the source tree
+DEPLOYIGNORE_NAME = ".deployignore"
+
+# Manifest written at the root of the destination, used by incremental sync
+MANIFEST_NAME = ".manifest.json"
+MANIFEST_VERSION = 1
+
+# Thread pool size for hashing files (manifest build and --verify)
+DEFAULT_HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+# Number of previous builds kept next to the destination for rollback
+DEFAULT_KEEP_RELEASES = 3
+
+# How files are materialized in the destination. "hardlink" and "reflink"
+# fall back to a regular copy per file when the filesystem refuses them.
+# deploy() applies "hardlink" between builds, never to src/ (see
+# source_copy_strategy()).
+COPY_STRATEGIES = ("copy", "hardlink", "reflink")
+
+# ioctl request for a copy-on-write clone (linux/fs.h FICLONE)
+FICLONE = 0x40049409
+
+# Quiet period (seconds) that ends a burst of edits in --watch mode
+DEFAULT_DEBOUNCE = 0.3
+
+# renameat2() arguments for an atomic directory swap (linux/fcntl.h, linux/fs.h)
+AT_FDCWD = -100
+RENAME_EXCHANGE = 2
+
 
 def log(msg: str, color: str = "", verbose: bool = True) -> None:
     """Print colored log message."""
@@ -47,26 +108,540 @@ def log(msg: str, color: str = "", verbose: bool = True) -> None:
         print(f"{color}{msg}{Colors.RESET}")
 
 
-def make_ignore_patterns():
-    """Create ignore function for shutil.copytree."""
-    def ignore_patterns(directory: str, files: list[str]) -> set[str]:
-        ignored = set()
-        for pattern in EXCLUDE_PATTERNS:
-            if "*" in pattern:
-                # Wildcard pattern (e.g., *.pyc)
-                suffix = pattern.replace("*", "")
-                for f in files:
-                    if f.endswith(suffix):
-                        ignored.add(f)
+def _glob_to_regex(glob: str) -> str:
+    """Translate a gitignore glob body (no anchoring, no trailing /) to a regex."""
+    out = []
+    i = 0
+    while i < len(glob):
+        if glob.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif glob.startswith("/**", i) and i + 3 == len(glob):
+            out.append("/.+")
+            i += 3
+        elif glob.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif glob[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif glob[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif glob[i] == "[" and "]" in glob[i + 1:]:
+            end = glob.index("]", i + 1)
+            body = glob[i + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(glob[i]))
+            i += 1
+    return "".join(out)
+
+
+class IgnoreMatcher:
+    """
+    Exclusion rules compiled once into a single regex.
+
+    Supports the gitignore subset used by deploys: `*`, `?`, `[...]`, `**`,
+    a trailing `/` for directory-only rules, a leading (or inner) `/` to
+    anchor a rule at the source root, and `!` to re-include. As in
+    gitignore, the last matching rule wins and nothing inside an excluded
+    directory can be re-included.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = []
+        alternatives = []
+        self._negated = {}
+        self.has_dir_rules = False
+
+        for raw in patterns:
+            pattern = raw.rstrip("\n").rstrip()
+            if not pattern or pattern.startswith("#"):
+                continue
+            self.patterns.append(pattern)
+            negated = pattern.startswith("!")
+            if negated:
+                pattern = pattern[1:]
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            anchored = "/" in pattern
+            body = _glob_to_regex(pattern.lstrip("/"))
+            prefix = "" if anchored else "(?:.*/)?"
+            suffix = "/" if dir_only else "/?"
+            self.has_dir_rules = self.has_dir_rules or dir_only
+
+            group = f"r{len(alternatives)}"
+            self._negated[group] = negated
+            alternatives.append(f"(?P<{group}>{prefix}{body}{suffix})")
+
+        # Reverse order: the regex engine returns the first alternative that
+        # matches, which is then the last matching rule
+        self._regex = re.compile("|".join(reversed(alternatives))) if alternatives else None
+
+    @classmethod
+    def for_source(cls, src: Optional[Path] = None) -> "IgnoreMatcher":
+        """Compile EXCLUDE_PATTERNS plus src/.deployignore (if present)."""
+        patterns = list(EXCLUDE_PATTERNS) + [f"/{DEPLOYIGNORE_NAME}"]
+        if src is not None:
+            try:
+                patterns.extend((src / DEPLOYIGNORE_NAME).read_text(encoding="utf-8").splitlines())
+            except OSError:
+                pass
+        return cls(patterns)
+
+    def matches(self, rel: str, is_dir: bool = False) -> bool:
+        """Return True if the rules exclude rel (relative POSIX path) itself."""
+        if self._regex is None:
+            return False
+        m = self._regex.fullmatch(rel + "/" if is_dir else rel)
+        return bool(m) and not self._negated[m.lastgroup]
+
+    def excludes_path(self, rel: str) -> bool:
+        """Return True if rel or any of its parent directories is excluded."""
+        parts = rel.split("/")
+        for i in range(1, len(parts)):
+            if self.matches("/".join(parts[:i]), is_dir=True):
+                return True
+        return self.matches(rel) or self.matches(rel, is_dir=True)
+
+    def filter_walk(self, rel_dir: str, dirnames: list[str], filenames: list[str]) -> tuple[list[str], list[str]]:
+        """Return the (dirnames, filenames) of one os.walk step that are kept."""
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        kept_dirs = [d for d in dirnames if not self.matches(prefix + d, is_dir=True)]
+        kept_files = [f for f in filenames if not self.matches(prefix + f)]
+        return kept_dirs, kept_files
+
+    def ignore_function(self, root: Optional[Path] = None):
+        """
+        Create an ignore function for shutil.copytree rooted at root.
+
+        Directory-only rules need the entry type; it is looked up only for
+        names whose file and directory forms match differently.
+        """
+        root_str = os.path.abspath(root) if root is not None else None
+
+        def ignore_patterns(directory: str, files: list[str]) -> set[str]:
+            if root_str is None:
+                rel_dir = ""
+            else:
+                rel_dir = os.path.relpath(os.path.abspath(directory), root_str)
+                rel_dir = "" if rel_dir == "." else rel_dir.replace(os.sep, "/")
+            prefix = f"{rel_dir}/" if rel_dir else ""
+            ignored = set()
+            for name in files:
+                as_file = self.matches(prefix + name)
+                if self.has_dir_rules:
+                    as_dir = self.matches(prefix + name, is_dir=True)
+                    if as_dir != as_file and os.path.isdir(os.path.join(directory, name)):
+                        as_file = as_dir
+                if as_file:
+                    ignored.add(name)
+            return ignored
+
+        return ignore_patterns
+
+
+def make_ignore_patterns(src: Optional[Path] = None):
+    """Create ignore function for shutil.copytree (EXCLUDE_PATTERNS + src/.deployignore)."""
+    return IgnoreMatcher.for_source(src).ignore_function(src)
+
+
+def _reflink(src: str, dst: str) -> None:
+    """Clone src into dst with copy-on-write (Linux FICLONE). Raises OSError if unsupported."""
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflink is only supported on Linux")
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    shutil.copystat(src, dst)
+
+
+def make_copy_function(strategy: str = "copy"):
+    """
+    Create a copy function (shutil.copytree signature) for a copy strategy.
+
+    "hardlink" links dst to src, "reflink" clones it copy-on-write. Either
+    falls back to shutil.copy2 for any file where the filesystem refuses
+    (cross-device, unsupported, permission). dst must not already exist.
+
+    Note: hardlinked files share their inode with src, so editing a source
+    file in place (rather than save-by-rename) also changes the deployed copy.
+    deploy() therefore only links a build to the previous one, never to src/
+    (see source_copy_strategy()).
+    """
+    if strategy not in COPY_STRATEGIES:
+        raise ValueError(f"Unknown copy strategy '{strategy}' (expected one of {', '.join(COPY_STRATEGIES)})")
+    if strategy == "copy":
+        return shutil.copy2
+
+    def copy_file(src: str, dst: str) -> str:
+        try:
+            if strategy == "hardlink":
+                os.link(src, dst)
+            else:
+                _reflink(src, dst)
+            return dst
+        except OSError:
+            return shutil.copy2(src, dst)
+
+    return copy_file
+
+
+def source_copy_strategy(strategy: str) -> str:
+    """
+    Strategy for the files a deploy writes from src/.
+
+    A "hardlink" deploy seeds its staging tree with links to the live build,
+    so unchanged files share their inode with it (and with the kept releases
+    it becomes), while changed files are copied from src/. Linking to src/
+    itself would let an in-place edit of a source file silently change every
+    kept release, and rollback would restore the edited file.
+    """
+    return "copy" if strategy == "hardlink" else strategy
+
+
+@dataclass
+class SyncStats:
+    """Outcome of an incremental sync."""
+    copied: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+
+@dataclass
+class StageTiming:
+    """Wall time and number of files handled by one deploy stage."""
+    name: str
+    seconds: float = 0.0
+    files: int = 0
+
+
+@dataclass
+class DeployTimings:
+    """Per-stage timings of a deploy, plus the slowest files validated."""
+    stages: list[StageTiming] = field(default_factory=list)
+    slowest_files: list[tuple[str, float]] = field(default_factory=list)
+    total_seconds: float = 0.0
+    top: int = DEFAULT_SLOWEST_FILES
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as a stage; the caller may set .files."""
+        timing = StageTiming(name)
+        self.stages.append(timing)
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.seconds = time.perf_counter() - start
+
+    def record_files(self, durations: list[tuple[str, float]]) -> None:
+        """Merge (path, seconds) pairs into the slowest-files list."""
+        merged = self.slowest_files + durations
+        self.slowest_files = sorted(merged, key=lambda item: item[1], reverse=True)[:self.top]
+
+    def to_dict(self) -> dict:
+        return {
+            "total_seconds": round(self.total_seconds, 6),
+            "stages": [
+                {"name": t.name, "seconds": round(t.seconds, 6), "files": t.files}
+                for t in self.stages
+            ],
+            "slowest_files": [
+                {"path": path, "seconds": round(seconds, 6)}
+                for path, seconds in self.slowest_files
+            ],
+        }
+
+    def format_table(self) -> str:
+        """Render the timings as a plain-text table."""
+        lines = [f"{'Stage':<16}{'Time (s)':>10}{'Files':>8}"]
+        for t in self.stages:
+            lines.append(f"{t.name:<16}{t.seconds:>10.3f}{t.files:>8}")
+        lines.append(f"{'total':<16}{self.total_seconds:>10.3f}")
+        if self.slowest_files:
+            lines.append("")
+            lines.append(f"Slowest files validated (top {len(self.slowest_files)}):")
+            for path, seconds in self.slowest_files:
+                lines.append(f"  {seconds * 1000:>9.2f} ms  {path}")
+        return "\n".join(lines)
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _walk_source(top: Path, *, root: Optional[Path] = None, matcher: Optional[IgnoreMatcher] = None):
+    """
+    Walk top the way copytree would, yielding (dir_path, dirnames, filenames).
+
+    Applies the same exclusion rules as copy_tree_safe(), so excluded
+    directories are pruned before being descended into. root is the source
+    root that anchored rules are relative to (default: top).
+    """
+    root = root or top
+    matcher = matcher or IgnoreMatcher.for_source(root)
+    for dirpath, dirnames, filenames in os.walk(top):
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        kept_dirs, kept_files = matcher.filter_walk("" if rel_dir == "." else rel_dir, dirnames, filenames)
+        dirnames[:] = sorted(kept_dirs)
+        yield Path(dirpath), dirnames, sorted(kept_files)
+
+
+def iter_source_files(src: Path, matcher: Optional[IgnoreMatcher] = None):
+    """Yield (relative_posix_path, path) for every file copytree would copy."""
+    for base, _, filenames in _walk_source(src, matcher=matcher):
+        for name in filenames:
+            path = base / name
+            yield path.relative_to(src).as_posix(), path
+
+
+def is_excluded(rel: str, matcher: Optional[IgnoreMatcher] = None) -> bool:
+    """Return True if a relative path, or one of its parent directories, is excluded."""
+    return (matcher or IgnoreMatcher.for_source()).excludes_path(rel)
+
+
+def load_manifest(dst: Path) -> dict:
+    """Load the deploy manifest from dst. Returns {} if missing or unreadable."""
+    manifest_path = dst / MANIFEST_NAME
+    try:
+        with open(manifest_path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    files = data.get("files", {}) if isinstance(data, dict) else {}
+    return files if isinstance(files, dict) else {}
+
+
+def write_manifest(dst: Path, files: dict) -> None:
+    """Write the deploy manifest to dst (atomic replace)."""
+    manifest_path = dst / MANIFEST_NAME
+    tmp_path = dst / f"{MANIFEST_NAME}.tmp"
+    data = {
+        "version": MANIFEST_VERSION,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "file_count": len(files),
+        "files": files,
+    }
+    # A leftover temporary file may be a link into the live build: replace it, never write through it
+    tmp_path.unlink(missing_ok=True)
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, manifest_path)
+
+
+def hash_files(paths: list[Path], workers: int = DEFAULT_HASH_WORKERS) -> list[Optional[str]]:
+    """
+    SHA-256 a list of files over a thread pool.
+
+    Returns digests in the same order as paths; None for unreadable files.
+    """
+    def digest_or_none(path: Path) -> Optional[str]:
+        try:
+            return file_digest(path)
+        except OSError:
+            return None
+
+    if workers <= 1 or len(paths) <= 1:
+        return [digest_or_none(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(digest_or_none, paths))
+
+
+def build_manifest(
+    src: Path, workers: int = DEFAULT_HASH_WORKERS, matcher: Optional[IgnoreMatcher] = None
+) -> dict:
+    """
+    Build manifest entries (size, mtime_ns, sha256) for every deployable file in src.
+
+    matcher defaults to the exclusion rules of src; pass IgnoreMatcher([])
+    to describe an already filtered tree (a build) file by file.
+    """
+    entries = list(iter_source_files(src, matcher))
+    digests = hash_files([path for _, path in entries], workers)
+    files = {}
+    for (rel, path), digest in zip(entries, digests):
+        st = path.stat()
+        files[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+    return files
+
+
+def verify_build(dst: Path, workers: int = DEFAULT_HASH_WORKERS) -> list[str]:
+    """
+    Check a deployed build against its manifest, without reading src.
+
+    Sizes are compared from a stat first; only files whose size matches are
+    hashed (in parallel). Files present in dst but absent from the manifest
+    are reported too.
+
+    Returns:
+        List of problems (empty if the build matches its manifest)
+    """
+    if not (dst / MANIFEST_NAME).exists():
+        return [f"No manifest found at {dst / MANIFEST_NAME}"]
+    manifest = load_manifest(dst)
+    if not manifest:
+        return [f"Manifest at {dst / MANIFEST_NAME} is empty or unreadable"]
+
+    problems = []  # (rel, message), sorted by path at the end
+    to_hash = []
+    for rel in manifest:
+        path = dst / rel
+        try:
+            size = path.stat().st_size
+        except OSError:
+            problems.append((rel, f"Missing file: {rel}"))
+            continue
+        if size != manifest[rel].get("size"):
+            problems.append((rel, f"Size mismatch: {rel} ({size} != {manifest[rel].get('size')})"))
+            continue
+        to_hash.append(rel)
+
+    digests = hash_files([dst / rel for rel in to_hash], workers)
+    for rel, digest in zip(to_hash, digests):
+        if digest != manifest[rel].get("sha256"):
+            problems.append((rel, f"Digest mismatch: {rel}"))
+
+    for dirpath, _, filenames in os.walk(dst):
+        base = Path(dirpath)
+        for name in filenames:
+            rel = (base / name).relative_to(dst).as_posix()
+            if rel != MANIFEST_NAME and rel not in manifest:
+                problems.append((rel, f"Unexpected file: {rel}"))
+
+    return [message for _, message in sorted(problems)]
+
+
+def sync_tree_incremental(
+    src: Path,
+    dst: Path,
+    *,
+    dry_run: bool = False,
+    verbose: bool = True,
+    copy_strategy: str = "copy",
+) -> SyncStats:
+    """
+    Synchronize dst with src, touching only what changed.
+
+    A file is considered unchanged when its size and mtime match the manifest
+    entry, or when its SHA-256 still matches after a stat mismatch (e.g. a
+    save without edits). Files present in dst but no longer deployable from
+    src are deleted, as are directories left empty.
+
+    Args:
+        src: Source directory path
+        dst: Destination directory path
+        dry_run: If True, only report what would change
+        verbose: If True, print progress messages
+        copy_strategy: One of COPY_STRATEGIES
+
+    Returns:
+        SyncStats listing copied and deleted relative paths
+    """
+    copy_file = make_copy_function(copy_strategy)
+    stats = SyncStats()
+    manifest = load_manifest(dst)
+
+    existing = set()
+    if dst.exists():
+        for dirpath, _, filenames in os.walk(dst):
+            base = Path(dirpath)
+            for name in filenames:
+                existing.add((base / name).relative_to(dst).as_posix())
+    existing.discard(MANIFEST_NAME)
+
+    new_manifest = {}
+    source_dirs = set()
+    for base, dirnames, filenames in _walk_source(src):
+        source_dirs.update((base / d).relative_to(src).as_posix() for d in dirnames)
+        for name in filenames:
+            src_file = base / name
+            rel = src_file.relative_to(src).as_posix()
+            st = src_file.stat()
+            entry = manifest.get(rel)
+            if entry and rel in existing:
+                if entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+                    new_manifest[rel] = entry
+                    stats.unchanged += 1
+                    continue
+                digest = file_digest(src_file)
+                if entry.get("sha256") == digest:
+                    new_manifest[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+                    stats.unchanged += 1
+                    continue
             else:
-                # Exact match (e.g., __pycache__, tests)
-                if pattern in files:
-                    ignored.add(pattern)
-        return ignored
-    return ignore_patterns
+                digest = file_digest(src_file)
+
+            stats.copied.append(rel)
+            new_manifest[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+            if dry_run:
+                continue
+            dst_file = dst / rel
+            if dst_file.is_dir():
+                shutil.rmtree(dst_file)
+            elif rel in existing:
+                # Never write through an existing file: it may be a hardlink to src or to the live build
+                dst_file.unlink()
+            dst_file.parent.mkdir(parents=True, exist_ok=True)
+            copy_file(src_file, dst_file)
+            # Record the copy itself, in case src changed since it was hashed
+            dst_st = dst_file.stat()
+            new_manifest[rel] = {
+                "size": dst_st.st_size, "mtime_ns": dst_st.st_mtime_ns, "sha256": file_digest(dst_file),
+            }
+
+    stats.deleted = sorted(existing - new_manifest.keys())
 
+    if dry_run:
+        log(f"[DRY-RUN] Would copy {len(stats.copied)} file(s), delete {len(stats.deleted)}", Colors.BLUE, verbose)
+        return stats
+
+    for rel in stats.deleted:
+        (dst / rel).unlink()
+
+    # Mirror source directories (copytree keeps empty ones) and drop the
+    # directories that no longer exist in src, deepest first
+    dst.mkdir(parents=True, exist_ok=True)
+    for rel_dir in source_dirs:
+        (dst / rel_dir).mkdir(parents=True, exist_ok=True)
+    for dirpath, _, _ in sorted(os.walk(dst), key=lambda w: w[0], reverse=True):
+        path = Path(dirpath)
+        if path == dst or path.relative_to(dst).as_posix() in source_dirs:
+            continue
+        if not any(path.iterdir()):
+            path.rmdir()
+
+    write_manifest(dst, new_manifest)
+    log(
+        f"Sync complete: {len(stats.copied)} copied, {len(stats.deleted)} deleted, "
+        f"{stats.unchanged} unchanged.",
+        Colors.GREEN,
+        verbose,
+    )
+    return stats
 
-def copy_tree_safe(src: Path, dst: Path, *, force: bool = False, dry_run: bool = False, verbose: bool = True) -> None:
+
+def copy_tree_safe(
+    src: Path,
+    dst: Path,
+    *,
+    force: bool = False,
+    dry_run: bool = False,
+    verbose: bool = True,
+    incremental: bool = False,
+    copy_strategy: str = "copy",
+) -> int:
     """
     Copy source directory to destination with exclusions.
 
@@ -76,40 +651,69 @@ def copy_tree_safe(src: Path, dst: Path, *, force: bool = False, dry_run: bool =
         force: If True, overwrite existing destination
         dry_run: If True, only simulate the copy
         verbose: If True, print progress messages
+        incremental: If True, sync only changed files against the manifest
+            instead of removing and re-copying the whole destination
+        copy_strategy: One of COPY_STRATEGIES ("copy", "hardlink", "reflink")
+
+    Returns:
+        Number of files copied (0 in dry-run mode)
 
     Raises:
-        ValueError: If source doesn't exist or isn't a directory
+        ValueError: If source doesn't exist, isn't a directory, or the copy
+            strategy is unknown
         FileExistsError: If destination exists and force=False
     """
     if not src.exists() or not src.is_dir():
         raise ValueError(f"Source '{src}' is not a valid directory")
 
-    if dst.exists() and not force:
+    copy_function = make_copy_function(copy_strategy)
+
+    if dst.exists() and not (force or incremental):
         raise FileExistsError(
             f"Destination '{dst}' already exists. Use --force to overwrite."
         )
 
+    if incremental:
+        log(f"Syncing {src} -> {dst} (incremental)...", Colors.BLUE, verbose)
+        stats = sync_tree_incremental(src, dst, dry_run=dry_run, verbose=verbose, copy_strategy=copy_strategy)
+        return 0 if dry_run else len(stats.copied)
+
     if dry_run:
         log(f"[DRY-RUN] Would copy {src} -> {dst}", Colors.BLUE, verbose)
-        log(f"[DRY-RUN] Would exclude: {EXCLUDE_PATTERNS}", Colors.BLUE, verbose)
-        return
+        log(f"[DRY-RUN] Would exclude: {IgnoreMatcher.for_source(src).patterns}", Colors.BLUE, verbose)
+        return 0
 
     # Remove existing destination if force
     if dst.exists() and force:
         log(f"Removing existing {dst}...", Colors.YELLOW, verbose)
         shutil.rmtree(dst)
 
-    log(f"Copying {src} -> {dst}...", Colors.BLUE, verbose)
-    shutil.copytree(src, dst, ignore=make_ignore_patterns())
+    log(f"Copying {src} -> {dst} ({copy_strategy})...", Colors.BLUE, verbose)
+    shutil.copytree(src, dst, ignore=make_ignore_patterns(src), copy_function=copy_function)
+    # Describe what was written, not src, which may have changed during the copy
+    files = build_manifest(dst, matcher=IgnoreMatcher([]))
+    write_manifest(dst, files)
     log(f"Copy complete.", Colors.GREEN, verbose)
+    return len(files)
 
 
-def validate_destination(dst: Path, verbose: bool = True) -> list[str]:
+def validate_destination(
+    dst: Path,
+    verbose: bool = True,
+    workers: Optional[int] = None,
+    cache_root: Optional[Path] = None,
+    timings: Optional[DeployTimings] = None,
+    stage: Optional[StageTiming] = None,
+) -> list[str]:
     """
     Validate the copied destination using validate.py functions.
 
     Args:
         dst: Destination directory to validate
+        workers: Validation threads (default: validate.DEFAULT_WORKERS)
+        cache_root: Project root holding the validation cache (None disables it)
+        timings: If given, receives the per-file validation durations
+        stage: If given, its file count is set to the number of files validated
 
     Returns:
         List of validation error messages (empty if valid)
@@ -121,7 +725,14 @@ def validate_destination(dst: Path, verbose: bool = True) -> list[str]:
     sys.path.insert(0, str(script_dir))
 
     try:
-        from validate import validate_plugin_json, validate_skill
+        from validate import (
+            CACHE_RELPATH,
+            DEFAULT_WORKERS,
+            ValidationCache,
+            discover_targets,
+            run_validation,
+            validate_plugin_json,
+        )
     except ImportError:
         errors.append("Could not import validation functions from validate.py")
         return errors
@@ -131,32 +742,31 @@ def validate_destination(dst: Path, verbose: bool = True) -> list[str]:
     plugin_errors = validate_plugin_json(plugin_path)
     errors.extend(plugin_errors)
 
-    # Validate skills
-    skills_dir = dst / "skills"
-    if skills_dir.exists():
-        for skill_dir in sorted(skills_dir.iterdir()):
-            if skill_dir.is_dir():
-                skill_path = skill_dir / "SKILL.md"
-                if skill_path.exists():
-                    skill_errors = validate_skill(skill_path)
-                    errors.extend(skill_errors)
-                # Check nested skills (core/, stack/)
-                for nested_dir in sorted(skill_dir.iterdir()):
-                    if nested_dir.is_dir():
-                        nested_skill_path = nested_dir / "SKILL.md"
-                        if nested_skill_path.exists():
-                            nested_errors = validate_skill(nested_skill_path)
-                            errors.extend(nested_errors)
+    # Validate skills (including core/ and stack/); shared components are
+    # checked by validate.py, not on deploy
+    cache = ValidationCache(cache_root / CACHE_RELPATH, root=dst) if cache_root else None
+    targets = discover_targets(dst, components=False)
+    results = run_validation(targets, workers=workers or DEFAULT_WORKERS, cache=cache)
+    for result in results:
+        errors.extend(result.errors)
+
+    if stage is not None:
+        stage.files = len(results) + 1  # + plugin.json
+    if timings is not None:
+        timings.record_files([
+            (result.target.path.relative_to(dst).as_posix(), result.duration) for result in results
+        ])
 
     return errors
 
 
-def check_version_consistency(src: Path, verbose: bool = True) -> list[str]:
+def check_version_consistency(src: Path, verbose: bool = True, stage: Optional[StageTiming] = None) -> list[str]:
     """
-    Check version consistency across plugin.json, README.md, and CHANGELOG.md.
+    Check version consistency between plugin.json and README.md.
 
     Args:
         src: Source directory containing the files
+        stage: If given, its file count is set to the number of files read
 
     Returns:
         List of version mismatch errors (empty if consistent)
@@ -169,6 +779,8 @@ def check_version_consistency(src: Path, verbose: bool = True) -> list[str]:
         errors.append("plugin.json not found for version check")
         return errors
 
+    if stage is not None:
+        stage.files = 1
     try:
         with open(plugin_path) as f:
             plugin_data = json.load(f)
@@ -184,6 +796,8 @@ def check_version_consistency(src: Path, verbose: bool = True) -> list[str]:
     readme_path = project_root / "README.md"
     if readme_path.exists():
         readme_content = readme_path.read_text()
+        if stage is not None:
+            stage.files += 1
         # Look for version pattern like "Version : 6.0.0" or "**Version**: 6.0.0"
         version_patterns = [
             r"\*\*Version\*\*\s*[:=]\s*(\d+\.\d+\.\d+)",
@@ -210,12 +824,141 @@ def check_version_consistency(src: Path, verbose: bool = True) -> list[str]:
     return errors
 
 
-def rollback(dst: Path, verbose: bool = True) -> None:
-    """Remove destination directory after failed validation."""
+def staging_dir(dst: Path) -> Path:
+    """Return the sibling directory where a new build is assembled."""
+    return dst.parent / f".{dst.name}-staging"
+
+
+def releases_dir(dst: Path) -> Path:
+    """Return the sibling directory holding previous builds."""
+    return dst.parent / f".{dst.name}-releases"
+
+
+def list_releases(dst: Path) -> list[Path]:
+    """Return previous builds of dst, oldest first."""
+    root = releases_dir(dst)
+    if not root.exists():
+        return []
+    return sorted(p for p in root.iterdir() if p.is_dir())
+
+
+def prepare_staging(dst: Path, *, incremental: bool = False) -> Path:
+    """
+    Create the staging directory for the next build.
+
+    With incremental=True, staging is seeded with hardlinks to the files of
+    the current dst and its manifest (a plain copy where linking fails), so
+    that only the files changed since the live build are written. This is
+    safe because the sync never writes through a staged file: changed files
+    are unlinked or replaced by rename, which leaves dst itself unmodified.
+
+    Returns:
+        Path to the staging directory
+    """
+    staging = staging_dir(dst)
+    if staging.exists():
+        shutil.rmtree(staging)
+
+    if incremental and dst.is_dir():
+        shutil.copytree(dst, staging, symlinks=True, copy_function=make_copy_function("hardlink"))
+
+    return staging
+
+
+def _exchange(a: Path, b: Path) -> bool:
+    """
+    Atomically swap two paths with renameat2(RENAME_EXCHANGE).
+
+    Returns:
+        True if the paths were exchanged, False if the platform or filesystem
+        does not support it (nothing is changed in that case)
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    import ctypes
+
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return False
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    if renameat2(AT_FDCWD, os.fsencode(a), AT_FDCWD, os.fsencode(b), RENAME_EXCHANGE) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.EINVAL, errno.ENOSYS):
+        return False
+    raise OSError(err, os.strerror(err), str(a), None, str(b))
+
+
+def swap_in(staging: Path, dst: Path, *, keep_releases: int = DEFAULT_KEEP_RELEASES, verbose: bool = True) -> None:
+    """
+    Replace dst with the validated staging build.
+
+    On Linux, staging and dst are exchanged in a single renameat2 call, so
+    readers see either the old or the new tree; the old tree, now at the
+    staging path, is then moved into the releases directory. Elsewhere dst
+    is renamed away before staging is renamed onto it, which leaves a short
+    window where dst does not exist (rollback() handles a missing dst).
+    """
     if dst.exists():
-        log(f"Rolling back: removing {dst}...", Colors.RED, verbose)
-        shutil.rmtree(dst)
-        log("Rollback complete.", Colors.YELLOW, verbose)
+        root = releases_dir(dst)
+        root.mkdir(parents=True, exist_ok=True)
+        release = root / datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        if _exchange(staging, dst):
+            os.rename(staging, release)
+        else:
+            os.rename(dst, release)
+            os.rename(staging, dst)
+    else:
+        os.rename(staging, dst)
+    log(f"Swapped new build into {dst}.", Colors.GREEN, verbose)
+
+    releases = list_releases(dst)
+    for old in releases[:max(len(releases) - keep_releases, 0)]:
+        shutil.rmtree(old)
+
+
+def discard_staging(dst: Path, verbose: bool = True) -> None:
+    """Remove a staging build that failed validation, leaving dst untouched."""
+    staging = staging_dir(dst)
+    if staging.exists():
+        log(f"Discarding staging build {staging}...", Colors.RED, verbose)
+        shutil.rmtree(staging)
+        log(f"Previous build left in place at {dst}.", Colors.YELLOW, verbose)
+
+
+def rollback(dst: Path, verbose: bool = True) -> bool:
+    """
+    Restore the most recent previous build of dst.
+
+    The restored release is swapped with dst as in swap_in(); the build
+    being rolled back is deleted only after the swap. A missing dst (e.g.
+    an interrupted non-atomic swap) is simply replaced.
+
+    Returns:
+        True if a previous build was restored, False if none was available
+    """
+    releases = list_releases(dst)
+    if not releases:
+        log(f"No previous build of {dst} to roll back to.", Colors.RED, verbose)
+        return False
+
+    previous = releases[-1]
+    discarded = dst.parent / f".{dst.name}-discarded"
+    if discarded.exists():
+        shutil.rmtree(discarded)
+
+    log(f"Rolling back: restoring {previous.name}...", Colors.YELLOW, verbose)
+    if dst.exists() and _exchange(previous, dst):
+        os.rename(previous, discarded)
+    else:
+        if dst.exists():
+            os.rename(dst, discarded)
+        os.rename(previous, dst)
+    if discarded.exists():
+        shutil.rmtree(discarded)
+    log("Rollback complete.", Colors.YELLOW, verbose)
+    return True
 
 
 def deploy(
@@ -226,10 +969,19 @@ def deploy(
     force: bool = False,
     verbose: bool = True,
     skip_version_check: bool = False,
+    incremental: bool = False,
+    keep_releases: int = DEFAULT_KEEP_RELEASES,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    copy_strategy: str = "copy",
+    timings: Optional[DeployTimings] = None,
 ) -> int:
     """
     Main deployment function.
 
+    The build is assembled and validated in a staging directory; dest is
+    only replaced once validation passes.
+
     Args:
         src: Source directory (src/)
         dest: Destination directory (build/epci/)
@@ -237,17 +989,60 @@ def deploy(
         force: If True, overwrite existing destination
         verbose: If True, print progress messages
         skip_version_check: If True, skip version consistency check
+        incremental: If True, sync only changed files instead of a full copy
+        keep_releases: Number of previous builds kept for rollback
+        workers: Validation threads (default: validate.DEFAULT_WORKERS)
+        use_cache: If True, reuse cached results for unchanged SKILL.md files
+        copy_strategy: One of COPY_STRATEGIES ("copy", "hardlink", "reflink")
+        timings: If given, filled with per-stage wall times and file counts
+            (version, copy, validate, swap or rollback) and the slowest files
 
     Returns:
         Exit code (0=success, 1=validation failed, 2=copy failed, 3=version mismatch)
     """
+    timings = timings if timings is not None else DeployTimings()
+    start = time.perf_counter()
+    try:
+        return _deploy_stages(
+            src, dest, timings,
+            dry_run=dry_run,
+            force=force,
+            verbose=verbose,
+            skip_version_check=skip_version_check,
+            incremental=incremental,
+            keep_releases=keep_releases,
+            workers=workers,
+            use_cache=use_cache,
+            copy_strategy=copy_strategy,
+        )
+    finally:
+        timings.total_seconds = time.perf_counter() - start
+
+
+def _deploy_stages(
+    src: Path,
+    dest: Path,
+    timings: DeployTimings,
+    *,
+    dry_run: bool,
+    force: bool,
+    verbose: bool,
+    skip_version_check: bool,
+    incremental: bool,
+    keep_releases: int,
+    workers: Optional[int],
+    use_cache: bool,
+    copy_strategy: str,
+) -> int:
+    """Run the deploy stages of deploy(), timing each one into timings."""
     log(f"\n{Colors.BOLD}EPCI Deployment Script{Colors.RESET}", verbose=verbose)
     log("=" * 50, verbose=verbose)
 
     # Check version consistency first (on source)
     if not skip_version_check and not dry_run:
         log("\n[1/3] Checking version consistency...", Colors.BLUE, verbose)
-        version_errors = check_version_consistency(src, verbose)
+        with timings.stage("version") as stage:
+            version_errors = check_version_consistency(src, verbose, stage=stage)
         if version_errors:
             for err in version_errors:
                 log(f"  ERROR: {err}", Colors.RED, verbose)
@@ -257,30 +1052,56 @@ def deploy(
     elif dry_run:
         log("\n[1/3] [DRY-RUN] Would check version consistency", Colors.BLUE, verbose)
 
-    # Copy source to destination
+    # Copy source to a staging directory next to the destination
     log("\n[2/3] Copying files...", Colors.BLUE, verbose)
-    try:
-        copy_tree_safe(src, dest, force=force, dry_run=dry_run, verbose=verbose)
-    except (ValueError, FileExistsError) as e:
-        log(f"  ERROR: {e}", Colors.RED, verbose)
-        return 2
-
-    # Skip validation for dry-run
     if dry_run:
+        try:
+            copy_tree_safe(
+                src, dest, force=force, dry_run=True, verbose=verbose, incremental=incremental
+            )
+        except (ValueError, FileExistsError) as e:
+            log(f"  ERROR: {e}", Colors.RED, verbose)
+            return 2
         log("\n[3/3] [DRY-RUN] Would validate destination", Colors.BLUE, verbose)
         log(f"\n{Colors.GREEN}[DRY-RUN] Deployment simulation complete.{Colors.RESET}", verbose=verbose)
         return 0
 
-    # Validate destination
+    if dest.exists() and not (force or incremental):
+        log(f"  ERROR: Destination '{dest}' already exists. Use --force to overwrite.", Colors.RED, verbose)
+        return 2
+
+    # A hardlink build starts from links to the live build and syncs the changes
+    seeded = incremental or copy_strategy == "hardlink"
+    try:
+        with timings.stage("copy") as stage:
+            staging = prepare_staging(dest, incremental=seeded)
+            stage.files = copy_tree_safe(
+                src, staging, force=True, verbose=verbose, incremental=seeded,
+                copy_strategy=source_copy_strategy(copy_strategy),
+            )
+    except (ValueError, OSError) as e:
+        log(f"  ERROR: {e}", Colors.RED, verbose)
+        with timings.stage("rollback"):
+            discard_staging(dest, verbose)
+        return 2
+
+    # Validate the staging build before it becomes visible
     log("\n[3/3] Validating destination...", Colors.BLUE, verbose)
-    validation_errors = validate_destination(dest, verbose)
+    with timings.stage("validate") as stage:
+        validation_errors = validate_destination(
+            staging, verbose, workers=workers, cache_root=src.parent if use_cache else None,
+            timings=timings, stage=stage,
+        )
     if validation_errors:
         for err in validation_errors:
             log(f"  ERROR: {err}", Colors.RED, verbose)
         log("\nValidation failed. Rolling back...", Colors.RED, verbose)
-        rollback(dest, verbose)
+        with timings.stage("rollback"):
+            discard_staging(dest, verbose)
         return 1
 
+    with timings.stage("swap"):
+        swap_in(staging, dest, keep_releases=keep_releases, verbose=verbose)
     log("  Validation passed.", Colors.GREEN, verbose)
     log(f"\n{Colors.GREEN}{Colors.BOLD}Deployment complete!{Colors.RESET}", verbose=verbose)
     log(f"  Source: {src}", verbose=verbose)
@@ -289,6 +1110,256 @@ def deploy(
     return 0
 
 
+class WatchSession:
+    """
+    In-memory deploy state for --watch.
+
+    Keeps the destination manifest and per-target validation results between
+    rebuilds, so a batch of edits only re-validates and re-copies the files
+    it touched. Each batch goes through the same pipeline as deploy(): the
+    changes are applied to a staging tree hardlinked to the destination (so
+    only the changed files are written), the staging tree is validated, and
+    it is swapped in only when the whole tree is valid.
+    """
+
+    def __init__(
+        self,
+        src: Path,
+        dest: Path,
+        *,
+        workers: Optional[int] = None,
+        verbose: bool = True,
+        copy_strategy: str = "copy",
+        keep_releases: int = DEFAULT_KEEP_RELEASES,
+    ):
+        self.src = src
+        self.dest = dest
+        self.workers = workers
+        self.verbose = verbose
+        self.copy_strategy = copy_strategy
+        self.keep_releases = keep_releases
+        self._copy_file_fn = make_copy_function(source_copy_strategy(copy_strategy))
+        self.matcher = IgnoreMatcher.for_source(src)
+        self.manifest = load_manifest(dest)
+        self.plugin_errors: list[str] = []
+        self.results: dict[str, list[str]] = {}  # target path relative to the tree -> errors
+        self.pending: set[str] = set()
+        self.needs_full_deploy = not dest.exists()
+
+        script_dir = Path(__file__).parent
+        sys.path.insert(0, str(script_dir))
+        import validate
+        self._validate = validate
+
+    @property
+    def errors(self) -> list[str]:
+        """All current validation errors, in a stable order."""
+        errors = list(self.plugin_errors)
+        for path in sorted(self.results):
+            errors.extend(self.results[path])
+        return errors
+
+    def prime(self) -> None:
+        """Validate the whole deployed tree (src if nothing is deployed yet) once."""
+        v = self._validate
+        root = self.dest if self.dest.exists() else self.src
+        self.plugin_errors = v.validate_plugin_json(root / ".claude-plugin" / "plugin.json")
+        targets = v.discover_targets(root, components=False)
+        results = v.run_validation(targets, workers=self.workers or v.DEFAULT_WORKERS)
+        self.results = {r.target.path.relative_to(root).as_posix(): r.errors for r in results}
+
+    def handle(self, changed: set[str]) -> int:
+        """
+        Process one debounced batch of changed relative paths.
+
+        Changes that fail validation stay pending and are re-applied with
+        the next batch.
+
+        Returns:
+            0 if the batch was deployed (or had nothing to deploy), 1 if
+            validation failed and the destination was left untouched
+        """
+        start = time.perf_counter()
+        if "." in changed:
+            changed = {rel for rel, _ in iter_source_files(self.src)} | set(self.manifest)
+        changed = {rel for rel in changed if not is_excluded(rel, self.matcher)}
+        if not changed:
+            return 0
+        self.pending |= changed
+
+        if self.needs_full_deploy:
+            code = deploy(
+                self.src, self.dest, force=True, incremental=True,
+                verbose=self.verbose, skip_version_check=True, workers=self.workers,
+                copy_strategy=self.copy_strategy, keep_releases=self.keep_releases,
+            )
+            self.needs_full_deploy = code != 0
+            self.manifest = load_manifest(self.dest)
+            self.pending.clear()
+            if code == 0:
+                self.prime()
+            return code
+
+        staging = prepare_staging(self.dest, incremental=True)
+        swapped = False
+        try:
+            copied, deleted = self.apply(self.pending, staging)
+            revalidated = self.revalidate(staging, changed)
+
+            errors = self.errors
+            if errors:
+                for err in errors:
+                    log(f"  ERROR: {err}", Colors.RED, self.verbose)
+                log(f"Validation failed; keeping previous build at {self.dest}.", Colors.YELLOW, self.verbose)
+                return 1
+
+            swap_in(staging, self.dest, keep_releases=self.keep_releases, verbose=False)
+            swapped = True
+        finally:
+            if not swapped:
+                discard_staging(self.dest, verbose=False)
+                self.manifest = load_manifest(self.dest)
+
+        self.pending.clear()
+        elapsed = time.perf_counter() - start
+        log(
+            f"Rebuilt in {elapsed * 1000:.0f} ms: {copied} copied, {deleted} deleted, "
+            f"{revalidated} target(s) re-validated.",
+            Colors.GREEN,
+            self.verbose,
+        )
+        return 0
+
+    def revalidate(self, root: Path, changed: set[str]) -> int:
+        """Re-validate the targets of root under a changed path. Returns how many were validated."""
+        v = self._validate
+        discovered = v.discover_targets(root, components=False)
+        targets = {t.path.relative_to(root).as_posix(): t for t in discovered}
+        structure_changed = set(targets) != set(self.results)
+        for rel in set(self.results) - set(targets):
+            del self.results[rel]
+
+        def touched(rel: str) -> bool:
+            return any(rel == c or rel.startswith(c + "/") for c in changed)
+
+        stale = [t for rel, t in targets.items() if rel not in self.results or touched(rel)]
+        for result in v.run_validation(stale, workers=self.workers or v.DEFAULT_WORKERS):
+            self.results[result.target.path.relative_to(root).as_posix()] = result.errors
+        if structure_changed or any(c.startswith(".claude-plugin") for c in changed):
+            self.plugin_errors = v.validate_plugin_json(root / ".claude-plugin" / "plugin.json")
+        return len(stale)
+
+    def apply(self, rels: set[str], root: Path) -> tuple[int, int]:
+        """Mirror the given relative paths from src into root. Returns (copied, deleted)."""
+        copied = deleted = 0
+        for rel in sorted(rels):
+            src_path = self.src / rel
+            if src_path.is_dir():
+                for base, _, filenames in _walk_source(src_path, root=self.src, matcher=self.matcher):
+                    for name in filenames:
+                        file_rel = (base / name).relative_to(self.src).as_posix()
+                        copied += self._copy_file(file_rel, root)
+            elif src_path.is_file():
+                copied += self._copy_file(rel, root)
+            else:
+                dst_path = root / rel
+                if dst_path.is_dir():
+                    shutil.rmtree(dst_path)
+                elif dst_path.exists():
+                    dst_path.unlink()
+                removed = [k for k in self.manifest if k == rel or k.startswith(rel + "/")]
+                for key in removed:
+                    del self.manifest[key]
+                deleted += len(removed)
+        write_manifest(root, self.manifest)
+        return copied, deleted
+
+    def _copy_file(self, rel: str, root: Path) -> int:
+        """Copy one file into root via a temporary file and rename. Returns 1 if copied."""
+        src_file = self.src / rel
+        try:
+            st = src_file.stat()
+            digest = file_digest(src_file)
+        except OSError:
+            return 0  # Removed again before we got to it
+        entry = self.manifest.get(rel)
+        dst_file = root / rel
+        if entry and entry.get("sha256") == digest and dst_file.is_file():
+            return 0
+
+        dst_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = dst_file.with_name(f".{dst_file.name}.tmp")
+        if tmp_file.exists():
+            tmp_file.unlink()
+        self._copy_file_fn(src_file, tmp_file)
+        os.replace(tmp_file, dst_file)
+        self.manifest[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+        return 1
+
+
+def watch(
+    src: Path,
+    dest: Path,
+    *,
+    debounce: float = DEFAULT_DEBOUNCE,
+    polling: bool = False,
+    verbose: bool = True,
+    skip_version_check: bool = False,
+    keep_releases: int = DEFAULT_KEEP_RELEASES,
+    workers: Optional[int] = None,
+    copy_strategy: str = "copy",
+) -> int:
+    """
+    Deploy once, then redeploy changed files whenever src changes.
+
+    Each batch of changes is staged, validated and swapped in like a full
+    deploy (see WatchSession); a batch that raises is logged and the
+    session keeps watching. Uses inotify when available and falls back to polling. Runs until
+    interrupted (Ctrl+C).
+
+    Returns:
+        Exit code of the initial deployment if it could not start (2 or 3), else 0
+    """
+    code = deploy(
+        src, dest, force=True, incremental=True, verbose=verbose,
+        skip_version_check=skip_version_check, keep_releases=keep_releases, workers=workers,
+        copy_strategy=copy_strategy,
+    )
+    if code in (2, 3):
+        return code
+
+    script_dir = Path(__file__).parent
+    sys.path.insert(0, str(script_dir))
+    from watcher import make_watcher
+
+    session = WatchSession(
+        src, dest, workers=workers, verbose=verbose, copy_strategy=copy_strategy,
+        keep_releases=keep_releases,
+    )
+    session.prime()
+    watcher = make_watcher(src, ignore=make_ignore_patterns(src), polling=polling)
+    log(
+        f"\nWatching {src} ({type(watcher).__name__}, Ctrl+C to stop)...",
+        Colors.BLUE,
+        verbose,
+    )
+    try:
+        while True:
+            changed = watcher.wait(debounce)
+            log(f"\n{len(changed)} change(s) detected.", Colors.BLUE, verbose)
+            try:
+                session.handle(changed)
+            except Exception as e:
+                # A failed batch (file vanished, disk full...) must not end the session
+                log(f"  ERROR: rebuild failed: {e}", Colors.RED, verbose)
+                log(f"Keeping previous build at {dest}; still watching.", Colors.YELLOW, verbose)
+    except KeyboardInterrupt:
+        log("\nStopped watching.", Colors.YELLOW, verbose)
+    finally:
+        watcher.close()
+    return 0
+
+
 def main() -> int:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -304,6 +1375,76 @@ def main() -> int:
         action="store_true",
         help="Overwrite existing destination",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Copy only changed files and delete removed ones (manifest-based)",
+    )
+    parser.add_argument(
+        "--copy-strategy",
+        choices=COPY_STRATEGIES,
+        default="copy",
+        help=(
+            "How files are materialized: copy (default), reflink, or hardlink (unchanged "
+            "files linked to the previous build, changed ones copied; builds never share "
+            "inodes with src/). Falls back to copy per file when unsupported"
+        ),
+    )
+    parser.add_argument(
+        "--keep-releases",
+        type=int,
+        default=DEFAULT_KEEP_RELEASES,
+        help=f"Number of previous builds kept for rollback (default: {DEFAULT_KEEP_RELEASES})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Validation and hashing threads (default: min(8, CPU count))",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every file instead of using .epci-cache/validate.json",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and redeploy changed files on save",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help=f"Seconds of quiet that end a burst of edits in --watch mode (default: {DEFAULT_DEBOUNCE})",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Use polling instead of inotify in --watch mode",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Verify the destination against its .manifest.json and exit (does not read src/)",
+    )
+    parser.add_argument(
+        "--rollback",
+        action="store_true",
+        help="Restore the previous build and exit",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings and the slowest validated files",
+    )
+    parser.add_argument(
+        "--timings-json",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Write per-stage timings and the slowest validated files as JSON",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -336,6 +1477,10 @@ def main() -> int:
     )
 
     args = parser.parse_args()
+    if args.profile or args.timings_json:
+        for flag, enabled in (("--rollback", args.rollback), ("--verify", args.verify), ("--watch", args.watch)):
+            if enabled:
+                parser.error(f"--profile and --timings-json only apply to a deploy, not {flag}")
 
     # Determine paths
     script_dir = Path(__file__).parent
@@ -346,15 +1491,56 @@ def main() -> int:
 
     verbose = not args.quiet
 
-    return deploy(
+    if args.rollback:
+        return 0 if rollback(dest, verbose) else 1
+
+    if args.verify:
+        problems = verify_build(dest, workers=args.workers or DEFAULT_HASH_WORKERS)
+        for problem in problems:
+            log(f"  ERROR: {problem}", Colors.RED, verbose)
+        if problems:
+            log(f"Verification failed: {len(problems)} problem(s) in {dest}", Colors.RED, verbose)
+            return 4
+        log(f"Verification passed: {dest} matches its manifest.", Colors.GREEN, verbose)
+        return 0
+
+    if args.watch:
+        return watch(
+            src,
+            dest,
+            debounce=args.debounce,
+            polling=args.poll,
+            verbose=verbose,
+            skip_version_check=args.skip_version_check,
+            keep_releases=args.keep_releases,
+            workers=args.workers,
+            copy_strategy=args.copy_strategy,
+        )
+
+    timings = DeployTimings()
+    code = deploy(
         src=src,
         dest=dest,
         dry_run=args.dry_run,
         force=args.force,
         verbose=verbose,
         skip_version_check=args.skip_version_check,
+        incremental=args.incremental,
+        keep_releases=args.keep_releases,
+        workers=args.workers,
+        use_cache=not args.no_cache,
+        copy_strategy=args.copy_strategy,
+        timings=timings,
     )
 
+    if args.profile:
+        print(f"\n{Colors.BOLD}Deploy timings{Colors.RESET}")
+        print(timings.format_table())
+    if args.timings_json:
+        report = {"exit_code": code, **timings.to_dict()}
+        args.timings_json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return code
+
 
 if __name__ == "__main__":
     sys.exit(main())
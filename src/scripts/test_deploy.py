@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for deploy.py - EPCI deployment script."""
 
+import json
 import shutil
 import tempfile
 import unittest
@@ -121,6 +122,538 @@ class TestDeployScript(unittest.TestCase):
         self.assertFalse(self.build_dir.exists())
         self.assertNotEqual(result, 0)  # Non-zero exit code
 
+    def test_incremental_sync_copies_only_changed_files(self):
+        """Test that an incremental sync rewrites only modified files."""
+        from deploy import copy_tree_safe, sync_tree_incremental
+
+        (self.src_dir / "skills" / "a.md").write_text("alpha")
+        (self.src_dir / "skills" / "b.md").write_text("beta")
+        copy_tree_safe(self.src_dir, self.build_dir, force=True, verbose=False)
+
+        (self.src_dir / "skills" / "b.md").write_text("beta v2")
+        stats = sync_tree_incremental(self.src_dir, self.build_dir, verbose=False)
+
+        self.assertEqual(stats.copied, ["skills/b.md"])
+        self.assertEqual(stats.deleted, [])
+        self.assertEqual((self.build_dir / "skills" / "b.md").read_text(), "beta v2")
+
+    def test_incremental_sync_deletes_removed_files(self):
+        """Test that files removed from src are removed from the destination."""
+        from deploy import copy_tree_safe, sync_tree_incremental
+
+        (self.src_dir / "skills" / "old").mkdir()
+        (self.src_dir / "skills" / "old" / "SKILL.md").write_text("old")
+        copy_tree_safe(self.src_dir, self.build_dir, force=True, verbose=False)
+
+        shutil.rmtree(self.src_dir / "skills" / "old")
+        stats = sync_tree_incremental(self.src_dir, self.build_dir, verbose=False)
+
+        self.assertEqual(stats.deleted, ["skills/old/SKILL.md"])
+        self.assertFalse((self.build_dir / "skills" / "old").exists())
+        self.assertTrue((self.build_dir / "agents").exists())
+
+    def test_incremental_sync_respects_exclusions(self):
+        """Test that incremental sync applies EXCLUDE_PATTERNS like a full copy."""
+        from deploy import MANIFEST_NAME, load_manifest, sync_tree_incremental
+
+        (self.src_dir / "skills" / "test.pyc").write_text("compiled")
+        sync_tree_incremental(self.src_dir, self.build_dir, verbose=False)
+
+        self.assertFalse((self.build_dir / "__pycache__").exists())
+        self.assertFalse((self.build_dir / "skills" / "test.pyc").exists())
+        self.assertTrue((self.build_dir / MANIFEST_NAME).exists())
+        self.assertIn(".claude-plugin/plugin.json", load_manifest(self.build_dir))
+
+    def test_ignore_matcher_gitignore_rules(self):
+        """Test anchoring, directory-only rules and negation in IgnoreMatcher."""
+        from deploy import IgnoreMatcher
+
+        matcher = IgnoreMatcher(["*.pyc", "tests", "/build/", "docs/**/*.tmp", "*.log", "!keep.log"])
+
+        self.assertTrue(matcher.matches("a/b/x.pyc"))
+        self.assertTrue(matcher.matches("skills/tests", is_dir=True))
+        self.assertTrue(matcher.matches("build", is_dir=True))
+        self.assertFalse(matcher.matches("build"))
+        self.assertFalse(matcher.matches("skills/build", is_dir=True))
+        self.assertTrue(matcher.matches("docs/a/b/c.tmp"))
+        self.assertFalse(matcher.matches("other/c.tmp"))
+        self.assertTrue(matcher.matches("run.log"))
+        self.assertFalse(matcher.matches("sub/keep.log"))
+        self.assertTrue(matcher.excludes_path("skills/tests/data.md"))
+
+    def test_deployignore_applies_to_full_and_incremental_copy(self):
+        """Test that src/.deployignore rules (with negation) are honoured."""
+        from deploy import copy_tree_safe, sync_tree_incremental
+
+        (self.src_dir / ".deployignore").write_text("# drafts\n*.draft.md\n!skills/keep.draft.md\n/agents/\n")
+        (self.src_dir / "skills" / "a.draft.md").write_text("draft")
+        (self.src_dir / "skills" / "keep.draft.md").write_text("kept")
+        (self.src_dir / "agents" / "a.md").write_text("agent")
+
+        full = Path(self.temp_dir) / "full"
+        copy_tree_safe(self.src_dir, full, verbose=False)
+        sync_tree_incremental(self.src_dir, self.build_dir, verbose=False)
+
+        for dst in (full, self.build_dir):
+            self.assertFalse((dst / ".deployignore").exists())
+            self.assertFalse((dst / "skills" / "a.draft.md").exists())
+            self.assertTrue((dst / "skills" / "keep.draft.md").exists())
+            self.assertFalse((dst / "agents").exists())
+            self.assertFalse((dst / "__pycache__").exists())
+
+    def _deploy(self, **kwargs):
+        """Run a quiet deploy of the test tree."""
+        from deploy import deploy
+
+        return deploy(
+            src=self.src_dir,
+            dest=self.build_dir,
+            force=True,
+            verbose=False,
+            skip_version_check=True,
+            **kwargs,
+        )
+
+    def test_deploy_records_stage_timings(self):
+        """Test that deploy() fills a DeployTimings with stages and slowest files."""
+        from deploy import DeployTimings
+
+        skill_dir = self.src_dir / "skills" / "demo"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("---\nname: demo\ndescription: Use when testing.\nuser-invocable: true\n---\nBody\n")
+        timings = DeployTimings(top=1)
+
+        self.assertEqual(self._deploy(timings=timings, use_cache=False), 0)
+
+        stages = {t.name: t for t in timings.stages}
+        self.assertEqual(list(stages), ["copy", "validate", "swap"])
+        self.assertEqual(stages["copy"].files, 2)
+        self.assertEqual(stages["validate"].files, 2)
+        self.assertEqual([path for path, _ in timings.slowest_files], ["skills/demo/SKILL.md"])
+        self.assertGreaterEqual(timings.total_seconds, sum(t.seconds for t in timings.stages))
+        report = timings.to_dict()
+        self.assertEqual(report["stages"][0]["name"], "copy")
+        self.assertIn("validate", timings.format_table())
+
+    def test_deploy_timings_include_rollback_on_failure(self):
+        """Test that a failed validation records a rollback stage."""
+        from deploy import DeployTimings
+
+        (self.src_dir / ".claude-plugin" / "plugin.json").write_text("{invalid")
+        timings = DeployTimings()
+
+        self.assertEqual(self._deploy(timings=timings), 1)
+        self.assertEqual([t.name for t in timings.stages], ["copy", "validate", "rollback"])
+
+    def test_version_stage_counts_files_read(self):
+        """Test that the version stage counts plugin.json and README.md only when read."""
+        from deploy import DeployTimings, deploy
+
+        for readme, expected in ((False, 1), (True, 2)):
+            if readme:
+                (Path(self.temp_dir) / "README.md").write_text("**Version**: 1.0.0\n")
+            timings = DeployTimings()
+            self.assertEqual(deploy(self.src_dir, self.build_dir, force=True, verbose=False, timings=timings), 0)
+            self.assertEqual(timings.stages[0].name, "version")
+            self.assertEqual(timings.stages[0].files, expected)
+
+    def test_profile_rejected_outside_deploy(self):
+        """Test that --profile and --timings-json are refused with modes that ignore them."""
+        from deploy import main
+
+        for mode in ("--rollback", "--verify", "--watch"):
+            argv = ["deploy.py", mode, "--profile", "--dest", str(self.build_dir)]
+            with self.subTest(mode=mode), patch("sys.argv", argv), patch("sys.stderr"):
+                with self.assertRaises(SystemExit) as ctx:
+                    main()
+                self.assertEqual(ctx.exception.code, 2)
+
+    def test_failed_validation_keeps_previous_build(self):
+        """Test that a failed deploy leaves the previous good build in place."""
+        self.assertEqual(self._deploy(), 0)
+        good_plugin = (self.build_dir / ".claude-plugin" / "plugin.json").read_text()
+
+        (self.src_dir / ".claude-plugin" / "plugin.json").write_text('{"invalid": true}')
+        result = self._deploy()
+
+        self.assertEqual(result, 1)
+        self.assertEqual(
+            (self.build_dir / ".claude-plugin" / "plugin.json").read_text(), good_plugin
+        )
+        self.assertFalse((self.build_dir.parent / ".epci-staging").exists())
+
+    def test_rollback_restores_previous_build(self):
+        """Test that rollback swaps the previous build back into place."""
+        from deploy import rollback
+
+        (self.src_dir / "agents" / "a.md").write_text("v1")
+        self.assertEqual(self._deploy(), 0)
+        (self.src_dir / "agents" / "a.md").write_text("v2")
+        self.assertEqual(self._deploy(), 0)
+
+        self.assertTrue(rollback(self.build_dir, verbose=False))
+
+        self.assertEqual((self.build_dir / "agents" / "a.md").read_text(), "v1")
+
+    def test_deploy_prunes_old_releases(self):
+        """Test that only keep_releases previous builds are retained."""
+        from deploy import list_releases
+
+        for _ in range(4):
+            self.assertEqual(self._deploy(keep_releases=2), 0)
+
+        self.assertEqual(len(list_releases(self.build_dir)), 2)
+
+    def test_incremental_deploy_seeds_staging_from_live_build(self):
+        """Test that an incremental deploy starts from dst and leaves releases intact."""
+        from deploy import list_releases
+
+        (self.src_dir / "agents" / "a.md").write_text("v1")
+        self.assertEqual(self._deploy(), 0)
+        (self.src_dir / "agents" / "a.md").write_text("v2")
+
+        self.assertEqual(self._deploy(incremental=True), 0)
+
+        self.assertEqual((self.build_dir / "agents" / "a.md").read_text(), "v2")
+        releases = list_releases(self.build_dir)
+        self.assertEqual(len(releases), 1)
+        self.assertEqual((releases[0] / "agents" / "a.md").read_text(), "v1")
+
+    def test_incremental_deploy_keeps_unchanged_files(self):
+        """Test that an incremental deploy writes only changed files; unchanged ones keep their inode."""
+        (self.src_dir / "agents" / "a.md").write_text("a")
+        (self.src_dir / "agents" / "b.md").write_text("v1")
+        self.assertEqual(self._deploy(), 0)
+        before = {name: (self.build_dir / "agents" / name).stat().st_ino for name in ("a.md", "b.md")}
+        (self.src_dir / "agents" / "b.md").write_text("v2")
+
+        with patch("deploy.shutil.copy2", wraps=shutil.copy2) as copy2:
+            self.assertEqual(self._deploy(incremental=True), 0)
+
+        copied = [Path(call.args[0]).relative_to(self.src_dir).as_posix() for call in copy2.call_args_list]
+        self.assertEqual(copied, ["agents/b.md"])
+        self.assertEqual((self.build_dir / "agents" / "a.md").stat().st_ino, before["a.md"])
+        self.assertNotEqual((self.build_dir / "agents" / "b.md").stat().st_ino, before["b.md"])
+
+    def test_swap_falls_back_to_renames(self):
+        """Test that swap_in works where an atomic exchange is unavailable."""
+        from deploy import list_releases
+
+        (self.src_dir / "agents" / "a.md").write_text("v1")
+        self.assertEqual(self._deploy(), 0)
+        (self.src_dir / "agents" / "a.md").write_text("v2")
+
+        with patch("deploy._exchange", return_value=False):
+            self.assertEqual(self._deploy(), 0)
+
+        self.assertEqual((self.build_dir / "agents" / "a.md").read_text(), "v2")
+        self.assertEqual(len(list_releases(self.build_dir)), 1)
+
+    def test_rollback_with_missing_destination(self):
+        """Test that rollback restores a release when dst is gone mid-swap."""
+        from deploy import rollback
+
+        (self.src_dir / "agents" / "a.md").write_text("v1")
+        self.assertEqual(self._deploy(), 0)
+        self.assertEqual(self._deploy(), 0)
+        shutil.rmtree(self.build_dir)
+
+        self.assertTrue(rollback(self.build_dir, verbose=False))
+
+        self.assertEqual((self.build_dir / "agents" / "a.md").read_text(), "v1")
+
+    def test_validate_destination_checks_nested_skills_in_parallel(self):
+        """Test that core/ and stack/ skills are validated, in stable order."""
+        from deploy import validate_destination
+
+        for group in ("core", "stack"):
+            skill_dir = self.src_dir / "skills" / group / f"{group}-skill"
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text("---\nname: x\n---\n")
+
+        errors = validate_destination(self.src_dir, verbose=False, workers=4)
+
+        self.assertEqual(len(errors), 4)
+        self.assertIn("core-skill", errors[0])
+        self.assertIn("stack-skill", errors[-1])
+        self.assertEqual(errors, validate_destination(self.src_dir, verbose=False, workers=1))
+
+    def test_validate_destination_skips_shared_components(self):
+        """Test that deploy validates skills only, like before component discovery."""
+        from deploy import validate_destination
+
+        (self.src_dir / "shared" / "broken").mkdir(parents=True)
+
+        self.assertEqual(validate_destination(self.src_dir, verbose=False), [])
+
+    def test_validation_cache_serves_unchanged_files(self):
+        """Test that unchanged files are served from the validation cache."""
+        from validate import ValidationCache, ValidationTarget, run_validation
+
+        skill_path = self.src_dir / "skills" / "demo" / "SKILL.md"
+        skill_path.parent.mkdir()
+        skill_path.write_text("---\nname: demo\ndescription: d\nuser-invocable: true\n---\n")
+        targets = [ValidationTarget("demo", skill_path, "skill")]
+        cache_path = Path(self.temp_dir) / ".epci-cache" / "validate.json"
+
+        first = run_validation(targets, cache=ValidationCache(cache_path))
+        second = run_validation(targets, cache=ValidationCache(cache_path))
+        skill_path.write_text("---\nname: demo\n---\n")
+        third = run_validation(targets, cache=ValidationCache(cache_path))
+
+        self.assertFalse(first[0].cached)
+        self.assertTrue(second[0].cached)
+        self.assertEqual(second[0].frontmatter["name"], "demo")
+        self.assertFalse(third[0].cached)
+        self.assertEqual(len(third[0].errors), 2)
+
+    def test_validation_cache_invalidated_by_rule_change(self):
+        """Test that a different rules fingerprint discards cached entries."""
+        from validate import ValidationCache, ValidationTarget, run_validation
+
+        skill_path = self.src_dir / "skills" / "SKILL.md"
+        skill_path.write_text("---\nname: demo\n---\n")
+        targets = [ValidationTarget("demo", skill_path, "skill")]
+        cache_path = Path(self.temp_dir) / "validate.json"
+        run_validation(targets, cache=ValidationCache(cache_path))
+
+        with patch("validate.rules_fingerprint", return_value="other-rules"):
+            result = run_validation(targets, cache=ValidationCache(cache_path))
+
+        self.assertFalse(result[0].cached)
+
+    def test_validation_cache_shared_between_trees(self):
+        """Test that src/ and a copy of it validated in turn keep each other's entries."""
+        from validate import ValidationCache, discover_targets, run_validation
+
+        skill_path = self.src_dir / "skills" / "demo" / "SKILL.md"
+        skill_path.parent.mkdir()
+        skill_path.write_text("---\nname: demo\ndescription: d\n---\n")
+        staging = Path(self.temp_dir) / "staging"
+        shutil.copytree(self.src_dir, staging)
+        cache_path = Path(self.temp_dir) / "validate.json"
+
+        def validate(root):
+            return run_validation(discover_targets(root), cache=ValidationCache(cache_path, root=root))
+
+        validate(staging)
+        shutil.rmtree(staging)
+        from_src = validate(self.src_dir)
+
+        self.assertTrue(from_src[0].cached)
+        # Errors name the file of the tree being validated, not the staging copy
+        self.assertEqual(from_src[0].errors, [f"Missing frontmatter field 'user-invocable' in {skill_path}"])
+
+    def test_watch_session_applies_only_changed_files(self):
+        """Test that a watch batch re-copies the changed file and drops removed ones."""
+        from deploy import WatchSession
+
+        (self.src_dir / "agents" / "a.md").write_text("v1")
+        (self.src_dir / "agents" / "b.md").write_text("b")
+        self.assertEqual(self._deploy(), 0)
+        session = WatchSession(self.src_dir, self.build_dir, verbose=False)
+        session.prime()
+
+        (self.src_dir / "agents" / "a.md").write_text("v2")
+        (self.src_dir / "agents" / "b.md").unlink()
+        result = session.handle({"agents/a.md", "agents/b.md", "__pycache__/x.pyc"})
+
+        self.assertEqual(result, 0)
+        self.assertEqual((self.build_dir / "agents" / "a.md").read_text(), "v2")
+        self.assertFalse((self.build_dir / "agents" / "b.md").exists())
+        self.assertFalse((self.build_dir / "__pycache__").exists())
+
+    def test_watch_session_writes_only_changed_files(self):
+        """Test that a watch batch leaves the other files of the build as they are (same inode)."""
+        from deploy import WatchSession
+
+        (self.src_dir / "agents" / "a.md").write_text("a")
+        (self.src_dir / "agents" / "b.md").write_text("v1")
+        self.assertEqual(self._deploy(), 0)
+        unchanged = (self.build_dir / "agents" / "a.md").stat().st_ino
+
+        (self.src_dir / "agents" / "b.md").write_text("v2")
+        with patch("deploy.shutil.copy2", wraps=shutil.copy2) as copy2:
+            session = WatchSession(self.src_dir, self.build_dir, verbose=False)
+            session.prime()
+            self.assertEqual(session.handle({"agents/b.md"}), 0)
+
+        self.assertEqual([Path(call.args[0]).name for call in copy2.call_args_list], ["b.md"])
+        self.assertEqual((self.build_dir / "agents" / "a.md").stat().st_ino, unchanged)
+        self.assertEqual((self.build_dir / "agents" / "b.md").read_text(), "v2")
+
+    def test_watch_session_keeps_build_on_invalid_change(self):
+        """Test that an invalid edit is not applied to the destination."""
+        from deploy import WatchSession
+
+        self.assertEqual(self._deploy(), 0)
+        session = WatchSession(self.src_dir, self.build_dir, verbose=False)
+        session.prime()
+        skill_path = self.src_dir / "skills" / "broken" / "SKILL.md"
+        skill_path.parent.mkdir()
+        skill_path.write_text("no frontmatter")
+
+        result = session.handle({"skills/broken/SKILL.md"})
+
+        self.assertEqual(result, 1)
+        self.assertFalse((self.build_dir / "skills" / "broken").exists())
+
+    def test_watch_session_swaps_batches_in(self):
+        """Test that a watch batch replaces dest via staging and keeps a release."""
+        from deploy import WatchSession, list_releases, staging_dir
+
+        (self.src_dir / "agents" / "a.md").write_text("v1")
+        self.assertEqual(self._deploy(), 0)
+        session = WatchSession(self.src_dir, self.build_dir, verbose=False)
+        session.prime()
+
+        (self.src_dir / "agents" / "a.md").write_text("v2")
+        self.assertEqual(session.handle({"agents/a.md"}), 0)
+
+        releases = list_releases(self.build_dir)
+        self.assertEqual((releases[-1] / "agents" / "a.md").read_text(), "v1")
+        self.assertFalse(staging_dir(self.build_dir).exists())
+
+    def test_watch_survives_failed_batch(self):
+        """Test that an error while handling a batch is logged and watching continues."""
+        from deploy import watch
+
+        self.assertEqual(self._deploy(), 0)
+        watcher = MagicMock()
+        watcher.wait.side_effect = [{"agents/a.md"}, {"agents/b.md"}, KeyboardInterrupt]
+
+        with patch("watcher.make_watcher", return_value=watcher), \
+                patch("deploy.WatchSession.handle", side_effect=[OSError("gone"), 0]) as handle:
+            result = watch(self.src_dir, self.build_dir, verbose=False, skip_version_check=True)
+
+        self.assertEqual(result, 0)
+        self.assertEqual(handle.call_count, 2)
+        watcher.close.assert_called_once()
+
+    def test_polling_watcher_reports_changes(self):
+        """Test that the polling fallback detects created and excluded files."""
+        from deploy import make_ignore_patterns
+        from watcher import PollingWatcher
+
+        watcher = PollingWatcher(self.src_dir, ignore=make_ignore_patterns(self.src_dir), interval=0.01)
+        (self.src_dir / "agents" / "new.md").write_text("new")
+        (self.src_dir / "__pycache__" / "other.pyc").write_text("cache")
+
+        self.assertEqual(watcher.poll(0.05), {"agents/new.md"})
+
+    def test_hardlink_strategy_links_files(self):
+        """Test that the hardlink strategy shares inodes with the source."""
+        from deploy import copy_tree_safe
+
+        copy_tree_safe(self.src_dir, self.build_dir, force=True, verbose=False, copy_strategy="hardlink")
+
+        src_plugin = self.src_dir / ".claude-plugin" / "plugin.json"
+        dst_plugin = self.build_dir / ".claude-plugin" / "plugin.json"
+        self.assertTrue(dst_plugin.samefile(src_plugin))
+
+    def test_link_strategy_falls_back_to_copy(self):
+        """Test that files the filesystem refuses to link are copied instead."""
+        from deploy import copy_tree_safe
+
+        with patch("deploy.os.link", side_effect=OSError("cross-device link")):
+            copy_tree_safe(self.src_dir, self.build_dir, force=True, verbose=False, copy_strategy="hardlink")
+
+        dst_plugin = self.build_dir / ".claude-plugin" / "plugin.json"
+        self.assertTrue(dst_plugin.exists())
+        self.assertFalse(dst_plugin.samefile(self.src_dir / ".claude-plugin" / "plugin.json"))
+
+    def test_incremental_sync_does_not_write_through_hardlinks(self):
+        """Test that re-syncing a hardlinked build with copies leaves src intact."""
+        from deploy import copy_tree_safe, sync_tree_incremental
+
+        (self.src_dir / "agents" / "a.md").write_text("v1")
+        copy_tree_safe(self.src_dir, self.build_dir, force=True, verbose=False, copy_strategy="hardlink")
+        (self.src_dir / "agents" / "a.md").write_text("v2 longer")
+
+        sync_tree_incremental(self.src_dir, self.build_dir, verbose=False, copy_strategy="copy")
+
+        self.assertEqual((self.src_dir / "agents" / "a.md").read_text(), "v2 longer")
+        self.assertFalse((self.build_dir / "agents" / "a.md").samefile(self.src_dir / "agents" / "a.md"))
+
+    def test_unknown_copy_strategy_fails_deploy(self):
+        """Test that an unknown copy strategy is reported as a copy failure."""
+        self.assertEqual(self._deploy(copy_strategy="teleport"), 2)
+
+    def test_hardlink_deploy_links_previous_build(self):
+        """Test that hardlink deploys share unchanged files with the kept release, never with src."""
+        from deploy import list_releases
+
+        a_src = self.src_dir / "agents" / "a.md"
+        a_src.write_text("a")
+        (self.src_dir / "agents" / "b.md").write_text("v1")
+        self.assertEqual(self._deploy(copy_strategy="hardlink"), 0)
+        self.assertFalse((self.build_dir / "agents" / "a.md").samefile(a_src))
+        (self.src_dir / "agents" / "b.md").write_text("v2")
+
+        self.assertEqual(self._deploy(copy_strategy="hardlink"), 0)
+
+        release = list_releases(self.build_dir)[-1]
+        self.assertTrue((self.build_dir / "agents" / "a.md").samefile(release / "agents" / "a.md"))
+        self.assertFalse((self.build_dir / "agents" / "a.md").samefile(a_src))
+        self.assertEqual((release / "agents" / "b.md").read_text(), "v1")
+        self.assertEqual((self.build_dir / "agents" / "b.md").read_text(), "v2")
+
+        # An in-place edit of src/ reaches neither the build nor the release
+        with open(a_src, "r+") as f:
+            f.write("x")
+        self.assertEqual((self.build_dir / "agents" / "a.md").read_text(), "a")
+        self.assertEqual((release / "agents" / "a.md").read_text(), "a")
+
+    def test_verify_build_passes_after_deploy(self):
+        """Test that a fresh build matches its manifest."""
+        from deploy import MANIFEST_NAME, verify_build
+
+        self.assertEqual(self._deploy(), 0)
+
+        self.assertEqual(verify_build(self.build_dir, workers=4), [])
+        manifest = json.loads((self.build_dir / MANIFEST_NAME).read_text())
+        entry = manifest["files"][".claude-plugin/plugin.json"]
+        self.assertEqual(set(entry), {"size", "mtime_ns", "sha256"})
+
+    def test_manifest_describes_copied_files(self):
+        """Test that a source edit racing the copy does not end up in the manifest."""
+        from deploy import copy_tree_safe, verify_build
+
+        (self.src_dir / "agents" / "a.md").write_text("v1")
+
+        def racing_copy(src, dst):
+            shutil.copy2(src, dst)
+            if str(src).endswith("a.md"):
+                Path(src).write_text("edited during the copy")
+            return dst
+
+        for incremental in (False, True):
+            with self.subTest(incremental=incremental), \
+                    patch("deploy.make_copy_function", return_value=racing_copy):
+                (self.src_dir / "agents" / "a.md").write_text(f"v{incremental}")
+                copy_tree_safe(self.src_dir, self.build_dir, force=True, verbose=False, incremental=incremental)
+
+                self.assertEqual(verify_build(self.build_dir), [])
+
+    def test_verify_build_reports_tampering(self):
+        """Test that modified, missing and extra files are reported."""
+        from deploy import verify_build
+
+        (self.src_dir / "agents" / "a.md").write_text("aaaa")
+        (self.src_dir / "agents" / "b.md").write_text("bbbb")
+        self.assertEqual(self._deploy(), 0)
+
+        (self.build_dir / "agents" / "a.md").write_text("AAAA")
+        (self.build_dir / "agents" / "b.md").unlink()
+        (self.build_dir / "agents" / "c.md").write_text("extra")
+        problems = verify_build(self.build_dir)
+
+        self.assertEqual(problems, [
+            "Digest mismatch: agents/a.md",
+            "Missing file: agents/b.md",
+            "Unexpected file: agents/c.md",
+        ])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,79 +5,80 @@ EPCI v6 Validation Script
 Validates plugin structure and skills.
 
 Usage:
-    python validate.py
+    python validate.py [--workers N] [--no-cache]
+
+Per-file results are cached in .epci-cache/validate.json (project root),
+keyed by path relative to the validated tree and content hash.
 """
 
+import argparse
+import hashlib
 import json
+import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
+
+# Shared frontmatter parser lives with the factory skill scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills" / "factory" / "scripts"))
+
+import skill_frontmatter  # noqa: E402
+from skill_frontmatter import Frontmatter, read_frontmatter, split_frontmatter  # noqa: E402
+
+# Default thread pool size for skill/component validation
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Bump when validation logic changes in a way the rule constants don't capture
+VALIDATOR_VERSION = 1
+
+# Required frontmatter fields for SKILL.md
+SKILL_REQUIRED_FIELDS = ["name", "description", "user-invocable"]
+
+# Validation cache location, relative to the project root
+CACHE_RELPATH = Path(".epci-cache") / "validate.json"
+
+
+@dataclass
+class ValidationTarget:
+    """A SKILL.md or COMPONENT.md file to validate."""
+    label: str
+    path: Path
+    kind: str  # "skill" or "component"
+
+
+@dataclass
+class TargetResult:
+    """Validation outcome for a single target."""
+    target: ValidationTarget
+    errors: list[str] = field(default_factory=list)
+    frontmatter: dict = field(default_factory=dict)
+    cached: bool = False
+    duration: float = 0.0  # Wall time spent validating, in seconds
+
+    @property
+    def passed(self) -> bool:
+        return not self.errors
 
 
 def parse_frontmatter(file_path: Path) -> dict:
     """Parse YAML frontmatter from markdown file.
 
-    Returns dict with frontmatter fields, or empty dict if no frontmatter.
+    Only the frontmatter block is read from disk. Returns dict with
+    frontmatter fields, or empty dict if no frontmatter.
     """
     if not file_path.exists():
         return {}
 
-    content = file_path.read_text()
-    if not content.startswith("---"):
-        return {}
+    return read_frontmatter(file_path).typed()
 
-    # Find the closing ---
-    lines = content.split("\n")
-    end_idx = None
-    for i, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            end_idx = i
-            break
-
-    if end_idx is None:
-        return {}
 
-    frontmatter = {}
-    current_key = None
-    current_value_lines = []
-
-    for line in lines[1:end_idx]:
-        # Handle multi-line values (YAML folded style >-)
-        if line.startswith("  ") and current_key:
-            current_value_lines.append(line.strip())
-            continue
-
-        # Save previous multi-line value
-        if current_key and current_value_lines:
-            frontmatter[current_key] = " ".join(current_value_lines)
-            current_value_lines = []
-            current_key = None
-
-        # Parse key: value
-        if ":" in line:
-            key, _, value = line.partition(":")
-            key = key.strip()
-            value = value.strip()
-
-            # Handle multi-line start (>- or >)
-            if value in (">-", ">", "|"):
-                current_key = key
-                current_value_lines = []
-            # Handle boolean
-            elif value.lower() == "true":
-                frontmatter[key] = True
-            elif value.lower() == "false":
-                frontmatter[key] = False
-            # Handle quoted strings
-            elif value.startswith('"') and value.endswith('"'):
-                frontmatter[key] = value[1:-1]
-            else:
-                frontmatter[key] = value
-
-    # Don't forget last multi-line value
-    if current_key and current_value_lines:
-        frontmatter[current_key] = " ".join(current_value_lines)
-
-    return frontmatter
+def parse_frontmatter_text(content: str) -> dict:
+    """Parse YAML frontmatter from markdown content already in memory."""
+    return split_frontmatter(content).typed()
 
 
 def validate_plugin_json(plugin_path: Path) -> list[str]:
@@ -112,22 +113,23 @@ def validate_plugin_json(plugin_path: Path) -> list[str]:
 
 def validate_skill(skill_path: Path) -> list[str]:
     """Validate a SKILL.md file."""
-    errors = []
-
     if not skill_path.exists():
-        errors.append(f"SKILL.md not found: {skill_path}")
-        return errors
+        return [f"SKILL.md not found: {skill_path}"]
+
+    return check_skill_frontmatter(skill_path, read_frontmatter(skill_path))
 
-    content = skill_path.read_text()
+
+def check_skill_frontmatter(skill_path: Path, frontmatter: Frontmatter) -> list[str]:
+    """Validate the parsed frontmatter of skill_path."""
+    errors = []
 
     # Check for frontmatter
-    if not content.startswith("---"):
+    if not frontmatter.present:
         errors.append(f"Missing frontmatter in {skill_path}")
 
     # Check required frontmatter fields
-    required_fields = ["name", "description", "user-invocable"]
-    for field in required_fields:
-        if f"{field}:" not in content:
+    for field in SKILL_REQUIRED_FIELDS:
+        if field not in frontmatter.fields:
             errors.append(f"Missing frontmatter field '{field}' in {skill_path}")
 
     return errors
@@ -135,28 +137,241 @@ def validate_skill(skill_path: Path) -> list[str]:
 
 def validate_component(component_path: Path) -> list[str]:
     """Validate a COMPONENT.md file."""
-    errors = []
-
     if not component_path.exists():
-        errors.append(f"COMPONENT.md not found: {component_path}")
-        return errors
+        return [f"COMPONENT.md not found: {component_path}"]
+
+    return check_component_frontmatter(component_path, read_frontmatter(component_path))
 
-    content = component_path.read_text()
+
+def check_component_frontmatter(component_path: Path, frontmatter: Frontmatter) -> list[str]:
+    """Validate the parsed frontmatter of component_path."""
+    errors = []
 
     # Check for frontmatter
-    if not content.startswith("---"):
+    if not frontmatter.present:
         errors.append(f"Missing frontmatter in {component_path}")
 
     # Check that user-invocable is false
-    if "user-invocable: true" in content:
+    if frontmatter.get_bool("user-invocable"):
         errors.append(f"Component should have user-invocable: false in {component_path}")
 
     return errors
 
 
-def main():
+def rules_fingerprint() -> str:
+    """
+    Fingerprint of the validator version and rule set.
+
+    Covers VALIDATOR_VERSION, the rule constants and the source of this module
+    and of the frontmatter parser, so any change to the checks invalidates
+    previously cached results.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([VALIDATOR_VERSION, SKILL_REQUIRED_FIELDS]).encode())
+    for module_file in (__file__, skill_frontmatter.__file__):
+        try:
+            digest.update(Path(module_file).read_bytes())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """
+    Persistent per-file validation results, keyed by path and content hash.
+
+    With a root, paths are stored relative to it, so that trees with the
+    same layout (src/ and a deploy staging build) share entries instead of
+    evicting each other. Error messages are stored with the file's path
+    replaced by PATH_PLACEHOLDER and get the looked-up path back on get().
+    The whole cache is discarded when rules_fingerprint() changes. Entries
+    for files that no longer exist are dropped on save().
+    """
+
+    # Stands for the validated file's path in cached error messages
+    PATH_PLACEHOLDER = "<path>"
+
+    def __init__(self, path: Path, root: Optional[Path] = None):
+        self.path = path
+        self.root = root
+        self.fingerprint = rules_fingerprint()
+        self._entries: dict = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(data, dict) and data.get("fingerprint") == self.fingerprint:
+            self._entries = data.get("entries", {})
+
+    def _key(self, file_path: Path) -> str:
+        if self.root is not None:
+            try:
+                return file_path.relative_to(self.root).as_posix()
+            except ValueError:
+                pass
+        return str(file_path)
+
+    def _exists(self, key: str) -> bool:
+        path = Path(key)
+        if self.root is not None and not path.is_absolute():
+            path = self.root / path
+        return path.exists()
+
+    def get(self, file_path: Path, digest: str) -> Optional[dict]:
+        """Return the cached entry for file_path if its content hash matches."""
+        entry = self._entries.get(self._key(file_path))
+        if entry and entry.get("sha256") == digest:
+            errors = [error.replace(self.PATH_PLACEHOLDER, str(file_path)) for error in entry["errors"]]
+            return {**entry, "errors": errors}
+        return None
+
+    def put(self, file_path: Path, digest: str, frontmatter: dict, errors: list[str]) -> None:
+        """Store the validation result for file_path."""
+        with self._lock:
+            self._entries[self._key(file_path)] = {
+                "sha256": digest,
+                "frontmatter": frontmatter,
+                "errors": [error.replace(str(file_path), self.PATH_PLACEHOLDER) for error in errors],
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed (atomic replace)."""
+        with self._lock:
+            stale = [key for key in self._entries if not self._exists(key)]
+            for key in stale:
+                del self._entries[key]
+            if not (self._dirty or stale):
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump({"fingerprint": self.fingerprint, "entries": self._entries}, f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                return  # The cache is an optimization; never fail validation on it
+            self._dirty = False
+
+
+def discover_targets(src_dir: Path, *, components: bool = True) -> list[ValidationTarget]:
+    """
+    Collect every skill and shared component under src_dir in one traversal.
+
+    Skills live at skills/<name>/SKILL.md or one level deeper in grouping
+    directories (skills/core/<name>/, skills/stack/<name>/). Components live
+    at shared/<name>/COMPONENT.md and are skipped when components=False.
+    Targets are returned in sorted order so that reports are deterministic.
+    """
+    targets = []
+
+    skills_dir = src_dir / "skills"
+    if skills_dir.exists():
+        for skill_dir in sorted(skills_dir.iterdir()):
+            if not skill_dir.is_dir():
+                continue
+            skill_path = skill_dir / "SKILL.md"
+            if skill_path.exists():
+                targets.append(ValidationTarget(skill_dir.name, skill_path, "skill"))
+            for nested_dir in sorted(skill_dir.iterdir()):
+                nested_path = nested_dir / "SKILL.md"
+                if nested_dir.is_dir() and nested_path.exists():
+                    targets.append(ValidationTarget(
+                        f"{skill_dir.name}/{nested_dir.name}", nested_path, "skill"
+                    ))
+
+    shared_dir = src_dir / "shared"
+    if components and shared_dir.exists():
+        for comp_dir in sorted(shared_dir.iterdir()):
+            if comp_dir.is_dir():
+                targets.append(ValidationTarget(comp_dir.name, comp_dir / "COMPONENT.md", "component"))
+
+    return targets
+
+
+def validate_target(target: ValidationTarget, cache: Optional[ValidationCache] = None) -> TargetResult:
+    """
+    Validate a single target with the checker matching its kind.
+
+    When a cache is given, the file is hashed and an entry with the same
+    content hash is returned without re-parsing. The result's duration is
+    the wall time spent on this target.
+    """
+    start = time.perf_counter()
+    result = _validate_target(target, cache)
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def _validate_target(target: ValidationTarget, cache: Optional[ValidationCache]) -> TargetResult:
+    if not target.path.exists():
+        if target.kind == "component":
+            return TargetResult(target, validate_component(target.path))
+        return TargetResult(target, validate_skill(target.path))
+
+    raw = target.path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cache is not None:
+        entry = cache.get(target.path, digest)
+        if entry is not None:
+            return TargetResult(target, list(entry["errors"]), dict(entry["frontmatter"]), cached=True)
+
+    parsed = split_frontmatter(raw.decode("utf-8"))
+    if target.kind == "component":
+        errors = check_component_frontmatter(target.path, parsed)
+    else:
+        errors = check_skill_frontmatter(target.path, parsed)
+    frontmatter = parsed.typed()
+
+    if cache is not None:
+        cache.put(target.path, digest, frontmatter, errors)
+    return TargetResult(target, errors, frontmatter)
+
+
+def run_validation(
+    targets: list[ValidationTarget],
+    workers: int = DEFAULT_WORKERS,
+    cache: Optional[ValidationCache] = None,
+) -> list[TargetResult]:
+    """
+    Validate targets over a thread pool.
+
+    Results are returned in the same order as targets, regardless of
+    completion order. The cache, if given, is saved once all targets are done.
+    """
+    if workers <= 1 or len(targets) <= 1:
+        results = [validate_target(t, cache) for t in targets]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda t: validate_target(t, cache), targets))
+
+    if cache is not None:
+        cache.save()
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> int:
     """Run all validations."""
+    parser = argparse.ArgumentParser(description="EPCI v6 Validation")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Validation threads (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-validate every file instead of using {CACHE_RELPATH}",
+    )
+    args = parser.parse_args(argv)
+
     src_dir = Path(__file__).parent.parent
+    cache = None if args.no_cache else ValidationCache(src_dir.parent / CACHE_RELPATH, root=src_dir)
     all_errors = []
 
     print("EPCI v6 Validation")
@@ -169,41 +384,22 @@ def main():
     all_errors.extend(errors)
     print(f"  {'PASS' if not errors else 'FAIL'} ({len(errors)} errors)")
 
+    results = run_validation(discover_targets(src_dir), workers=args.workers, cache=cache)
+
     # Validate skills
     print("\n[2/3] Validating skills...")
-    skills_dir = src_dir / "skills"
-    if skills_dir.exists():
-        for skill_dir in sorted(skills_dir.iterdir()):
-            if skill_dir.is_dir():
-                skill_path = skill_dir / "SKILL.md"
-                if skill_path.exists():
-                    errors = validate_skill(skill_path)
-                    all_errors.extend(errors)
-                    status = "PASS" if not errors else "FAIL"
-                    print(f"  {status} {skill_dir.name}")
-                # Check core skills
-                if skill_dir.name == "core":
-                    for core_skill_dir in sorted(skill_dir.iterdir()):
-                        if core_skill_dir.is_dir():
-                            core_skill_path = core_skill_dir / "SKILL.md"
-                            if core_skill_path.exists():
-                                errors = validate_skill(core_skill_path)
-                                all_errors.extend(errors)
-                                status = "PASS" if not errors else "FAIL"
-                                print(f"  {status} core/{core_skill_dir.name}")
+    for result in results:
+        if result.target.kind == "skill":
+            all_errors.extend(result.errors)
+            print(f"  {'PASS' if result.passed else 'FAIL'} {result.target.label}")
 
     # Validate components
     print("\n[3/3] Validating shared components...")
-    shared_dir = src_dir / "shared"
-    if shared_dir.exists():
-        for comp_dir in sorted(shared_dir.iterdir()):
-            if comp_dir.is_dir():
-                comp_path = comp_dir / "COMPONENT.md"
-                errors = validate_component(comp_path)
-                all_errors.extend(errors)
-                status = "PASS" if not errors else "FAIL"
-                print(f"  {status} {comp_dir.name}")
-    else:
+    components = [r for r in results if r.target.kind == "component"]
+    for result in components:
+        all_errors.extend(result.errors)
+        print(f"  {'PASS' if result.passed else 'FAIL'} {result.target.label}")
+    if not components:
         print("  (no shared directory)")
 
     # Summary
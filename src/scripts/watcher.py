@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+EPCI File Watcher
+
+Reports changed paths under a directory tree, for deploy.py --watch.
+Uses Linux inotify through ctypes when available and falls back to
+periodic mtime/size polling everywhere else.
+
+Usage:
+    from watcher import make_watcher
+
+    watcher = make_watcher(src, ignore=make_ignore_patterns(src))
+    changed = watcher.wait(debounce=0.3)   # set of relative POSIX paths
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+# Ignore function with the shutil.copytree signature: (directory, names) -> ignored names
+IgnoreFunc = Callable[[str, list[str]], set[str]]
+
+# inotify constants (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+)
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _no_ignore(directory: str, names: list[str]) -> set[str]:
+    return set()
+
+
+class PollingWatcher:
+    """Detects changes by comparing (mtime_ns, size) snapshots of the tree."""
+
+    def __init__(self, root: Path, ignore: Optional[IgnoreFunc] = None, interval: float = 0.5):
+        self.root = Path(root)
+        self.ignore = ignore or _no_ignore
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            ignored = self.ignore(dirpath, dirnames + filenames)
+            dirnames[:] = [d for d in dirnames if d not in ignored]
+            base = Path(dirpath)
+            for name in filenames:
+                if name in ignored:
+                    continue
+                path = base / name
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                snapshot[path.relative_to(self.root).as_posix()] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def poll(self, timeout: float) -> set[str]:
+        """Wait up to timeout seconds and return the paths changed meanwhile."""
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {
+                rel for rel in current.keys() | self._snapshot.keys()
+                if current.get(rel) != self._snapshot.get(rel)
+            }
+            self._snapshot = current
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def wait(self, debounce: float = 0.3) -> set[str]:
+        """Block until something changes, then collect until debounce seconds pass quietly."""
+        changed = set()
+        while not changed:
+            changed = self.poll(self.interval)
+        while True:
+            more = self.poll(debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Recursive inotify watcher (Linux only)."""
+
+    def __init__(self, root: Path, ignore: Optional[IgnoreFunc] = None):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify is not available on this platform")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("libc does not provide inotify")
+
+        self.root = Path(root)
+        self.ignore = ignore or _no_ignore
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        try:
+            self._add_tree(self.root)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._dirs[wd] = directory
+
+    def _add_tree(self, top: Path) -> set[str]:
+        """Watch top and its subdirectories; return the files already inside."""
+        found = set()
+        for dirpath, dirnames, filenames in os.walk(top):
+            ignored = self.ignore(dirpath, dirnames + filenames)
+            dirnames[:] = [d for d in dirnames if d not in ignored]
+            self._add_watch(Path(dirpath))
+            for name in filenames:
+                if name not in ignored:
+                    found.add((Path(dirpath) / name).relative_to(self.root).as_posix())
+        return found
+
+    def poll(self, timeout: float) -> set[str]:
+        """Wait up to timeout seconds and return the paths changed meanwhile."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped: report the whole tree as changed
+                changed.add(".")
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            if not name or name in self.ignore(str(directory), [name]):
+                continue
+
+            path = directory / name
+            changed.add(path.relative_to(self.root).as_posix())
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                try:
+                    changed |= self._add_tree(path)
+                except OSError:
+                    pass  # Directory vanished before we could watch it
+        return changed
+
+    def wait(self, debounce: float = 0.3) -> set[str]:
+        """Block until something changes, then collect until debounce seconds pass quietly."""
+        changed = set()
+        while not changed:
+            changed = self.poll(1.0)
+        while True:
+            more = self.poll(debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def make_watcher(root: Path, ignore: Optional[IgnoreFunc] = None, poll_interval: float = 0.5, polling: bool = False):
+    """
+    Return an InotifyWatcher for root, or a PollingWatcher if inotify is
+    unavailable (non-Linux, missing libc symbol, watch limit reached) or
+    polling=True.
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(root, ignore=ignore)
+        except OSError:
+            pass
+    return PollingWatcher(root, ignore=ignore, interval=poll_interval)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of skill audit reports.
+
+An audit depends on the skill's own files (SKILL.md, steps/*.md,
+references/*.md), on the other skills under the skills root declaring the
+same name (uniqueness check) and on whether the files linked from SKILL.md
+exist. The cache key hashes the skill's files and the list of skills
+sharing its name, so editing one skill only invalidates the skills whose
+result can change; link targets are re-checked on every lookup. The whole
+cache is discarded when the audit code changes.
+
+Usage:
+    from audit_cache import AuditCache, audit_key
+
+    cache = AuditCache(cache_path)
+    key = audit_key(skill_path, SkillNameIndex.for_root(skills_root))
+    entry = cache.get(skill_path, key)     # None on miss
+    cache.put(skill_path, key, report_dict, probes)
+    cache.save()
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from path_index import PathIndex
+from skill_frontmatter import SkillNameIndex, read_frontmatter
+
+# Bump to invalidate every cached report
+AUDIT_CACHE_VERSION = 1
+
+# Sibling modules whose source is part of the rules fingerprint
+AUDIT_MODULES = (
+    "audit_skill.py", "validate_skill_output.py", "skill_frontmatter.py", "skill_corpus.py", "step_graph.py",
+    "path_index.py",
+)
+
+# Default cache location, relative to the project root
+CACHE_RELPATH = Path(".epci-cache") / "audit.json"
+
+
+def rules_fingerprint() -> str:
+    """Fingerprint of AUDIT_CACHE_VERSION and the source of the audit modules."""
+    digest = hashlib.sha256(str(AUDIT_CACHE_VERSION).encode())
+    script_dir = Path(__file__).parent
+    for name in AUDIT_MODULES + (Path(__file__).name,):
+        try:
+            digest.update((script_dir / name).read_bytes())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def _sha256(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def skill_inputs(skill_path: Path) -> dict[str, Optional[str]]:
+    """
+    Return relative path -> SHA-256 for every file an audit of skill_path reads.
+
+    The steps/ directory is recorded even when empty, since its presence
+    alone changes phases 5 and 6.
+    """
+    skill_path = Path(skill_path)
+    inputs = {"SKILL.md": _sha256(skill_path / "SKILL.md")}
+    for subdir in ("steps", "references"):
+        directory = skill_path / subdir
+        if not directory.is_dir():
+            continue
+        inputs[f"{subdir}/"] = "dir"
+        for path in sorted(directory.glob("*.md")):
+            inputs[f"{subdir}/{path.name}"] = _sha256(path)
+    return inputs
+
+
+def audit_key(skill_path: Path, name_index: SkillNameIndex) -> str:
+    """
+    Cache key for auditing skill_path.
+
+    Args:
+        skill_path: Skill directory
+        name_index: Name index of the root used by the uniqueness check
+    """
+    skill_md = Path(skill_path) / "SKILL.md"
+    try:
+        name = read_frontmatter(skill_md).name
+    except OSError:
+        name = ""
+    payload = {
+        "skill_path": str(Path(skill_path).resolve()),
+        "skills_root": str(name_index.skills_root),
+        "same_name": [str(p) for p in name_index.skills_named(name)] if name else [],
+        "inputs": skill_inputs(skill_path),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class AuditCache:
+    """
+    Persistent audit reports, keyed by skill path and audit_key().
+
+    Each entry also records the existence of the paths probed by the audit
+    (files linked from SKILL.md); an entry is only served if they are all
+    unchanged.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.fingerprint = rules_fingerprint()
+        self._entries: dict = {}
+        self._dirty = False
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(data, dict) and data.get("fingerprint") == self.fingerprint:
+            self._entries = data.get("entries", {})
+
+    def get(self, skill_path: Path, key: str, path_index: Optional[PathIndex] = None) -> Optional[dict]:
+        """
+        Return the cached report dict for skill_path, or None.
+
+        Args:
+            skill_path: Skill directory
+            key: audit_key() of the skill
+            path_index: Index answering the probed paths' existence (default: stat each path)
+        """
+        entry = self._entries.get(str(Path(skill_path).resolve()))
+        if not entry or entry.get("key") != key:
+            return None
+        exists = path_index.exists if path_index is not None else os.path.exists
+        for probed, existed in entry.get("probes", {}).items():
+            if exists(Path(probed)) != existed:
+                return None
+        return entry["report"]
+
+    def put(self, skill_path: Path, key: str, report: dict, probes: dict[str, bool]) -> None:
+        """Store the report dict of skill_path and the paths it probed."""
+        self._entries[str(Path(skill_path).resolve())] = {
+            "key": key,
+            "probes": probes,
+            "report": report,
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed (atomic replace)."""
+        stale = [p for p in self._entries if not (Path(p) / "SKILL.md").exists()]
+        for p in stale:
+            del self._entries[p]
+        if not (self._dirty or stale):
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"fingerprint": self.fingerprint, "entries": self._entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            return  # The cache is an optimization; never fail the audit on it
+        self._dirty = False
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+EPCI Audit Server - Long-running skill auditor for editor integration.
+
+Keeps the SkillCorpus and step graph of every skill under a skills root in
+memory and answers audit requests without interpreter startup or re-reading
+unchanged files. File-change notifications re-read only the changed files.
+Audits run the same SkillAuditor phases as audit_skill.py.
+
+Protocol: JSON-RPC 2.0, one JSON message per line, on stdin/stdout or on a
+Unix socket. Requests without an "id" are notifications and get no reply.
+
+Methods:
+    audit       {"skill_path": str, "phases": [int, ...]?}
+                                         -> report (same shape as audit_skill.py --json)
+    didChange   {"paths": [str, ...]}    -> {"reloaded": [skill_path, ...]}
+    status      {}                       -> {"skills_root", "skills", "audits", "uptime_seconds"}
+    shutdown    {}                       -> null, then the server exits
+
+Relative paths are resolved against the skills root.
+
+Usage:
+    python audit_server.py <skills_root>                   # JSON-RPC on stdio
+    python audit_server.py <skills_root> --socket PATH     # JSON-RPC on a Unix socket
+
+Example:
+    {"jsonrpc": "2.0", "id": 1, "method": "audit", "params": {"skill_path": "brainstorm"}}
+    {"jsonrpc": "2.0", "method": "didChange", "params": {"paths": ["brainstorm/steps/step-01-explore.md"]}}
+"""
+
+import argparse
+import json
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Optional, TextIO
+
+# Import from sibling modules
+from audit_skill import AuditPhase, SkillAuditor, discover_skills, report_to_dict
+from path_index import PathIndex
+from skill_corpus import SkillCorpus
+from skill_frontmatter import SkillNameIndex
+from step_graph import StepGraph
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RpcError(Exception):
+    """Error returned to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class AuditServer:
+    """In-memory skills of one skills root, audited on request."""
+
+    def __init__(self, skills_root: Path):
+        """
+        Load every skill under skills_root.
+
+        Args:
+            skills_root: Directory searched for SKILL.md files (core/ and stack/ included)
+        """
+        self.skills_root = Path(skills_root).resolve()
+        self.name_index = SkillNameIndex(self.skills_root)
+        self.path_index = PathIndex(self.skills_root)
+        self.corpora: dict[Path, SkillCorpus] = {}
+        self.graphs: dict[Path, StepGraph] = {}
+        self.audits = 0
+        self.started = time.monotonic()
+        self.shutdown_requested = False
+        self._rescan()
+
+        self._methods = {
+            "audit": self.audit,
+            "didChange": self.did_change,
+            "status": self.status,
+            "shutdown": self.shutdown,
+        }
+
+    def _rescan(self) -> set[Path]:
+        """Load added skills, drop removed ones and refresh the name index; return the added skills."""
+        skill_paths = {path.resolve() for path in discover_skills(self.skills_root)}
+        for skill_path in set(self.corpora) - skill_paths:
+            del self.corpora[skill_path]
+            self.graphs.pop(skill_path, None)
+        added = skill_paths - set(self.corpora)
+        for skill_path in sorted(added):
+            self.corpora[skill_path] = SkillCorpus(skill_path)
+        self.name_index.refresh()
+        return added
+
+    def _resolve(self, path: str) -> Path:
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.skills_root / path
+        path = path.resolve()
+        if not path.is_relative_to(self.skills_root):
+            raise RpcError(INVALID_PARAMS, f"Path is outside the skills root: {path}")
+        return path
+
+    def _owner(self, path: Path) -> Optional[Path]:
+        """The loaded skill directory containing path (or equal to it)."""
+        for candidate in (path, *path.parents):
+            if candidate in self.corpora:
+                return candidate
+            if candidate == self.skills_root:
+                return None
+        return None
+
+    # ------------------------------------------------------------------
+    # Methods
+    # ------------------------------------------------------------------
+
+    def audit(self, params: dict) -> dict:
+        """Audit one skill (all phases, or the given ones) from its in-memory files."""
+        skill_path = self._resolve(_param(params, "skill_path", str))
+        phases = None
+        if params.get("phases") is not None:
+            try:
+                phases = [AuditPhase(number) for number in _param(params, "phases", list)]
+            except ValueError:
+                raise RpcError(INVALID_PARAMS, "phases must be a list of phase numbers (1-6)") from None
+        start = time.perf_counter()
+
+        corpus = self.corpora.get(skill_path)
+        if corpus is None:
+            corpus = SkillCorpus(skill_path)
+            if corpus.document is not None:
+                self.corpora[skill_path] = corpus
+                self.name_index.update([corpus.skill_md])
+
+        auditor = SkillAuditor(
+            skill_path,
+            corpus=corpus,
+            name_index=self.name_index,
+            step_graph=self.graphs.get(skill_path),
+            path_index=self.path_index,
+        )
+        report = auditor.audit(phases)
+        if auditor.step_graph is not None and skill_path in self.corpora:
+            self.graphs[skill_path] = auditor.step_graph
+        self.audits += 1
+
+        return {**report_to_dict(report), "seconds": round(time.perf_counter() - start, 6)}
+
+    def did_change(self, params: dict) -> dict:
+        """
+        Apply file-change notifications.
+
+        A file of a loaded skill is re-read on its own (and the step graph
+        dropped if it is a step); a new or removed SKILL.md adds or drops its
+        skill; a change to any other directory rescans the skills root. Every
+        path is also applied to the existence index used by the links check.
+        """
+        paths = _param(params, "paths", list)
+        if not all(isinstance(raw, str) for raw in paths):
+            raise RpcError(INVALID_PARAMS, "paths must be a list of strings")
+        paths = [self._resolve(raw) for raw in paths]
+        self.path_index.update(paths)
+
+        reloaded: set[Path] = set()
+        skill_mds: list[Path] = []
+        rescan = False
+
+        for path in paths:
+            if path.name == "SKILL.md":
+                skill_mds.append(path)
+
+            skill_path = self._owner(path)
+            if skill_path is None:
+                if path.name == "SKILL.md" and path.is_file():
+                    self.corpora[path.parent] = SkillCorpus(path.parent)
+                    reloaded.add(path.parent)
+                elif path.name != "SKILL.md" and (path.is_dir() or not path.exists()):
+                    rescan = True
+                continue
+
+            corpus = self.corpora[skill_path]
+            if path == skill_path:
+                corpus = self.corpora[skill_path] = SkillCorpus(skill_path)
+                self.graphs.pop(skill_path, None)
+                skill_mds.append(corpus.skill_md)
+            elif not corpus.reload(path):
+                continue  # Not read by the audit (linked files are tracked by path_index)
+            elif path == corpus.steps_dir or path.parent == corpus.steps_dir:
+                self.graphs.pop(skill_path, None)
+            reloaded.add(skill_path)
+
+            if corpus.document is None:
+                del self.corpora[skill_path]
+                self.graphs.pop(skill_path, None)
+
+        if rescan:
+            self.path_index.refresh()
+            reloaded |= self._rescan()
+        elif skill_mds:
+            self.name_index.update(skill_mds)
+        return {"reloaded": sorted(str(path) for path in reloaded)}
+
+    def status(self, params: dict) -> dict:
+        """Loaded skills and request counters."""
+        return {
+            "skills_root": str(self.skills_root),
+            "skills": sorted(str(path) for path in self.corpora),
+            "audits": self.audits,
+            "uptime_seconds": round(time.monotonic() - self.started, 3),
+        }
+
+    def shutdown(self, params: dict) -> None:
+        """Stop serving after this reply."""
+        self.shutdown_requested = True
+        return None
+
+    # ------------------------------------------------------------------
+    # JSON-RPC
+    # ------------------------------------------------------------------
+
+    def handle(self, message: object) -> Optional[dict]:
+        """
+        Dispatch one JSON-RPC request.
+
+        Returns:
+            Response object, or None for notifications
+        """
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0" \
+                or not isinstance(message.get("method"), str):
+            return _error(None, INVALID_REQUEST, "Invalid JSON-RPC 2.0 request")
+
+        request_id = message.get("id")
+        try:
+            method = self._methods.get(message["method"])
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Unknown method: {message['method']}")
+            params = message.get("params", {})
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params must be an object")
+            result = method(params)
+        except RpcError as e:
+            response = _error(request_id, e.code, e.message)
+        except Exception as e:  # Keep serving: report the failure to the client
+            response = _error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+        else:
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+        return response if "id" in message else None
+
+    def handle_line(self, line: str) -> Optional[dict]:
+        """Decode one line of input and dispatch it."""
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError as e:
+            return _error(None, PARSE_ERROR, f"Parse error: {e}")
+        return self.handle(message)
+
+    def serve_stream(self, reader: TextIO, writer: TextIO) -> None:
+        """Answer line-delimited requests from reader until EOF or shutdown."""
+        for line in reader:
+            if not line.strip():
+                continue
+            response = self.handle_line(line)
+            if response is not None:
+                writer.write(json.dumps(response) + "\n")
+                writer.flush()
+            if self.shutdown_requested:
+                return
+
+    def serve_socket(self, socket_path: Path) -> None:
+        """Answer clients of a Unix socket, one connection at a time, until shutdown."""
+        if socket_path.exists():
+            socket_path.unlink()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(str(socket_path))
+            server.listen()
+            while not self.shutdown_requested:
+                conn, _ = server.accept()
+                with conn, conn.makefile("r", encoding="utf-8") as reader, \
+                        conn.makefile("w", encoding="utf-8") as writer:
+                    try:
+                        self.serve_stream(reader, writer)
+                    except (BrokenPipeError, ConnectionResetError):
+                        pass  # Client went away; wait for the next one
+        finally:
+            server.close()
+            if socket_path.exists():
+                socket_path.unlink()
+
+
+def _param(params: dict, name: str, expected: type):
+    value = params.get(name)
+    if not isinstance(value, expected):
+        raise RpcError(INVALID_PARAMS, f"Missing or invalid parameter: {name}")
+    return value
+
+
+def _error(request_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def main() -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="EPCI Audit Server - Long-running skill auditor (JSON-RPC 2.0)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s ../../                           # Serve on stdin/stdout
+  %(prog)s ../../ --socket /tmp/epci.sock   # Serve on a Unix socket
+        """
+    )
+    parser.add_argument(
+        "skills_root",
+        type=Path,
+        help="Directory containing the skills to keep loaded"
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Listen on this Unix socket instead of stdin/stdout"
+    )
+
+    args = parser.parse_args()
+    skills_root = args.skills_root.resolve()
+    if not skills_root.is_dir():
+        print(f"Error: Path is not a directory: {skills_root}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    server = AuditServer(skills_root)
+    print(
+        f"Loaded {len(server.corpora)} skills from {skills_root} "
+        f"in {(time.perf_counter() - start) * 1000:.1f} ms",
+        file=sys.stderr,
+    )
+
+    try:
+        if args.socket is not None:
+            print(f"Listening on {args.socket}", file=sys.stderr)
+            server.serve_socket(args.socket)
+        else:
+            server.serve_stream(sys.stdin, sys.stdout)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
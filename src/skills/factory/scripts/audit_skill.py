@@ -12,6 +12,14 @@ Validates that an existing skill respects all EPCI best practices:
 Usage:
     python audit_skill.py <skill_path>
     python audit_skill.py <skill_path> --json
+    python audit_skill.py --all <skills_root> [--workers N] [--json]
+    python audit_skill.py <skill_path> --no-cache     # Ignore .epci-cache/audit.json
+    python audit_skill.py <skill_path> --phases 5,6   # Run only the given phases
+    python audit_skill.py --all <skills_root> --stream ndjson|sarif
+
+Reports are cached in .epci-cache/audit.json, keyed by the content of every
+file the audit reads (see audit_cache.py), so unchanged skills are not
+re-audited. Partial audits (--phases) neither read nor fill the cache.
 
 Exit codes:
     0 = All checks pass (or pass with warnings)
@@ -20,17 +28,39 @@ Exit codes:
 
 import argparse
 import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
-
-# Import from sibling module
+from typing import Callable, Iterable, Optional
+
+# Import from sibling modules
+from audit_cache import CACHE_RELPATH, AuditCache, audit_key
+from path_index import PathIndex
+from report_stream import STREAM_FORMATS, CheckRecord, make_reporter
+from skill_corpus import PatternSet, SkillCorpus
+from skill_frontmatter import SkillDocument, SkillNameIndex
+from step_graph import StepGraph
 from validate_skill_output import SkillValidator, ValidationReport
 
 
+def default_cache_path() -> Optional[Path]:
+    """
+    <project root>/.epci-cache/audit.json, the project root being the parent
+    of the plugin directory (the one holding .claude-plugin/). None when this
+    script is not inside a plugin tree: caching is then disabled unless
+    --cache is given, rather than writing into the current directory.
+    """
+    for parent in Path(__file__).resolve().parents:
+        if (parent / ".claude-plugin").is_dir():
+            return parent.parent / CACHE_RELPATH
+    return None
+
+
 class AuditPhase(Enum):
     """Audit phases."""
     STRUCTURE = 1
@@ -98,6 +128,7 @@ class AuditReport:
     skill_path: Path
     user_invocable: bool
     phases: dict[AuditPhase, PhaseReport] = field(default_factory=dict)
+    step_graph: Optional[dict] = None  # StepGraph.to_dict() for skills with steps/
 
     @property
     def total_passed(self) -> int:
@@ -128,6 +159,29 @@ class AuditReport:
         return "PASS"
 
 
+@dataclass
+class BatchAuditReport:
+    """Combined report for every skill under a skills root (--all)."""
+    skills_root: Path
+    reports: list[AuditReport] = field(default_factory=list)
+    durations: list[float] = field(default_factory=list)  # Seconds, parallel to reports
+    cached: list[bool] = field(default_factory=list)  # Served from cache, parallel to reports
+    total_seconds: float = 0.0
+    workers: int = 1
+
+    @property
+    def has_errors(self) -> bool:
+        return any(r.has_errors for r in self.reports)
+
+    @property
+    def failed_count(self) -> int:
+        return sum(1 for r in self.reports if r.has_errors)
+
+    @property
+    def warning_count(self) -> int:
+        return sum(r.warning_count for r in self.reports)
+
+
 class SkillAuditor:
     """Orchestrates complete skill audit across all phases."""
 
@@ -171,6 +225,28 @@ class SkillAuditor:
         },
     }
 
+    # Core skills checked when a user skill has no entry in CORE_SKILLS_REQUIREMENTS
+    DEFAULT_REQUIRED_CORE_SKILLS = ["breakpoint-system", "project-memory"]
+
+    # Search patterns used by phases 2 and 3
+    BREAKPOINT_SYSTEM_PATTERN = r"@skill:epci:breakpoint-system|epci:breakpoint-system"
+    BREAKPOINT_TYPE_PATTERN = r"type:\s*[\"']?(\w+(?:-\w+)*)[\"']?"
+
+    # Patterns searched in SKILL.md only by phase 4
+    STACK_AUTO_DETECT_PATTERN = r"auto-detect(?:s|ion)?.*(?:stack|technology|framework)"
+    STACK_SELF_DETECT_PATTERN = r"this skill.*detect|detect.*automatically"
+
+    # Corpus views (SkillCorpus.VIEWS) read by each phase; an audit loads only
+    # the views of its selected phases
+    PHASE_VIEWS = {
+        AuditPhase.STRUCTURE: ("skill", "steps"),
+        AuditPhase.BREAKPOINTS: ("skill", "steps", "references"),
+        AuditPhase.CORE_SKILLS: ("skill", "steps", "references"),
+        AuditPhase.STACK_SKILLS: ("skill",),
+        AuditPhase.STEP_CHAIN: ("skill", "steps"),
+        AuditPhase.TASK_TOOL: ("steps",),
+    }
+
     # Stack detection patterns
     STACK_PATTERNS = {
         "python-django": {
@@ -195,114 +271,126 @@ class SkillAuditor:
         }
     }
 
-    def __init__(self, skill_path: Path):
+    def __init__(
+        self,
+        skill_path: Path,
+        corpus: Optional[SkillCorpus] = None,
+        name_index: Optional[SkillNameIndex] = None,
+        step_graph: Optional[StepGraph] = None,
+        path_index: Optional[PathIndex] = None,
+    ):
         """
         Initialize auditor.
 
         Args:
             skill_path: Path to skill directory (containing SKILL.md)
+            corpus: Already loaded skill files to audit instead of reading from disk
+            name_index: Name index for the uniqueness check (default: shared per-process index)
+            step_graph: Step graph of corpus, if already built
+            path_index: Existence index for the links check (default: shared per-process index)
         """
         self.skill_path = Path(skill_path).resolve()
         self.skill_md = self.skill_path / "SKILL.md"
         self.steps_dir = self.skill_path / "steps"
         self.references_dir = self.skill_path / "references"
 
-        # Parsed content
-        self._content: str = ""
+        # Skill files, loaded once by _load_skill() and shared by all phases
+        self.corpus: Optional[SkillCorpus] = corpus
+        self.name_index = name_index
+        self.step_graph: Optional[StepGraph] = step_graph
+        self.path_index = path_index
+        self._search_hits: dict[str, list[tuple[Path, str]]] = {}
+
+        # Paths whose existence the audit checked (path -> exists), for caching
+        self.probed_paths: dict[str, bool] = {}
+        self._doc: Optional[SkillDocument] = None
         self._frontmatter: dict = {}
-        self._body: str = ""
 
         # Report
         self.report: Optional[AuditReport] = None
 
     def _load_skill(self) -> bool:
-        """Load and parse SKILL.md. Returns False if file doesn't exist."""
-        if not self.skill_md.exists():
+        """Load SKILL.md, steps/ and references/. Returns False if SKILL.md doesn't exist."""
+        if self.corpus is None:
+            self.corpus = SkillCorpus(self.skill_path)
+        if self.corpus.document is None:
             return False
 
-        self._content = self.skill_md.read_text(encoding="utf-8")
+        self._doc = self.corpus.document
+        self._frontmatter = self._doc.frontmatter.fields
+        return True
 
-        # Parse frontmatter
-        if self._content.startswith("---"):
-            parts = self._content.split("---", 2)
-            if len(parts) >= 3:
-                self._parse_frontmatter(parts[1])
-                self._body = parts[2]
-            else:
-                self._body = self._content
-        else:
-            self._body = self._content
+    @property
+    def _content(self) -> str:
+        """Full SKILL.md text (read on first access)."""
+        return self._doc.content if self._doc else ""
 
-        return True
+    @property
+    def _body(self) -> str:
+        """SKILL.md text after the frontmatter (read on first access)."""
+        return self._doc.body if self._doc else ""
 
-    def _parse_frontmatter(self, frontmatter_text: str) -> None:
-        """Parse YAML frontmatter into dict."""
-        self._frontmatter = {}
-        current_key = None
-        current_value_lines = []
-
-        for line in frontmatter_text.strip().split("\n"):
-            if ":" in line and not line.startswith(" ") and not line.startswith("\t"):
-                if current_key and current_value_lines:
-                    self._frontmatter[current_key] = " ".join(current_value_lines).strip()
-
-                key, _, value = line.partition(":")
-                current_key = key.strip()
-                value = value.strip()
-
-                if value in (">-", "|", ">"):
-                    current_value_lines = []
-                else:
-                    self._frontmatter[current_key] = value
-                    current_key = None
-                    current_value_lines = []
-            elif current_key:
-                current_value_lines.append(line.strip())
-
-        if current_key and current_value_lines:
-            self._frontmatter[current_key] = " ".join(current_value_lines).strip()
+    @staticmethod
+    def _core_skill_pattern(core_skill: str) -> str:
+        return rf"epci:{core_skill}|@skill:epci:{core_skill}|`{core_skill}`"
+
+    def _prefetch_searches(self, phases: list[AuditPhase]) -> None:
+        """
+        Search every pattern of the selected phases among 2 and 3 in one pass per file.
+
+        Results are kept in _search_hits and served by _search_pattern().
+        """
+        patterns = []
+        if AuditPhase.BREAKPOINTS in phases:
+            patterns += [self.BREAKPOINT_SYSTEM_PATTERN, self.BREAKPOINT_TYPE_PATTERN]
+        if AuditPhase.CORE_SKILLS in phases:
+            core_skills = list(self.DEFAULT_REQUIRED_CORE_SKILLS)
+            for requirements in self.CORE_SKILLS_REQUIREMENTS.values():
+                core_skills += requirements["required"] + requirements["optional"]
+            patterns += [self._core_skill_pattern(core_skill) for core_skill in core_skills]
+        if patterns:
+            self._search_hits = self.corpus.search(PatternSet(patterns))
 
     def _search_pattern(self, pattern: str, include_steps: bool = True) -> list[tuple[Path, str]]:
         """
         Search for a regex pattern in skill files.
 
+        Patterns prefetched by _prefetch_searches() are answered without
+        scanning the files again.
+
         Returns list of (file_path, matched_text) tuples.
         """
+        if include_steps and pattern in self._search_hits:
+            return list(self._search_hits[pattern])
+
         matches = []
         regex = re.compile(pattern, re.IGNORECASE)
 
-        # Search SKILL.md
-        for match in regex.finditer(self._content):
-            matches.append((self.skill_md, match.group()))
-
-        # Search steps/
-        if include_steps and self.steps_dir.exists():
-            for step_file in self.steps_dir.glob("*.md"):
-                try:
-                    content = step_file.read_text(encoding="utf-8")
-                    for match in regex.finditer(content):
-                        matches.append((step_file, match.group()))
-                except (OSError, UnicodeDecodeError):
-                    pass
-
-        # Search references/
-        if self.references_dir.exists():
-            for ref_file in self.references_dir.glob("*.md"):
-                try:
-                    content = ref_file.read_text(encoding="utf-8")
-                    for match in regex.finditer(content):
-                        matches.append((ref_file, match.group()))
-                except (OSError, UnicodeDecodeError):
-                    pass
+        # Search SKILL.md, steps/ (optional) and references/
+        for corpus_file in self.corpus.files(include_steps=include_steps):
+            for match in regex.finditer(corpus_file.text):
+                matches.append((corpus_file.path, match.group()))
 
         return matches
 
-    def audit(self) -> AuditReport:
+    def audit(
+        self,
+        phases: Optional[Iterable[AuditPhase]] = None,
+        on_result: Optional[Callable[[AuditReport, AuditResult], None]] = None,
+    ) -> AuditReport:
         """
-        Run complete audit across all phases.
+        Run the audit across the selected phases.
+
+        Only the corpus views the selected phases declare in PHASE_VIEWS are
+        read.
+
+        Args:
+            phases: Phases to run (default: all)
+            on_result: Called with (report, result) for the results of each
+                phase as soon as the phase completes
 
         Returns:
-            AuditReport with all results
+            AuditReport with the results of the selected phases
         """
         if not self._load_skill():
             # Create minimal report for missing skill
@@ -321,6 +409,8 @@ class SkillAuditor:
                 severity=Severity.ERROR
             ))
             self.report.phases[AuditPhase.STRUCTURE] = phase_report
+            if on_result is not None:
+                on_result(self.report, phase_report.results[0])
             return self.report
 
         skill_name = self._frontmatter.get("name", self.skill_path.name)
@@ -332,13 +422,24 @@ class SkillAuditor:
             user_invocable=user_invocable
         )
 
-        # Run all phases
-        self.report.phases[AuditPhase.STRUCTURE] = self._run_phase_1_structure()
-        self.report.phases[AuditPhase.BREAKPOINTS] = self._run_phase_2_breakpoints()
-        self.report.phases[AuditPhase.CORE_SKILLS] = self._run_phase_3_core_skills()
-        self.report.phases[AuditPhase.STACK_SKILLS] = self._run_phase_4_stack_skills()
-        self.report.phases[AuditPhase.STEP_CHAIN] = self._run_phase_5_step_chain()
-        self.report.phases[AuditPhase.TASK_TOOL] = self._run_phase_6_task_tool()
+        runners = {
+            AuditPhase.STRUCTURE: self._run_phase_1_structure,
+            AuditPhase.BREAKPOINTS: self._run_phase_2_breakpoints,
+            AuditPhase.CORE_SKILLS: self._run_phase_3_core_skills,
+            AuditPhase.STACK_SKILLS: self._run_phase_4_stack_skills,
+            AuditPhase.STEP_CHAIN: self._run_phase_5_step_chain,
+            AuditPhase.TASK_TOOL: self._run_phase_6_task_tool,
+        }
+        selected = sorted(set(AuditPhase if phases is None else phases), key=lambda phase: phase.value)
+
+        # Run the selected phases, reading only the files they need
+        self.corpus.load({view for phase in selected for view in self.PHASE_VIEWS[phase]})
+        self._prefetch_searches(selected)
+        for phase in selected:
+            self.report.phases[phase] = runners[phase]()
+            if on_result is not None:
+                for result in self.report.phases[phase].results:
+                    on_result(self.report, result)
 
         return self.report
 
@@ -349,9 +450,12 @@ class SkillAuditor:
         """Phase 1: Structure validation using 12-point checklist."""
         phase_report = PhaseReport(phase=AuditPhase.STRUCTURE)
 
-        # Reuse existing validator
-        validator = SkillValidator(self.skill_path)
+        # Reuse existing validator on the already loaded files
+        validator = SkillValidator(
+            self.skill_path, corpus=self.corpus, name_index=self.name_index, path_index=self.path_index
+        )
         validation_report = validator.validate_all(permissive=True)
+        self.probed_paths.update(validator.probed_paths)
 
         # Convert ValidationResult to AuditResult, with special handling for name format
         for result in validation_report.results:
@@ -402,9 +506,7 @@ class SkillAuditor:
 
         # Check 2.1: User-invocable skill should use breakpoint-system
         if self.report.user_invocable:
-            uses_breakpoint = bool(self._search_pattern(
-                r"@skill:epci:breakpoint-system|epci:breakpoint-system"
-            ))
+            uses_breakpoint = bool(self._search_pattern(self.BREAKPOINT_SYSTEM_PATTERN))
             phase_report.results.append(AuditResult(
                 phase=AuditPhase.BREAKPOINTS,
                 check_id="P2.1",
@@ -419,13 +521,13 @@ class SkillAuditor:
             ))
 
         # Check 2.2: Breakpoint types in allowed list
-        type_matches = self._search_pattern(r"type:\s*[\"']?(\w+(?:-\w+)*)[\"']?")
+        type_matches = self._search_pattern(self.BREAKPOINT_TYPE_PATTERN)
         found_types = set()
         invalid_types = []
 
         for _, match_text in type_matches:
             # Extract type value
-            type_match = re.search(r"type:\s*[\"']?(\w+(?:-\w+)*)[\"']?", match_text)
+            type_match = re.search(self.BREAKPOINT_TYPE_PATTERN, match_text)
             if type_match:
                 type_value = type_match.group(1)
                 # Skip common non-breakpoint types
@@ -488,17 +590,12 @@ class SkillAuditor:
         ]
         manual_boxes = []
         for pattern in ascii_box_patterns:
-            if self.steps_dir.exists():
-                for step_file in self.steps_dir.glob("*.md"):
-                    try:
-                        content = step_file.read_text(encoding="utf-8")
-                        # Check for boxes that seem to be interactive (have options/choices)
-                        if re.search(pattern, content, re.DOTALL):
-                            # Check if it's near AskUserQuestion or option patterns
-                            if re.search(r"option|choice|select|proceed|cancel", content, re.IGNORECASE):
-                                manual_boxes.append(step_file.name)
-                    except (OSError, UnicodeDecodeError):
-                        pass
+            for step_file in self.corpus.steps:
+                # Check for boxes that seem to be interactive (have options/choices)
+                if re.search(pattern, step_file.text, re.DOTALL):
+                    # Check if it's near AskUserQuestion or option patterns
+                    if re.search(r"option|choice|select|proceed|cancel", step_file.text, re.IGNORECASE):
+                        manual_boxes.append(step_file.name)
 
         if self.report.user_invocable:
             phase_report.results.append(AuditResult(
@@ -543,13 +640,11 @@ class SkillAuditor:
 
         if not required_skills:
             # Unknown user skill - check for basic breakpoint-system usage
-            required_skills = ["breakpoint-system", "project-memory"]
+            required_skills = self.DEFAULT_REQUIRED_CORE_SKILLS
 
         # Check required core skills
         for idx, core_skill in enumerate(required_skills, 1):
-            found = bool(self._search_pattern(
-                rf"epci:{core_skill}|@skill:epci:{core_skill}|`{core_skill}`"
-            ))
+            found = bool(self._search_pattern(self._core_skill_pattern(core_skill)))
             phase_report.results.append(AuditResult(
                 phase=AuditPhase.CORE_SKILLS,
                 check_id=f"P3.{idx}",
@@ -565,9 +660,7 @@ class SkillAuditor:
 
         # Check optional core skills (warnings only)
         for idx, core_skill in enumerate(optional_skills, len(required_skills) + 1):
-            found = bool(self._search_pattern(
-                rf"epci:{core_skill}|@skill:epci:{core_skill}|`{core_skill}`"
-            ))
+            found = bool(self._search_pattern(self._core_skill_pattern(core_skill)))
             phase_report.results.append(AuditResult(
                 phase=AuditPhase.CORE_SKILLS,
                 check_id=f"P3.{idx}",
@@ -587,23 +680,23 @@ class SkillAuditor:
         """Phase 4: Stack skills detection and recommendations."""
         phase_report = PhaseReport(phase=AuditPhase.STACK_SKILLS)
 
+        # All phase 4 patterns in one pass over SKILL.md
+        stack_patterns = {stack_name: rf"epci:{stack_name}" for stack_name in self.STACK_PATTERNS}
+        hits = PatternSet([
+            *stack_patterns.values(),
+            self.STACK_AUTO_DETECT_PATTERN,
+            self.STACK_SELF_DETECT_PATTERN,
+        ]).search(self._content)
+
         # Check declared stack skills in Shared Components or Subagents
-        declared_stacks = []
-        for stack_name in self.STACK_PATTERNS:
-            if re.search(rf"epci:{stack_name}", self._content, re.IGNORECASE):
-                declared_stacks.append(stack_name)
+        declared_stacks = [name for name, pattern in stack_patterns.items() if hits[pattern]]
 
         # Check if skill explicitly mentions auto-detection as a feature IT provides
         # (not just references to stack skills in documentation)
-        has_stack_auto_detect = bool(re.search(
-            r"auto-detect(?:s|ion)?.*(?:stack|technology|framework)",
-            self._content,
-            re.IGNORECASE
-        )) and bool(re.search(
-            r"this skill.*detect|detect.*automatically",
-            self._content,
-            re.IGNORECASE
-        ))
+        has_stack_auto_detect = (
+            bool(hits[self.STACK_AUTO_DETECT_PATTERN])
+            and bool(hits[self.STACK_SELF_DETECT_PATTERN])
+        )
 
         if declared_stacks:
             # Skill declares stack skills - validate they exist
@@ -648,7 +741,7 @@ class SkillAuditor:
         phase_report = PhaseReport(phase=AuditPhase.STEP_CHAIN)
 
         # Skip if no steps directory
-        if not self.steps_dir.exists():
+        if not self.corpus.has_steps:
             if self.report.user_invocable:
                 # Check if this might be a --simple skill (acceptable)
                 has_workflow_in_skill = bool(re.search(
@@ -684,7 +777,7 @@ class SkillAuditor:
             return phase_report
 
         # Check 5.1: step-00-*.md exists
-        step_00_files = list(self.steps_dir.glob("step-00-*.md"))
+        step_00_files = [p for p in self.corpus.step_paths if p.name.startswith("step-00-")]
         phase_report.results.append(AuditResult(
             phase=AuditPhase.STEP_CHAIN,
             check_id="P5.1",
@@ -701,29 +794,38 @@ class SkillAuditor:
 
         # Build step graph
         step_graph = self._build_step_graph()
-        all_steps = set(step_graph.keys())
+        all_steps = set(step_graph.steps)
+        entry = step_00_files[0].stem if step_00_files else None
 
         # Find the highest numbered step (likely the final step)
         step_numbers = []
-        for step_name in step_graph.keys():
+        for step_name in step_graph.steps:
             match = re.match(r"step-(\d{2})", step_name)
             if match:
                 step_numbers.append((int(match.group(1)), step_name))
         max_step_name = max(step_numbers, key=lambda x: x[0])[1] if step_numbers else None
 
+        # Final steps: step-99, highest numbered step, or explicitly marked as final
+        final_steps = [
+            step_name for step_name in step_graph.steps
+            if (
+                re.match(r"step-99-", step_name) or
+                "final" in step_name.lower() or
+                "generation" in step_name.lower() or
+                "finish" in step_name.lower() or
+                step_name == max_step_name
+            )
+        ]
+        self.report.step_graph = step_graph.to_dict(
+            entry, finals=set(final_steps) | set(step_graph.terminals())
+        )
+
         # Check 5.2: Each step has next_step or conditional_next
         steps_without_next = []
-        for step_name, step_info in step_graph.items():
-            if not step_info["next_step"] and not step_info["conditional_next"]:
-                # Allow final steps (step-99, highest numbered step, or explicitly marked as final)
-                is_final = (
-                    re.match(r"step-99-", step_name) or
-                    "final" in step_name.lower() or
-                    "generation" in step_name.lower() or
-                    "finish" in step_name.lower() or
-                    step_name == max_step_name
-                )
-                if not is_final:
+        for step_name in step_graph.steps:
+            if not step_graph.declares_next[step_graph.ids[step_name]]:
+                # Allow final steps
+                if step_name not in final_steps:
                     steps_without_next.append(step_name)
 
         phase_report.results.append(AuditResult(
@@ -743,16 +845,11 @@ class SkillAuditor:
         ))
 
         # Check 5.3: No orphan steps (not referenced by any other step)
-        referenced_steps = set()
-        for step_info in step_graph.values():
-            if step_info["next_step"]:
-                referenced_steps.add(step_info["next_step"])
-            for cond_next in step_info["conditional_next"]:
-                referenced_steps.add(cond_next)
+        referenced_steps = step_graph.referenced()
 
         # step-00 shouldn't be referenced (it's the entry point)
         orphan_steps = []
-        for step_name in all_steps:
+        for step_name in step_graph.steps:
             if step_name not in referenced_steps and not step_name.startswith("step-00"):
                 orphan_steps.append(step_name)
 
@@ -773,9 +870,8 @@ class SkillAuditor:
         ))
 
         # Check 5.4: Chain completeness (can reach from step-00 to a terminal)
-        if step_00_files:
-            reachable = self._get_reachable_steps(step_graph, step_00_files[0].stem)
-            unreachable = all_steps - reachable
+        if entry:
+            unreachable = self.report.step_graph["unreachable"]
 
             phase_report.results.append(AuditResult(
                 phase=AuditPhase.STEP_CHAIN,
@@ -795,7 +891,7 @@ class SkillAuditor:
 
         # Check 5.5: Step naming convention
         invalid_names = []
-        for step_file in self.steps_dir.glob("*.md"):
+        for step_file in self.corpus.step_paths:
             if not re.match(r"step-\d{2}[a-z]?-[\w-]+\.md", step_file.name):
                 invalid_names.append(step_file.name)
 
@@ -815,85 +911,46 @@ class SkillAuditor:
             ) if invalid_names else None
         ))
 
-        return phase_report
-
-    def _build_step_graph(self) -> dict:
-        """Build a graph of step transitions."""
-        graph = {}
-
-        for step_file in self.steps_dir.glob("step-*.md"):
-            try:
-                content = step_file.read_text(encoding="utf-8")
-                step_name = step_file.stem
-
-                # Find all step references in the file
-                all_step_refs = set()
-
-                # Pattern 1: Direct reference → `step-XX-name.md`
-                direct_refs = re.findall(r"→\s*`?(step-\d{2}[a-z]?-[\w-]+)", content)
-                all_step_refs.update(direct_refs)
-
-                # Pattern 2: Table format | → `step-XX-name.md` |
-                table_refs = re.findall(r"\|\s*→?\s*`?(step-\d{2}[a-z]?-[\w-]+)", content)
-                all_step_refs.update(table_refs)
-
-                # Pattern 3: next_step: step-XX-name.md
-                next_step_refs = re.findall(r"next_step[:\s]+`?(step-\d{2}[a-z]?-[\w-]+)", content, re.IGNORECASE)
-                all_step_refs.update(next_step_refs)
-
-                # Pattern 4: Any backtick reference to a step file
-                backtick_refs = re.findall(r"`(step-\d{2}[a-z]?-[\w-]+)(?:\.md)?`", content)
-                all_step_refs.update(backtick_refs)
-
-                # Determine primary next_step (first direct reference after "## Next Step")
-                next_step = None
-                next_step_section = re.search(r"##\s*Next\s*Step.*?(?=##|\Z)", content, re.IGNORECASE | re.DOTALL)
-                if next_step_section:
-                    section_text = next_step_section.group()
-                    section_refs = re.findall(r"(step-\d{2}[a-z]?-[\w-]+)", section_text)
-                    if section_refs:
-                        next_step = section_refs[0]
-
-                # All other references are conditional
-                conditional_next = list(all_step_refs - {next_step} if next_step else all_step_refs)
-
-                graph[step_name] = {
-                    "next_step": next_step,
-                    "conditional_next": conditional_next
-                }
-
-            except (OSError, UnicodeDecodeError):
-                pass
-
-        return graph
-
-    def _get_reachable_steps(self, graph: dict, start: str) -> set:
-        """Get all steps reachable from start using BFS."""
-        reachable = set()
-        queue = [start]
-
-        while queue:
-            current = queue.pop(0)
-            if current in reachable:
-                continue
-            reachable.add(current)
+        # Check 5.6: Every reachable step can still reach a final step (no closed loop)
+        if entry:
+            dead_ends = self.report.step_graph["dead_ends"]
+            loops = [
+                cycle for cycle in self.report.step_graph["cycles"]
+                if set(cycle) & set(dead_ends)
+            ]
+            phase_report.results.append(AuditResult(
+                phase=AuditPhase.STEP_CHAIN,
+                check_id="P5.6",
+                name="No dead-end loops",
+                passed=len(dead_ends) == 0,
+                message=(
+                    "Every reachable step leads to a final step"
+                    if not dead_ends
+                    else (
+                        f"Steps that can never reach a final step: {', '.join(dead_ends)}"
+                        + "".join(f"; loop between {', '.join(cycle)}" for cycle in loops)
+                    )
+                ),
+                severity=Severity.WARNING,
+                suggestion=(
+                    "Add an exit (next_step) out of the loop towards a final step"
+                ) if dead_ends else None
+            ))
 
-            if current in graph:
-                step_info = graph[current]
-                if step_info["next_step"] and step_info["next_step"] not in reachable:
-                    queue.append(step_info["next_step"])
-                for cond_next in step_info["conditional_next"]:
-                    if cond_next not in reachable:
-                        queue.append(cond_next)
+        return phase_report
 
-        return reachable
+    def _build_step_graph(self) -> StepGraph:
+        """Graph of step transitions of the loaded step-*.md files (built once)."""
+        if self.step_graph is None:
+            self.step_graph = StepGraph.from_files((f.stem, f.text) for f in self.corpus.step_chain_files)
+        return self.step_graph
 
     def _run_phase_6_task_tool(self) -> PhaseReport:
         """Phase 6: Task Tool Compliance - check delegated phases use explicit Task invocations."""
         phase_report = PhaseReport(phase=AuditPhase.TASK_TOOL)
 
         # Skip if no steps directory (simple skill)
-        if not self.steps_dir.exists():
+        if not self.corpus.has_steps:
             phase_report.results.append(AuditResult(
                 phase=AuditPhase.TASK_TOOL,
                 check_id="P6.0",
@@ -917,31 +974,27 @@ class SkillAuditor:
 
         # Check each step file for agent references
         issues = []
-        for step_file in self.steps_dir.glob("step-*.md"):
-            try:
-                content = step_file.read_text(encoding="utf-8")
-                step_name = step_file.stem
-
-                for agent_ref, agent_type in delegable_agents:
-                    if agent_ref in content:
-                        # Check for proper Task invocation
-                        has_task_invocation = (
-                            f'subagent_type: "{agent_type}"' in content or
-                            f"subagent_type: '{agent_type}'" in content or
-                            f'subagent_type="{agent_type}"' in content or
-                            f"subagent_type='{agent_type}'" in content or
-                            f'subagent_type: {agent_type}' in content
-                        )
-
-                        if not has_task_invocation:
-                            issues.append({
-                                "step": step_name,
-                                "agent": agent_ref,
-                                "type": agent_type
-                            })
-
-            except (OSError, UnicodeDecodeError):
-                pass
+        for step_file in self.corpus.step_chain_files:
+            content = step_file.text
+            step_name = step_file.stem
+
+            for agent_ref, agent_type in delegable_agents:
+                if agent_ref in content:
+                    # Check for proper Task invocation
+                    has_task_invocation = (
+                        f'subagent_type: "{agent_type}"' in content or
+                        f"subagent_type: '{agent_type}'" in content or
+                        f'subagent_type="{agent_type}"' in content or
+                        f"subagent_type='{agent_type}'" in content or
+                        f'subagent_type: {agent_type}' in content
+                    )
+
+                    if not has_task_invocation:
+                        issues.append({
+                            "step": step_name,
+                            "agent": agent_ref,
+                            "type": agent_type
+                        })
 
         # Report results
         if issues:
@@ -960,18 +1013,11 @@ class SkillAuditor:
                 ))
         else:
             # Check if skill uses any delegable agents at all
-            uses_delegable = False
-            for step_file in self.steps_dir.glob("step-*.md"):
-                try:
-                    content = step_file.read_text(encoding="utf-8")
-                    for agent_ref, _ in delegable_agents:
-                        if agent_ref in content:
-                            uses_delegable = True
-                            break
-                    if uses_delegable:
-                        break
-                except (OSError, UnicodeDecodeError):
-                    pass
+            uses_delegable = any(
+                agent_ref in step_file.text
+                for step_file in self.corpus.step_chain_files
+                for agent_ref, _ in delegable_agents
+            )
 
             if uses_delegable:
                 phase_report.results.append(AuditResult(
@@ -1060,8 +1106,8 @@ def print_ascii_report(report: AuditReport) -> None:
         print("+" + "-" * (width - 2) + "+")
 
 
-def print_json_report(report: AuditReport) -> None:
-    """Print audit report in JSON format."""
+def report_to_dict(report: AuditReport) -> dict:
+    """Convert an audit report to a JSON-serializable dict."""
     output = {
         "skill_name": report.skill_name,
         "skill_path": str(report.skill_path),
@@ -1091,9 +1137,348 @@ def print_json_report(report: AuditReport) -> None:
             ]
         }
 
+    if report.step_graph is not None:
+        output["step_graph"] = report.step_graph
+
+    return output
+
+
+def report_from_dict(data: dict) -> AuditReport:
+    """Rebuild an audit report from report_to_dict() output."""
+    report = AuditReport(
+        skill_name=data["skill_name"],
+        skill_path=Path(data["skill_path"]),
+        user_invocable=data["user_invocable"],
+        step_graph=data.get("step_graph"),
+    )
+    for phase_name, phase_data in data["phases"].items():
+        phase = AuditPhase[phase_name]
+        report.phases[phase] = PhaseReport(phase=phase, results=[
+            AuditResult(
+                phase=phase,
+                check_id=r["check_id"],
+                name=r["name"],
+                passed=r["passed"],
+                message=r["message"],
+                severity=Severity(r["severity"]),
+                suggestion=r["suggestion"],
+            )
+            for r in phase_data["results"]
+        ])
+    return report
+
+
+def parse_phases(value: str) -> list[AuditPhase]:
+    """
+    Parse a --phases value such as "2,5" into audit phases.
+
+    Raises:
+        argparse.ArgumentTypeError: If an item is not a phase number (1-6)
+    """
+    phases = []
+    for item in value.split(","):
+        try:
+            phases.append(AuditPhase(int(item)))
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"invalid phase {item.strip()!r} (expected numbers 1-{len(AuditPhase)}, e.g. 2,5)"
+            ) from None
+    return phases
+
+
+def print_json_report(report: AuditReport) -> None:
+    """Print audit report in JSON format."""
+    print(json.dumps(report_to_dict(report), indent=2))
+
+
+def discover_skills(skills_root: Path) -> list[Path]:
+    """Return every directory under skills_root holding a SKILL.md (core/ and stack/ included)."""
+    return sorted(skill_md.parent for skill_md in Path(skills_root).rglob("SKILL.md"))
+
+
+def _audit_timed(
+    skill_path: Path,
+    phases: Optional[list[AuditPhase]] = None,
+) -> tuple[AuditReport, float, dict[str, bool]]:
+    """Audit one skill; return its report, the time it took and the paths it probed (pool worker)."""
+    start = time.perf_counter()
+    auditor = SkillAuditor(skill_path)
+    report = auditor.audit(phases)
+    return report, time.perf_counter() - start, auditor.probed_paths
+
+
+def _cache_lookup(cache: AuditCache, skill_path: Path) -> tuple[str, Optional[dict]]:
+    """audit_key() of skill_path and its cache entry, using the shared indexes of its skills root."""
+    skills_root = SkillValidator(skill_path).skills_root
+    key = audit_key(skill_path, SkillNameIndex.for_root(skills_root))
+    return key, cache.get(skill_path, key, PathIndex.for_root(skills_root))
+
+
+def _is_full_audit(phases: Optional[Iterable[AuditPhase]]) -> bool:
+    return phases is None or set(phases) == set(AuditPhase)
+
+
+def audit_skill_cached(
+    skill_path: Path,
+    cache: Optional[AuditCache] = None,
+    phases: Optional[list[AuditPhase]] = None,
+    on_result: Optional[Callable[[AuditReport, AuditResult], None]] = None,
+) -> tuple[AuditReport, bool]:
+    """
+    Audit one skill, serving the report from cache when its inputs are unchanged.
+
+    The cache holds full reports only. A partial audit (phases) bypasses it:
+    its key covers the whole skills tree (name and path indexes, every input
+    file), which costs more than the few phases it would save. on_result is
+    passed to SkillAuditor.audit(), or replayed over a cached report.
+
+    Returns:
+        (report, cached) where cached is True if the report came from the cache
+    """
+    if cache is None or not _is_full_audit(phases):
+        return SkillAuditor(skill_path).audit(phases, on_result), False
+
+    key, entry = _cache_lookup(cache, skill_path)
+    if entry is not None:
+        report = report_from_dict(entry)
+        if on_result is not None:
+            for phase_report in report.phases.values():
+                for result in phase_report.results:
+                    on_result(report, result)
+        return report, True
+
+    auditor = SkillAuditor(skill_path)
+    report = auditor.audit(phases, on_result)
+    cache.put(skill_path, key, report_to_dict(report), auditor.probed_paths)
+    cache.save()
+    return report, False
+
+
+def audit_all(
+    skills_root: Path,
+    workers: Optional[int] = None,
+    cache: Optional[AuditCache] = None,
+    phases: Optional[list[AuditPhase]] = None,
+    on_report: Optional[Callable[[AuditReport, float, bool], None]] = None,
+) -> BatchAuditReport:
+    """
+    Audit every skill under skills_root across a process pool.
+
+    Skills whose cache entry is still valid are not re-audited; only the
+    others are sent to the pool.
+
+    Args:
+        skills_root: Directory to search for SKILL.md files
+        workers: Worker processes (default: CPU count; 1 audits in-process)
+        cache: Audit cache to read and update (None disables caching)
+        phases: Phases to run (default: all); a partial audit bypasses the cache
+        on_report: Called with (report, seconds, cached) of each skill, in
+            discovery order, as soon as it is available; the reports are then
+            not kept in the returned BatchAuditReport
+
+    Returns:
+        BatchAuditReport with reports in discovery order
+    """
+    start = time.perf_counter()
+    skill_paths = discover_skills(skills_root)
+    batch = BatchAuditReport(skills_root=Path(skills_root).resolve())
+    if not _is_full_audit(phases):
+        cache = None
+
+    hits: dict[Path, tuple[AuditReport, float]] = {}
+    keys: dict[Path, str] = {}
+    if cache is not None:
+        for path in skill_paths:
+            lookup_start = time.perf_counter()
+            keys[path], entry = _cache_lookup(cache, path)
+            if entry is not None:
+                hits[path] = (report_from_dict(entry), time.perf_counter() - lookup_start)
+
+    def emit(report: AuditReport, seconds: float, cached: bool) -> None:
+        if on_report is not None:
+            on_report(report, seconds, cached)
+            return
+        batch.reports.append(report)
+        batch.durations.append(seconds)
+        batch.cached.append(cached)
+
+    pending = [path for path in skill_paths if path not in hits]
+    batch.workers = max(1, min(workers or os.cpu_count() or 1, len(pending) or 1))
+    pool = ProcessPoolExecutor(max_workers=batch.workers) if batch.workers > 1 else None
+    try:
+        # Lazily yields results in submission order
+        audited = (
+            pool.map(_audit_timed, pending, [phases] * len(pending)) if pool is not None
+            else (_audit_timed(path, phases) for path in pending)
+        )
+        for path in skill_paths:
+            if path in hits:
+                emit(*hits.pop(path), True)
+                continue
+            report, seconds, probes = next(audited)
+            if cache is not None:
+                cache.put(path, keys[path], report_to_dict(report), probes)
+            emit(report, seconds, False)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    if cache is not None:
+        cache.save()
+
+    batch.total_seconds = time.perf_counter() - start
+    return batch
+
+
+def print_batch_ascii_report(batch: BatchAuditReport) -> None:
+    """Print a combined --all report: one line per skill, then failures."""
+    width = 72
+
+    print("+" + "-" * (width - 2) + "+")
+    title = f"AUDIT ALL: {batch.skills_root}"
+    print(f"| {title[:width - 4]:<{width - 4}} |")
+    print("+" + "-" * (width - 2) + "+")
+
+    for report, seconds, cached in zip(batch.reports, batch.durations, batch.cached):
+        count = f"{report.total_passed}/{report.total_checks}"
+        status = {"PASS": "[OK]", "PASS WITH WARNINGS": "[WARN]"}.get(report.overall_status, "[FAIL]")
+        timing = "cached" if cached else f"{seconds * 1000:.1f} ms"
+        print(f"| {report.skill_name[:36]:<36} {status:>6} {count:>7} {timing:>12} |")
+
+    print("+" + "-" * (width - 2) + "+")
+    result_line = (
+        f"RESULT: {len(batch.reports) - batch.failed_count}/{len(batch.reports)} skills pass"
+        f" ({batch.warning_count} warnings)"
+    )
+    print(f"| {result_line:<{width - 4}} |")
+    timing_line = (
+        f"TIME: {batch.total_seconds:.2f} s total, {batch.workers} worker(s), "
+        f"{sum(batch.cached)} cached"
+    )
+    print(f"| {timing_line:<{width - 4}} |")
+    print("+" + "-" * (width - 2) + "+")
+
+    failures = [
+        (report.skill_name, result)
+        for report in batch.reports
+        for phase_report in report.phases.values()
+        for result in phase_report.results
+        if not result.passed and result.severity == Severity.ERROR
+    ]
+    if failures:
+        print(f"| {'FAILURES:':<{width - 4}} |")
+        for skill_name, result in failures:
+            line = f"{skill_name} [{result.check_id}] {result.message}"
+            print(f"| {line[:width - 4]:<{width - 4}} |")
+        print("+" + "-" * (width - 2) + "+")
+
+
+def print_batch_json_report(batch: BatchAuditReport) -> None:
+    """Print a combined --all report in JSON format."""
+    output = {
+        "skills_root": str(batch.skills_root),
+        "skill_count": len(batch.reports),
+        "failed_count": batch.failed_count,
+        "warning_count": batch.warning_count,
+        "workers": batch.workers,
+        "total_seconds": round(batch.total_seconds, 6),
+        "cached_count": sum(batch.cached),
+        "skills": [
+            {**report_to_dict(report), "seconds": round(seconds, 6), "cached": cached}
+            for report, seconds, cached in zip(batch.reports, batch.durations, batch.cached)
+        ],
+    }
     print(json.dumps(output, indent=2))
 
 
+def _check_record(report: AuditReport, result: AuditResult) -> CheckRecord:
+    return CheckRecord(
+        skill_name=report.skill_name,
+        skill_path=report.skill_path,
+        check_id=result.check_id,
+        name=result.name,
+        passed=result.passed,
+        message=result.message,
+        severity=result.severity.value,
+        suggestion=result.suggestion,
+        phase=result.phase.name,
+    )
+
+
+def _skill_summary(report: AuditReport, seconds: Optional[float] = None, cached: Optional[bool] = None) -> dict:
+    summary = {
+        "skill_name": report.skill_name,
+        "skill_path": str(report.skill_path),
+        "overall_status": report.overall_status,
+        "total_passed": report.total_passed,
+        "total_checks": report.total_checks,
+        "warning_count": report.warning_count,
+    }
+    if seconds is not None:
+        summary["seconds"] = round(seconds, 6)
+    if cached is not None:
+        summary["cached"] = cached
+    return summary
+
+
+def stream_audit(
+    skill_path: Path,
+    fmt: str,
+    cache: Optional[AuditCache] = None,
+    phases: Optional[list[AuditPhase]] = None,
+) -> int:
+    """
+    Audit one skill, streaming each check as NDJSON or SARIF as soon as its phase completes.
+
+    Returns:
+        Exit code (1 if a check failed with error severity)
+    """
+    reporter = make_reporter(fmt, sys.stdout, tool="epci-skill-audit")
+    report, cached = audit_skill_cached(
+        skill_path, cache, phases=phases,
+        on_result=lambda r, result: reporter.check(_check_record(r, result)),
+    )
+    reporter.skill(_skill_summary(report, cached=cached))
+    reporter.finish({"skill_count": 1, "failed_count": int(report.has_errors), "warning_count": report.warning_count})
+    return 1 if report.has_errors else 0
+
+
+def stream_audit_all(
+    skills_root: Path,
+    fmt: str,
+    workers: Optional[int] = None,
+    cache: Optional[AuditCache] = None,
+    phases: Optional[list[AuditPhase]] = None,
+) -> int:
+    """
+    Audit every skill under skills_root, streaming each skill's checks as soon
+    as its report is available. Only counters are kept in memory.
+
+    Returns:
+        Exit code (1 if any skill failed)
+    """
+    reporter = make_reporter(fmt, sys.stdout, tool="epci-skill-audit")
+    counts = {"skill_count": 0, "failed_count": 0, "warning_count": 0, "cached_count": 0}
+
+    def on_report(report: AuditReport, seconds: float, cached: bool) -> None:
+        for phase_report in report.phases.values():
+            for result in phase_report.results:
+                reporter.check(_check_record(report, result))
+        reporter.skill(_skill_summary(report, seconds, cached))
+        counts["skill_count"] += 1
+        counts["failed_count"] += report.has_errors
+        counts["warning_count"] += report.warning_count
+        counts["cached_count"] += cached
+
+    batch = audit_all(skills_root, workers=workers, cache=cache, phases=phases, on_report=on_report)
+    reporter.finish({
+        "skills_root": str(batch.skills_root),
+        **counts,
+        "workers": batch.workers,
+        "total_seconds": round(batch.total_seconds, 6),
+    })
+    return 1 if counts["failed_count"] else 0
+
+
 def main() -> int:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -1104,20 +1489,80 @@ Examples:
   %(prog)s ../brainstorm/              # Audit brainstorm skill
   %(prog)s ../core/state-manager/      # Audit core skill
   %(prog)s ../implement/ --json        # Output as JSON
+  %(prog)s --all ../../                # Audit every skill in one run
+  %(prog)s ../implement/ --phases 5,6  # Step chain and Task tool only
+  %(prog)s --all ../../ --stream sarif # SARIF for CI annotations
         """
     )
     parser.add_argument(
         "skill_path",
         type=Path,
+        nargs="?",
         help="Path to skill directory (containing SKILL.md)"
     )
+    parser.add_argument(
+        "--all",
+        type=Path,
+        metavar="SKILLS_ROOT",
+        help="Audit every SKILL.md under SKILLS_ROOT (including core/ and stack/)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --all (default: CPU count)"
+    )
+    parser.add_argument(
+        "--phases",
+        type=parse_phases,
+        default=None,
+        help="Comma-separated phases to run, e.g. 5,6 (default: all six); bypasses the cache"
+    )
     parser.add_argument(
         "--json",
         action="store_true",
         help="Output report as JSON"
     )
+    parser.add_argument(
+        "--stream",
+        choices=STREAM_FORMATS,
+        default=None,
+        help="Stream each check as NDJSON or SARIF as soon as it completes"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-audit every skill instead of using cached reports"
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help=f"Audit cache file (default: {CACHE_RELPATH} in the project root; none outside a plugin tree)"
+    )
 
     args = parser.parse_args()
+    cache_path = args.cache or default_cache_path()
+    cache = None if args.no_cache or cache_path is None else AuditCache(cache_path)
+
+    if (args.skill_path is None) == (args.all is None):
+        parser.error("give either a skill_path or --all SKILLS_ROOT")
+
+    if args.all is not None:
+        skills_root = args.all.resolve()
+        if not skills_root.is_dir():
+            print(f"Error: Path is not a directory: {skills_root}")
+            return 1
+
+        if args.stream:
+            return stream_audit_all(skills_root, args.stream, workers=args.workers, cache=cache, phases=args.phases)
+
+        batch = audit_all(skills_root, workers=args.workers, cache=cache, phases=args.phases)
+        if args.json:
+            print_batch_json_report(batch)
+        else:
+            print_batch_ascii_report(batch)
+        return 1 if batch.has_errors else 0
 
     # Resolve path
     skill_path = args.skill_path.resolve()
@@ -1131,8 +1576,10 @@ Examples:
         return 1
 
     # Run audit
-    auditor = SkillAuditor(skill_path)
-    report = auditor.audit()
+    if args.stream:
+        return stream_audit(skill_path, args.stream, cache=cache, phases=args.phases)
+
+    report, _ = audit_skill_cached(skill_path, cache, phases=args.phases)
 
     # Print report
     if args.json:
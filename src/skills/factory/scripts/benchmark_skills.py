@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+EPCI Skill Factory Benchmark - Timing of SkillAuditor and SkillValidator.
+
+Generates a synthetic skills tree (N skills, M steps per skill with
+branching step chains, K references per skill), then times
+SkillValidator.validate_all(), SkillAuditor.audit() and each audit phase
+run on its own over the whole tree. Results (median and min of the
+repeats, throughput, peak traced memory) are written as JSON and can be
+compared against a stored baseline.
+
+Usage:
+    python benchmark_skills.py                                  # 50 skills x 8 steps x 4 references
+    python benchmark_skills.py --skills 200 --steps 20 --branching 3
+    python benchmark_skills.py --output bench.json               # Save results
+    python benchmark_skills.py --baseline bench.json             # Compare, exit 1 on regression
+
+Exit codes:
+    0 = Benchmark completed (no regression against the baseline)
+    1 = A metric exceeds the baseline by more than --threshold
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+# Import from sibling modules
+from audit_skill import AuditPhase, SkillAuditor
+from path_index import PathIndex
+from skill_frontmatter import SkillNameIndex
+from validate_skill_output import SkillValidator
+
+DEFAULT_SKILLS = 50
+DEFAULT_STEPS = 8
+DEFAULT_REFERENCES = 4
+DEFAULT_BRANCHING = 2
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 1.25  # Allowed current/baseline ratio before a metric is a regression
+
+# Steps are named step-XX-*, so a skill has at most 100 of them
+MAX_STEPS = 100
+
+
+@dataclass
+class TreeConfig:
+    """Shape of the generated skills tree."""
+    skills: int = DEFAULT_SKILLS
+    steps: int = DEFAULT_STEPS
+    references: int = DEFAULT_REFERENCES
+    branching: int = DEFAULT_BRANCHING  # Extra forward transitions per step
+    seed: int = 0
+
+    @property
+    def file_count(self) -> int:
+        return self.skills * (1 + self.steps + self.references)
+
+
+# ============================================================================
+# TREE GENERATION
+# ============================================================================
+
+def _skill_md(index: int, config: TreeConfig) -> str:
+    name = f"bench-skill-{index:03d}"
+    references = "\n".join(
+        f"- [Reference {r}](references/ref-{r:02d}.md)" for r in range(config.references)
+    )
+    steps = "\n".join(
+        f"{s + 1}. Step {s}: see `steps/step-{s:02d}-{_step_slug(s, config)}.md`"
+        for s in range(config.steps)
+    )
+    return f"""---
+name: {name}
+description: >-
+  Generate synthetic benchmark output number {index} for the skill factory.
+  Use when: measuring audit and validation performance on large trees.
+user-invocable: true
+allowed-tools: Read, Write, Edit, Glob, Grep, Bash
+---
+
+# Benchmark Skill {index}
+
+## Overview
+
+Synthetic skill generated by benchmark_skills.py.
+
+## Workflow
+
+{steps}
+
+## Shared Components Used
+
+- `epci:breakpoint-system` -- Interactive breakpoints
+- `epci:project-memory` -- Context persistence
+- `epci:complexity-calculator` -- Scope evaluation
+
+## Breakpoints
+
+Types used: `type: validation`, `type: analysis`
+
+## Examples
+
+### Input
+
+A request for benchmark output.
+
+## Error Handling
+
+| Error | Action |
+|-------|--------|
+| Missing input | Ask again |
+
+## Limitations
+
+- Synthetic content only
+
+## References
+
+{references}
+"""
+
+
+def _step_slug(step: int, config: TreeConfig) -> str:
+    if step == 0:
+        return "init"
+    if step == config.steps - 1:
+        return "finish"
+    return f"phase-{step}"
+
+
+def _step_md(step: int, config: TreeConfig, rng: random.Random) -> str:
+    name = f"step-{step:02d}-{_step_slug(step, config)}"
+    lines = [f"# {name}", "", "## Instructions", ""]
+    lines += [f"{i}. Do part {i} of {name}" for i in range(1, 6)]
+
+    later = list(range(step + 2, config.steps))
+    branches = rng.sample(later, min(config.branching, len(later)))
+    if branches:
+        lines += ["", "## Conditional Transitions", "", "| Condition | Next |", "|---|---|"]
+        lines += [
+            f"| case {b} | → `step-{b:02d}-{_step_slug(b, config)}.md` |" for b in sorted(branches)
+        ]
+    if step % 3 == 1:
+        lines += ["", "Delegate review to @planner:", 'Task(subagent_type: "planner", prompt: "...")']
+
+    if step < config.steps - 1:
+        nxt = f"step-{step + 1:02d}-{_step_slug(step + 1, config)}"
+        lines += ["", "## Next Step", "", f"→ `{nxt}.md`"]
+    return "\n".join(lines) + "\n"
+
+
+def generate_tree(skills_root: Path, config: TreeConfig) -> list[Path]:
+    """
+    Write a synthetic skills tree under skills_root.
+
+    Args:
+        skills_root: Directory to create the skills in
+        config: Tree shape
+
+    Returns:
+        The generated skill directories, sorted
+    """
+    rng = random.Random(config.seed)
+    skill_paths = []
+    for index in range(config.skills):
+        skill_path = skills_root / f"bench-skill-{index:03d}"
+        (skill_path / "steps").mkdir(parents=True, exist_ok=True)
+        (skill_path / "references").mkdir(exist_ok=True)
+        (skill_path / "SKILL.md").write_text(_skill_md(index, config), encoding="utf-8")
+        for step in range(config.steps):
+            step_file = skill_path / "steps" / f"step-{step:02d}-{_step_slug(step, config)}.md"
+            step_file.write_text(_step_md(step, config, rng), encoding="utf-8")
+        for ref in range(config.references):
+            (skill_path / "references" / f"ref-{ref:02d}.md").write_text(
+                f"# Reference {ref}\n\n" + "Background material.\n" * 20, encoding="utf-8"
+            )
+        skill_paths.append(skill_path)
+    return skill_paths
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def _drop_shared_indexes() -> None:
+    """Forget the per-process indexes, so the next run builds them as a one-shot CLI run does."""
+    SkillNameIndex._shared.clear()
+    PathIndex._shared.clear()
+
+
+def _time(func: Callable[[], None], repeat: int) -> dict:
+    """
+    Run func once to warm up, then repeat times; return timing stats in ms.
+
+    The shared indexes are dropped before each run, so every sample
+    includes building them.
+    """
+    _drop_shared_indexes()
+    func()
+    samples = []
+    for _ in range(repeat):
+        _drop_shared_indexes()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+    }
+
+
+def _peak_kib(func: Callable[[], None]) -> float:
+    """Peak memory traced by tracemalloc while func runs (shared indexes included), in KiB."""
+    _drop_shared_indexes()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def run_benchmark(skills_root: Path, config: TreeConfig, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    Generate the tree under skills_root and measure it.
+
+    Each timing covers one pass over every skill of the tree.
+
+    Returns:
+        JSON-serializable results
+    """
+    skill_paths = generate_tree(skills_root, config)
+
+    def validate_tree() -> None:
+        for skill_path in skill_paths:
+            SkillValidator(skill_path, skills_root=skills_root).validate_all(permissive=True)
+
+    def audit_tree(phases: Optional[list[AuditPhase]] = None) -> Callable[[], None]:
+        def run() -> None:
+            for skill_path in skill_paths:
+                SkillAuditor(skill_path).audit(phases)
+        return run
+
+    timings = {
+        "validate_all": _time(validate_tree, repeat),
+        "audit": _time(audit_tree(), repeat),
+    }
+    for phase in AuditPhase:
+        timings[f"phase_{phase.value}_{phase.name.lower()}"] = _time(audit_tree([phase]), repeat)
+
+    audit_seconds = timings["audit"]["median_ms"] / 1000
+    return {
+        "config": {
+            "skills": config.skills,
+            "steps": config.steps,
+            "references": config.references,
+            "branching": config.branching,
+            "seed": config.seed,
+            "repeat": repeat,
+            "files": config.file_count,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "timings": timings,
+        "throughput": {
+            "audit_skills_per_second": round(config.skills / audit_seconds, 1) if audit_seconds else None,
+            "audit_files_per_second": round(config.file_count / audit_seconds, 1) if audit_seconds else None,
+        },
+        "memory": {
+            "validate_all_peak_kib": _peak_kib(validate_tree),
+            "audit_peak_kib": _peak_kib(audit_tree()),
+        },
+    }
+
+
+# ============================================================================
+# BASELINE COMPARISON
+# ============================================================================
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """
+    Compare timings (median) and peak memory against a baseline.
+
+    Args:
+        results: run_benchmark() output
+        baseline: Earlier run_benchmark() output
+        threshold: Ratio current/baseline above which a metric regressed
+
+    Returns:
+        One entry per metric present in both: metric, baseline, current, ratio, regression
+    """
+    pairs = [
+        (f"timings.{name}", baseline["timings"][name]["median_ms"], stats["median_ms"])
+        for name, stats in results["timings"].items()
+        if name in baseline.get("timings", {})
+    ]
+    pairs += [
+        (f"memory.{name}", baseline["memory"][name], value)
+        for name, value in results["memory"].items()
+        if name in baseline.get("memory", {})
+    ]
+
+    comparison = []
+    for metric, before, after in pairs:
+        ratio = after / before if before else None
+        comparison.append({
+            "metric": metric,
+            "baseline": before,
+            "current": after,
+            "ratio": round(ratio, 3) if ratio is not None else None,
+            "regression": ratio is not None and ratio > threshold,
+        })
+    return comparison
+
+
+def print_results(results: dict, comparison: Optional[list[dict]] = None) -> None:
+    """Print results as an ASCII table (to stderr when JSON goes to stdout)."""
+    out = sys.stderr
+    config = results["config"]
+    width = 72
+
+    print("+" + "-" * (width - 2) + "+", file=out)
+    title = (
+        f"BENCHMARK: {config['skills']} skills x {config['steps']} steps x "
+        f"{config['references']} refs (branching {config['branching']})"
+    )
+    print(f"| {title[:width - 4]:<{width - 4}} |", file=out)
+    print("+" + "-" * (width - 2) + "+", file=out)
+    for name, stats in results["timings"].items():
+        line = f"{name:<36} {stats['median_ms']:>10.1f} ms  (min {stats['min_ms']:.1f})"
+        print(f"| {line[:width - 4]:<{width - 4}} |", file=out)
+    print("+" + "-" * (width - 2) + "+", file=out)
+    throughput = results["throughput"]
+    memory = results["memory"]
+    for line in (
+        f"audit: {throughput['audit_skills_per_second']} skills/s, {throughput['audit_files_per_second']} files/s",
+        f"peak memory: validate {memory['validate_all_peak_kib']} KiB, audit {memory['audit_peak_kib']} KiB",
+    ):
+        print(f"| {line[:width - 4]:<{width - 4}} |", file=out)
+    print("+" + "-" * (width - 2) + "+", file=out)
+
+    if comparison:
+        for entry in comparison:
+            flag = "REGRESSION" if entry["regression"] else ""
+            ratio = f"x{entry['ratio']:.2f}" if entry["ratio"] is not None else "n/a"
+            line = f"{entry['metric']:<44} {ratio:>8} {flag:>10}"
+            print(f"| {line[:width - 4]:<{width - 4}} |", file=out)
+        print("+" + "-" * (width - 2) + "+", file=out)
+
+
+def main() -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="EPCI Skill Factory Benchmark - Timing of SkillAuditor and SkillValidator",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                       # Default tree, JSON on stdout
+  %(prog)s --skills 200 --steps 30 --output b.json
+  %(prog)s --baseline b.json --threshold 1.5     # Fail if 50%% slower
+        """
+    )
+    parser.add_argument("--skills", type=int, default=DEFAULT_SKILLS, help="Number of skills (N)")
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS, help=f"Steps per skill (M, 2-{MAX_STEPS})")
+    parser.add_argument("--references", type=int, default=DEFAULT_REFERENCES, help="References per skill (K)")
+    parser.add_argument(
+        "--branching", type=int, default=DEFAULT_BRANCHING,
+        help="Extra forward transitions per step (branching step chains)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the branching")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per measurement")
+    parser.add_argument("--output", type=Path, default=None, help="Write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, default=None, help="Compare against this results JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Current/baseline ratio counted as a regression (default: {DEFAULT_THRESHOLD})"
+    )
+    parser.add_argument(
+        "--tree", type=Path, default=None,
+        help="Generate the tree in this directory and keep it (default: temporary directory)"
+    )
+
+    args = parser.parse_args()
+    if not 2 <= args.steps <= MAX_STEPS:
+        parser.error(f"--steps must be between 2 and {MAX_STEPS}")
+    if args.skills < 1 or args.references < 0 or args.branching < 0 or args.repeat < 1:
+        parser.error("--skills and --repeat must be positive, --references and --branching non-negative")
+
+    config = TreeConfig(
+        skills=args.skills,
+        steps=args.steps,
+        references=args.references,
+        branching=args.branching,
+        seed=args.seed,
+    )
+
+    if args.tree is not None:
+        # Keep the synthetic tree in a skills/ directory so skills root detection stays inside it
+        skills_root = args.tree.resolve() / "skills"
+        skills_root.mkdir(parents=True, exist_ok=True)
+        results = run_benchmark(skills_root, config, repeat=args.repeat)
+    else:
+        with tempfile.TemporaryDirectory(prefix="epci-bench-") as tmp:
+            skills_root = Path(tmp).resolve() / "skills"
+            skills_root.mkdir()
+            results = run_benchmark(skills_root, config, repeat=args.repeat)
+
+    comparison = None
+    if args.baseline is not None:
+        try:
+            baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error: Cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+            return 1
+        comparison = compare_to_baseline(results, baseline, args.threshold)
+        results["comparison"] = {"baseline": str(args.baseline), "threshold": args.threshold, "metrics": comparison}
+
+    print_results(results, comparison)
+    output = json.dumps(results, indent=2)
+    if args.output is not None:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    return 1 if comparison and any(entry["regression"] for entry in comparison) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
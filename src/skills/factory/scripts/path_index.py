@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+In-memory existence index of a skill tree.
+
+One os.scandir() walk of the root records every file and directory;
+existence queries for paths under the root are then answered without
+touching the filesystem. Paths are normalized lexically; a path going
+through a symbolic link, or leaving the root, falls back to resolve() +
+exists(), cached per path.
+
+Usage:
+    from path_index import PathIndex
+
+    index = PathIndex.for_root(skills_root)
+    index.exists(skill_path / "references/checklist.md")
+    index.is_inside(skill_path / "../../README.md")
+"""
+
+import os
+from pathlib import Path
+from typing import ClassVar, Iterable, Optional
+
+
+class PathIndex:
+    """
+    Every path under a root, from a single directory walk.
+
+    for_root() shares one index per root within a process; a long-lived
+    process applies changes with update() or rebuilds with refresh().
+    """
+
+    _shared: ClassVar[dict[Path, "PathIndex"]] = {}
+
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+        self._paths: set[str] = set()
+        self._symlinks: set[str] = set()
+        self._stat_cache: dict[str, bool] = {}
+        self.refresh()
+
+    @classmethod
+    def for_root(cls, root: Path) -> "PathIndex":
+        """Return the index shared by every caller in this process for root."""
+        key = Path(root).resolve()
+        if key not in cls._shared:
+            cls._shared[key] = cls(key)
+        return cls._shared[key]
+
+    def _walk(self, top: str) -> None:
+        # scandir reports entry types from the directory listing itself, without a stat per entry
+        self._paths.add(top)
+        stack = [top]
+        while stack:
+            try:
+                entries = list(os.scandir(stack.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                self._paths.add(entry.path)
+                if entry.is_symlink():
+                    self._symlinks.add(entry.path)  # Not descended into
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+    def refresh(self) -> None:
+        """Walk the whole root again."""
+        self._paths = set()
+        self._symlinks = set()
+        self._stat_cache = {}
+        if self.root.is_dir():
+            self._walk(str(self.root))
+
+    def update(self, paths: Iterable[Path]) -> None:
+        """Pick up added or removed paths (a directory is walked again)."""
+        for path in paths:
+            path = self.normalize(path)
+            if not self._under_root(path):
+                self._stat_cache.clear()
+                continue
+            prefix = path + os.sep
+            self._paths = {p for p in self._paths if p != path and not p.startswith(prefix)}
+            self._symlinks = {p for p in self._symlinks if p != path and not p.startswith(prefix)}
+            self._stat_cache.clear()
+            if os.path.isdir(path) and not os.path.islink(path):
+                self._walk(path)
+            elif os.path.lexists(path):
+                self._paths.add(path)
+                if os.path.islink(path):
+                    self._symlinks.add(path)
+
+    @staticmethod
+    def normalize(path: Path) -> str:
+        """Absolute, lexically normalized form of path ('..' removed, no stat)."""
+        return os.path.normpath(os.path.abspath(path))
+
+    def _under_root(self, normalized: str) -> bool:
+        root = str(self.root)
+        return normalized == root or normalized.startswith(root.rstrip(os.sep) + os.sep)
+
+    def _through_symlink(self, normalized: str) -> bool:
+        if not self._symlinks:
+            return False
+        current = normalized
+        while self._under_root(current) and current != str(self.root):
+            if current in self._symlinks:
+                return True
+            current = os.path.dirname(current)
+        return False
+
+    def _indexed(self, path: Path) -> Optional[str]:
+        """
+        Normalized path if the index can answer for it, else None.
+
+        It cannot when path leaves the root, goes through a symbolic link,
+        or has a '..' right after a symbolic link (where the lexical and
+        the resolved parent differ).
+        """
+        path = Path.cwd() / path  # Unchanged if path is absolute; keeps '..' unlike abspath()
+        current = path.anchor
+        for part in path.parts[1:]:
+            if part == "..":
+                if self._through_symlink(current):
+                    return None
+                current = os.path.dirname(current)
+            else:
+                current = os.path.join(current, part)
+        current = os.path.normpath(current)
+        if not self._under_root(current) or self._through_symlink(current):
+            return None
+        return current
+
+    def is_inside(self, path: Path) -> bool:
+        """True if path (after resolving symbolic links) lies under the root."""
+        if self._indexed(path) is not None:
+            return True
+        return Path(path).resolve().is_relative_to(self.root)
+
+    def exists(self, path: Path) -> bool:
+        """Whether path exists, answered from the index when possible."""
+        indexed = self._indexed(path)
+        if indexed is not None:
+            return indexed in self._paths
+        key = str(path)
+        if key not in self._stat_cache:
+            self._stat_cache[key] = Path(path).resolve().exists()
+        return self._stat_cache[key]
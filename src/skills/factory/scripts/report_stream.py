@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Streaming reporters for audit and validation checks.
+
+Each check is written and flushed as soon as it is reported, so CI can
+annotate files while the run is still going and memory stays flat however
+many skills are checked.
+
+- NDJSON: one JSON object per line: a "check" record per check, a "skill"
+  record after each skill and a final "summary" record.
+- SARIF 2.1.0: a single document whose header is written up front, each
+  failed check is appended as a result, and finish() closes it with the
+  summary as run properties. Passed checks are not SARIF results.
+
+Usage:
+    from report_stream import CheckRecord, make_reporter
+
+    reporter = make_reporter("ndjson", sys.stdout, tool="epci-skill-audit")
+    reporter.check(CheckRecord(skill_name, skill_path, "P1.1", "Name format", True, "OK"))
+    reporter.skill({"skill_name": skill_name, "overall_status": "PASS"})
+    reporter.finish({"skill_count": 1, "failed_count": 0})
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, TextIO
+
+STREAM_FORMATS = ("ndjson", "sarif")
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# Check severity -> SARIF result level
+SARIF_LEVELS = {"error": "error", "warning": "warning", "info": "note"}
+
+
+@dataclass
+class CheckRecord:
+    """One check of one skill, as streamed by the reporters."""
+    skill_name: str
+    skill_path: Path
+    check_id: str
+    name: str
+    passed: bool
+    message: str
+    severity: str = "error"  # "error", "warning" or "info"
+    suggestion: Optional[str] = None
+    phase: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "skill_name": self.skill_name,
+            "skill_path": str(self.skill_path),
+            "phase": self.phase,
+            "check_id": self.check_id,
+            "name": self.name,
+            "passed": self.passed,
+            "message": self.message,
+            "severity": self.severity,
+            "suggestion": self.suggestion,
+        }
+
+
+class NdjsonReporter:
+    """Writes one JSON object per line."""
+
+    def __init__(self, stream: TextIO, tool: str):
+        self.stream = stream
+        self.tool = tool
+
+    def _write(self, record: dict) -> None:
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
+
+    def check(self, record: CheckRecord) -> None:
+        self._write({"type": "check", **record.to_dict()})
+
+    def skill(self, summary: dict) -> None:
+        self._write({"type": "skill", **summary})
+
+    def finish(self, summary: dict) -> None:
+        self._write({"type": "summary", "tool": self.tool, **summary})
+
+
+class SarifReporter:
+    """Writes a SARIF 2.1.0 log, one result per failed check."""
+
+    def __init__(self, stream: TextIO, tool: str):
+        self.stream = stream
+        self._results = 0
+
+        header = {
+            "$schema": SARIF_SCHEMA,
+            "version": SARIF_VERSION,
+            "runs": [{"tool": {"driver": {"name": tool}}, "results": []}],
+        }
+        # Everything before the closing brackets of the (empty) results array
+        text = json.dumps(header)
+        self.stream.write(text[:text.rindex("[]") + 1] + "\n")
+        self.stream.flush()
+
+    @staticmethod
+    def _uri(path: Path) -> str:
+        """Artifact URI: relative to the working directory when possible."""
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(Path.cwd()).as_posix()
+        except ValueError:
+            return path.as_uri()
+
+    def check(self, record: CheckRecord) -> None:
+        if record.passed:
+            return
+        message = record.message
+        if record.suggestion:
+            message += f"\n{record.suggestion}"
+        result = {
+            "ruleId": record.check_id,
+            "level": SARIF_LEVELS.get(record.severity, "warning"),
+            "message": {"text": message},
+            "locations": [{
+                "physicalLocation": {
+                    "artifactLocation": {"uri": self._uri(Path(record.skill_path) / "SKILL.md")},
+                },
+            }],
+            "properties": {"skill": record.skill_name, "check": record.name, "phase": record.phase},
+        }
+        separator = ",\n" if self._results else ""
+        self.stream.write(separator + json.dumps(result))
+        self.stream.flush()
+        self._results += 1
+
+    def skill(self, summary: dict) -> None:
+        pass  # SARIF has no per-skill record; totals go in the run properties
+
+    def finish(self, summary: dict) -> None:
+        self.stream.write("\n], " + json.dumps({"properties": summary})[1:-1] + "}]}\n")
+        self.stream.flush()
+
+
+def make_reporter(fmt: str, stream: TextIO, tool: str):
+    """
+    Return the streaming reporter for fmt.
+
+    Args:
+        fmt: One of STREAM_FORMATS
+        stream: Text stream to write to
+        tool: Tool name recorded in the output
+
+    Raises:
+        ValueError: If fmt is not a known format
+    """
+    if fmt == "ndjson":
+        return NdjsonReporter(stream, tool)
+    if fmt == "sarif":
+        return SarifReporter(stream, tool)
+    raise ValueError(f"Unknown stream format: {fmt}")
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+r"""
+In-memory view of a skill directory for audit checks.
+
+Reads SKILL.md, steps/*.md and references/*.md at most once, on first use,
+so that every audit phase can search and parse them without going back to
+disk and phases that do not need a file never read it. PatternSet runs
+many regexes over a text, skipping those whose literal text is absent.
+
+Usage:
+    from skill_corpus import PatternSet, SkillCorpus
+
+    corpus = SkillCorpus(skill_path)
+    for f in corpus.files():
+        ...  # f.path, f.text
+
+    hits = corpus.search(PatternSet([r"epci:[\w-]+", r"type:\s*\w+"]))
+    hits[r"epci:[\w-]+"]    # [(path, matched_text), ...]
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from skill_frontmatter import SkillDocument
+
+
+@dataclass
+class CorpusFile:
+    """A loaded markdown file."""
+    path: Path
+    text: str
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def stem(self) -> str:
+        return self.path.stem
+
+
+# Lowercased non-ASCII text that re.IGNORECASE matches with an ASCII letter
+# ("İ" lowercases to "i" + combining dot; "K" (Kelvin) already to "k")
+_ASCII_CASE_FOLD = (("i\u0307", "i"), ("ı", "i"), ("ſ", "s"))
+
+# Characters that end the literal prefix of a branch
+_REGEX_SPECIAL = set("\\.^$*+?{}[]()|")
+
+
+def _literal_prefixes(pattern: str) -> Optional[list[str]]:
+    """
+    Literal text each top-level alternative of pattern starts with.
+
+    A match of pattern must contain one of the returned strings. Returns
+    None when some alternative does not start with a literal, in which case
+    the pattern cannot be prefiltered.
+    """
+    branches = []
+    start = depth = 0
+    class_start = None  # Index of the first character inside [...]
+    escaped = False
+    for i, char in enumerate(pattern):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif class_start is not None:
+            if char == "^" and i == class_start:
+                class_start += 1
+            elif char == "]" and i > class_start:
+                class_start = None
+        elif char == "[":
+            class_start = i + 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            branches.append(pattern[start:i])
+            start = i + 1
+    branches.append(pattern[start:])
+
+    prefixes = []
+    for branch in branches:
+        end = 0
+        while end < len(branch) and branch[end] not in _REGEX_SPECIAL:
+            end += 1
+        if end < len(branch) and branch[end] in "?*{":
+            end -= 1  # The last character is optional
+        if end <= 0:
+            return None
+        prefixes.append(branch[:end])
+    return prefixes
+
+
+class PatternSet:
+    """
+    Several regexes searched over a text, skipping those that cannot match.
+
+    Each pattern is compiled on its own and run with re.finditer, so search()
+    returns exactly what running each pattern separately would. Before that,
+    the literal text every alternative of a pattern starts with (e.g. "epci:"
+    or "type:") is looked up with a plain substring search, and patterns
+    whose literals are all absent are not run at all. Most patterns of an
+    audit match in few files, so most regex scans are skipped.
+    """
+
+    def __init__(self, patterns: Iterable[str], flags: int = re.IGNORECASE):
+        self.patterns = list(dict.fromkeys(patterns))
+        self.flags = flags
+        self._fold = bool(flags & re.IGNORECASE)
+        self._compiled = []
+        for pattern in self.patterns:
+            prefixes = None if flags & re.VERBOSE else _literal_prefixes(pattern)
+            if prefixes is not None and self._fold:
+                # Non-ASCII literals have case rules str.lower() does not follow
+                prefixes = [p.lower() for p in prefixes] if all(p.isascii() for p in prefixes) else None
+            self._compiled.append((pattern, re.compile(pattern, flags), prefixes))
+
+    def search(self, text: str) -> dict[str, list[str]]:
+        """Return the matched texts of every pattern, in order of appearance."""
+        haystack = text
+        if self._fold:
+            haystack = text.lower()
+            if not haystack.isascii():
+                for folded, letter in _ASCII_CASE_FOLD:
+                    haystack = haystack.replace(folded, letter)
+        hits = {}
+        for pattern, regex, prefixes in self._compiled:
+            if prefixes is not None and not any(prefix in haystack for prefix in prefixes):
+                hits[pattern] = []
+            else:
+                hits[pattern] = [match.group() for match in regex.finditer(text)]
+        return hits
+
+
+def _reload_file(files: list[CorpusFile], path: Path) -> list[CorpusFile]:
+    """files with path re-read (dropped if it no longer exists), kept sorted by path."""
+    files = [f for f in files if f.path != path]
+    files.extend(_load_files([path]) if path.is_file() else [])
+    return sorted(files, key=lambda f: f.path)
+
+
+def _load_files(paths: list[Path]) -> list[CorpusFile]:
+    """Read paths as UTF-8, skipping unreadable files."""
+    files = []
+    for path in paths:
+        try:
+            files.append(CorpusFile(path, path.read_text(encoding="utf-8")))
+        except (OSError, UnicodeDecodeError):
+            pass
+    return files
+
+
+class SkillCorpus:
+    """
+    SKILL.md, steps/ and references/ of one skill, each read at most once.
+
+    The files are grouped in views ("skill": SKILL.md text, "steps",
+    "references") that are read on first access, or up front with load().
+    """
+
+    VIEWS = ("skill", "steps", "references")
+
+    def __init__(self, skill_path: Path):
+        """
+        Open a skill directory.
+
+        Args:
+            skill_path: Path to skill directory (containing SKILL.md)
+        """
+        self.skill_path = Path(skill_path).resolve()
+        self.skill_md = self.skill_path / "SKILL.md"
+        self.steps_dir = self.skill_path / "steps"
+        self.references_dir = self.skill_path / "references"
+
+        # SKILL.md frontmatter is parsed eagerly, its body on first access
+        self.document: Optional[SkillDocument] = (
+            SkillDocument(self.skill_md) if self.skill_md.exists() else None
+        )
+        self._skill_file: Optional[CorpusFile] = None
+
+        self.has_steps = self.steps_dir.is_dir()
+        self._step_paths: Optional[list[Path]] = None
+        self._steps: Optional[list[CorpusFile]] = None
+        self._references: Optional[list[CorpusFile]] = None
+
+    @property
+    def step_paths(self) -> list[Path]:
+        """Every steps/*.md path, sorted."""
+        if self._step_paths is None:
+            self._step_paths = sorted(self.steps_dir.glob("*.md")) if self.has_steps else []
+        return self._step_paths
+
+    @property
+    def steps(self) -> list[CorpusFile]:
+        """Loaded steps/*.md files (read on first access)."""
+        if self._steps is None:
+            self._steps = _load_files(self.step_paths)
+        return self._steps
+
+    @property
+    def references(self) -> list[CorpusFile]:
+        """Loaded references/*.md files (read on first access)."""
+        if self._references is None:
+            self._references = (
+                _load_files(sorted(self.references_dir.glob("*.md")))
+                if self.references_dir.is_dir() else []
+            )
+        return self._references
+
+    def load(self, views: Iterable[str]) -> None:
+        """
+        Read the given views now; the others stay unread until accessed.
+
+        Raises:
+            ValueError: If a view is not one of VIEWS
+        """
+        loaders = {
+            "skill": lambda: self.skill_file,
+            "steps": lambda: self.steps,
+            "references": lambda: self.references,
+        }
+        for view in views:
+            if view not in loaders:
+                raise ValueError(f"Unknown corpus view: {view}")
+            loaders[view]()
+
+    def reload(self, path: Path) -> bool:
+        """
+        Re-read one added, modified or removed path of the skill.
+
+        Only the file itself is read again (and only if its view was already
+        loaded); a change to the steps/ or references/ directory itself
+        unloads that view.
+
+        Args:
+            path: Changed path (SKILL.md, steps/, references/ or a .md file in them)
+
+        Returns:
+            True if path belongs to this corpus (its content may have changed)
+        """
+        path = Path(path).resolve()
+        if path == self.skill_md:
+            self.document = SkillDocument(self.skill_md) if self.skill_md.exists() else None
+            self._skill_file = None
+        elif path == self.steps_dir:
+            self.has_steps = self.steps_dir.is_dir()
+            self._step_paths = self._steps = None
+        elif path == self.references_dir:
+            self._references = None
+        elif path.suffix != ".md":
+            return False
+        elif path.parent == self.steps_dir:
+            self.has_steps = self.steps_dir.is_dir()
+            self._step_paths = None
+            if self._steps is not None:
+                self._steps = _reload_file(self._steps, path)
+        elif path.parent == self.references_dir:
+            if self._references is not None:
+                self._references = _reload_file(self._references, path)
+        else:
+            return False
+        return True
+
+    @property
+    def skill_file(self) -> Optional[CorpusFile]:
+        """SKILL.md as a CorpusFile (None if the file does not exist)."""
+        if self._skill_file is None and self.document is not None:
+            self._skill_file = CorpusFile(self.skill_md, self.document.content)
+        return self._skill_file
+
+    @property
+    def step_chain_files(self) -> list[CorpusFile]:
+        """Loaded steps named step-*.md (the files forming the step chain)."""
+        return [f for f in self.steps if f.name.startswith("step-")]
+
+    def files(self, include_steps: bool = True) -> list[CorpusFile]:
+        """SKILL.md, then steps/ (optional), then references/."""
+        files = [self.skill_file] if self.skill_file is not None else []
+        if include_steps:
+            files.extend(self.steps)
+        files.extend(self.references)
+        return files
+
+    def search(self, pattern_set: PatternSet, include_steps: bool = True) -> dict[str, list[tuple[Path, str]]]:
+        """
+        Run all patterns of pattern_set over the corpus, one pass per file.
+
+        Returns:
+            Dict mapping each pattern to its (file_path, matched_text) hits,
+            in files() order
+        """
+        hits = {pattern: [] for pattern in pattern_set.patterns}
+        for corpus_file in self.files(include_steps=include_steps):
+            for pattern, matches in pattern_set.search(corpus_file.text).items():
+                hits[pattern].extend((corpus_file.path, text) for text in matches)
+        return hits
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Shared frontmatter parser for EPCI skill files.
+
+Used by validate_skill_output.py, audit_skill.py and src/scripts/validate.py.
+Reads a SKILL.md / COMPONENT.md only up to the closing `---` and records the
+byte offset where the body starts; the body is loaded on first access.
+SkillNameIndex maps frontmatter names to skill directories for a skills root.
+
+Usage:
+    from skill_frontmatter import SkillDocument, read_frontmatter
+
+    doc = SkillDocument(skill_path / "SKILL.md")
+    doc.frontmatter.name        # parsed from the header only
+    doc.body                    # read from disk on first access
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ClassVar, Iterable, Optional
+
+# Block scalar indicators whose value continues on the following lines
+MULTILINE_INDICATORS = (">-", ">", "|", "|-")
+
+FRONTMATTER_DELIMITER = "---"
+
+
+@dataclass
+class Frontmatter:
+    """Parsed frontmatter fields plus the position of the body."""
+    fields: dict[str, str] = field(default_factory=dict)
+    present: bool = False
+    body_offset: int = 0  # Byte offset of the first body line
+    header_lines: int = 0  # Newlines consumed by the frontmatter block
+
+    def get(self, key: str, default: str = "") -> str:
+        """Return the raw string value of a field."""
+        return self.fields.get(key, default)
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        """Return a field interpreted as a YAML boolean."""
+        value = self.fields.get(key)
+        if value is None:
+            return default
+        return value.strip("\"'").lower() == "true"
+
+    @property
+    def name(self) -> str:
+        return self.get("name")
+
+    @property
+    def description(self) -> str:
+        return self.get("description")
+
+    @property
+    def user_invocable(self) -> bool:
+        return self.get_bool("user-invocable", default=True)
+
+    def typed(self) -> dict:
+        """Return fields with booleans converted and double quotes stripped."""
+        result = {}
+        for key, value in self.fields.items():
+            if value.lower() == "true":
+                result[key] = True
+            elif value.lower() == "false":
+                result[key] = False
+            elif len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+                result[key] = value[1:-1]
+            else:
+                result[key] = value
+        return result
+
+
+def parse_fields(lines: Iterable[str]) -> dict[str, str]:
+    """
+    Parse frontmatter lines (without delimiters) into raw string values.
+
+    Top-level keys are non-indented `key: value` lines. Values introduced by
+    a block scalar indicator (>-, >, |) are folded into a single line.
+    """
+    fields = {}
+    current_key = None
+    current_value_lines = []
+
+    for line in lines:
+        if ":" in line and not line.startswith((" ", "\t")):
+            if current_key and current_value_lines:
+                fields[current_key] = " ".join(current_value_lines).strip()
+
+            key, _, value = line.partition(":")
+            current_key = key.strip()
+            value = value.strip()
+
+            if value in MULTILINE_INDICATORS:
+                current_value_lines = []
+            else:
+                fields[current_key] = value
+                current_key = None
+                current_value_lines = []
+        elif current_key and line.strip():
+            current_value_lines.append(line.strip())
+
+    if current_key and current_value_lines:
+        fields[current_key] = " ".join(current_value_lines).strip()
+
+    return fields
+
+
+def _scan(lines: Iterable[bytes]) -> Frontmatter:
+    """Consume lines up to the closing delimiter and build a Frontmatter."""
+    iterator = iter(lines)
+    first = next(iterator, b"")
+    if first.decode("utf-8", errors="replace").rstrip("\r\n") != FRONTMATTER_DELIMITER:
+        return Frontmatter()
+
+    offset = len(first)
+    newlines = first.count(b"\n")
+    header = []
+    for raw in iterator:
+        offset += len(raw)
+        newlines += raw.count(b"\n")
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if line.strip() == FRONTMATTER_DELIMITER:
+            return Frontmatter(
+                fields=parse_fields(header),
+                present=True,
+                body_offset=offset,
+                header_lines=newlines,
+            )
+        header.append(line)
+
+    # No closing delimiter: the whole file is body
+    return Frontmatter()
+
+
+def read_frontmatter(path: Path) -> Frontmatter:
+    """
+    Read only the frontmatter block of a file.
+
+    Returns an empty Frontmatter (present=False, body_offset=0) if the file
+    has no frontmatter or it is never closed.
+    """
+    with open(path, "rb") as f:
+        return _scan(f)
+
+
+def split_frontmatter(content: str) -> Frontmatter:
+    """Parse frontmatter from content already in memory."""
+    return _scan(content.encode("utf-8").splitlines(keepends=True))
+
+
+class SkillDocument:
+    """A skill markdown file with eager frontmatter and a lazily loaded body."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.frontmatter = read_frontmatter(self.path)
+        self._body: Optional[str] = None
+        self._content: Optional[str] = None
+
+    @property
+    def body(self) -> str:
+        """Text after the frontmatter block, read on first access."""
+        if self._body is None:
+            if self._content is not None:
+                raw = self._content.encode("utf-8")[self.frontmatter.body_offset:]
+            else:
+                with open(self.path, "rb") as f:
+                    f.seek(self.frontmatter.body_offset)
+                    raw = f.read()
+            self._body = raw.decode("utf-8")
+        return self._body
+
+    @property
+    def content(self) -> str:
+        """Full file text, read on first access."""
+        if self._content is None:
+            self._content = self.path.read_bytes().decode("utf-8")
+        return self._content
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the file, as counted by content.split('\\n')."""
+        if self._content is not None:
+            return len(self._content.split("\n"))
+        return self.frontmatter.header_lines + len(self.body.split("\n"))
+
+
+class SkillNameIndex:
+    """
+    Frontmatter name -> skill directories, for every SKILL.md under a root.
+
+    Only the frontmatter of each file is read. for_root() shares one index
+    per root within a process; refresh() re-reads only the files whose
+    mtime or size changed since the index was built.
+    """
+
+    _shared: ClassVar[dict[Path, "SkillNameIndex"]] = {}
+
+    def __init__(self, skills_root: Path):
+        self.skills_root = Path(skills_root).resolve()
+        self._entries: dict[Path, tuple[int, int, str]] = {}  # SKILL.md -> (mtime_ns, size, name)
+        self._by_name: dict[str, list[Path]] = {}
+        self.refresh()
+
+    @classmethod
+    def for_root(cls, skills_root: Path) -> "SkillNameIndex":
+        """Return the index shared by every caller in this process for skills_root."""
+        key = Path(skills_root).resolve()
+        if key not in cls._shared:
+            cls._shared[key] = cls(key)
+        return cls._shared[key]
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Name as compared by the index (surrounding quotes removed)."""
+        return name.strip().strip("\"'")
+
+    def refresh(self) -> None:
+        """Pick up added, removed and modified SKILL.md files."""
+        entries = {}
+        if self.skills_root.exists():
+            for skill_md in self.skills_root.rglob("SKILL.md"):
+                try:
+                    st = skill_md.stat()
+                except OSError:
+                    continue
+                previous = self._entries.get(skill_md)
+                if previous and previous[:2] == (st.st_mtime_ns, st.st_size):
+                    entries[skill_md] = previous
+                    continue
+                try:
+                    name = self.normalize(read_frontmatter(skill_md).name)
+                except OSError:
+                    continue
+                entries[skill_md] = (st.st_mtime_ns, st.st_size, name)
+
+        self._entries = entries
+        self._rebuild()
+
+    def update(self, skill_mds: Iterable[Path]) -> None:
+        """
+        Pick up changes to the given SKILL.md files only (no directory scan).
+
+        Files that no longer exist are removed from the index.
+        """
+        for skill_md in skill_mds:
+            skill_md = Path(skill_md).resolve()
+            try:
+                st = skill_md.stat()
+                name = self.normalize(read_frontmatter(skill_md).name)
+            except OSError:
+                self._entries.pop(skill_md, None)
+                continue
+            self._entries[skill_md] = (st.st_mtime_ns, st.st_size, name)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._by_name = {}
+        for skill_md in sorted(self._entries):
+            name = self._entries[skill_md][2]
+            if name:
+                self._by_name.setdefault(name, []).append(skill_md.parent)
+
+    def skills_named(self, name: str) -> list[Path]:
+        """Skill directories whose frontmatter name is name, sorted."""
+        return list(self._by_name.get(self.normalize(name), []))
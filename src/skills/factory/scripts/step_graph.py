@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Step-chain graph of a skill's steps/ directory.
+
+Each step-*.md file is parsed once into an adjacency list over integer node
+ids. Reachability, strongly connected components (loops), terminal steps,
+dead ends and the longest path from the entry step are all computed in
+O(steps + transitions).
+
+Usage:
+    from step_graph import StepGraph
+
+    graph = StepGraph.from_files((f.stem, f.text) for f in corpus.step_chain_files)
+    graph.reachable("step-00-init")
+    graph.to_dict("step-00-init")
+"""
+
+import re
+from typing import Iterable, Optional
+
+from skill_corpus import PatternSet
+
+# A step reference: step-XX[a]-name
+STEP_REF = r"step-\d{2}[a-z]?-[\w-]+"
+
+# The reference forms recognized in a step file, searched with one PatternSet
+STEP_REF_PATTERNS = [
+    rf"→\s*`?{STEP_REF}",                # Direct reference → `step-XX-name.md`
+    rf"\|\s*→?\s*`?{STEP_REF}",          # Table format | → `step-XX-name.md` |
+    rf"(?i:next_step[:\s]+`?{STEP_REF})",  # next_step: step-XX-name.md
+    rf"`{STEP_REF}(?:\.md)?`",           # Any backtick reference to a step file
+]
+
+STEP_REF_RE = re.compile(STEP_REF, re.IGNORECASE)
+NEXT_STEP_SECTION_RE = re.compile(r"##\s*Next\s*Step.*?(?=##|\Z)", re.IGNORECASE | re.DOTALL)
+
+_REF_PATTERN_SET = PatternSet(STEP_REF_PATTERNS, flags=0)
+
+
+def parse_step_refs(content: str) -> tuple[Optional[str], set[str]]:
+    """
+    Return (next_step, references) of one step file.
+
+    next_step is the first step named in its "## Next Step" section (None if
+    there is none); references are all steps the file points to.
+    """
+    refs = set()
+    for matches in _REF_PATTERN_SET.search(content).values():
+        for text in matches:
+            refs.add(STEP_REF_RE.search(text).group())
+
+    next_step = None
+    section = NEXT_STEP_SECTION_RE.search(content)
+    if section:
+        first = STEP_REF_RE.search(section.group())
+        if first:
+            next_step = first.group()
+
+    return next_step, refs
+
+
+class StepGraph:
+    """
+    Directed graph of step transitions.
+
+    Nodes are the parsed step files plus any step they reference that has
+    no file (exists[i] is False for those). A step mentioning its own name
+    is not an edge.
+    """
+
+    def __init__(self):
+        self.names: list[str] = []
+        self.ids: dict[str, int] = {}
+        self.exists: list[bool] = []
+        self.edges: list[list[int]] = []
+        self.next_step: list[Optional[int]] = []
+        self.declares_next: list[bool] = []  # Has a Next Step or any step reference
+
+    def _node(self, name: str) -> int:
+        node = self.ids.get(name)
+        if node is None:
+            node = len(self.names)
+            self.ids[name] = node
+            self.names.append(name)
+            self.exists.append(False)
+            self.edges.append([])
+            self.next_step.append(None)
+            self.declares_next.append(False)
+        return node
+
+    @classmethod
+    def from_files(cls, files: Iterable[tuple[str, str]]) -> "StepGraph":
+        """Build the graph from (step_name, content) pairs."""
+        graph = cls()
+        parsed = []
+        for name, content in sorted(files):
+            graph.exists[graph._node(name)] = True
+            parsed.append((name, *parse_step_refs(content)))
+
+        for name, next_step, refs in parsed:
+            node = graph.ids[name]
+            graph.declares_next[node] = bool(next_step or refs)
+            targets = sorted(refs | ({next_step} if next_step else set()))
+            graph.edges[node] = [graph._node(t) for t in targets if t != name]
+            if next_step and next_step != name:
+                graph.next_step[node] = graph.ids[next_step]
+        return graph
+
+    @property
+    def steps(self) -> list[str]:
+        """Names of the steps that have a file, sorted."""
+        return sorted(name for node, name in enumerate(self.names) if self.exists[node])
+
+    @property
+    def missing(self) -> list[str]:
+        """Referenced steps without a file, sorted."""
+        return sorted(name for node, name in enumerate(self.names) if not self.exists[node])
+
+    def successors(self, name: str) -> list[str]:
+        return [self.names[t] for t in self.edges[self.ids[name]]]
+
+    def _reach(self, starts: Iterable[int], edges: list[list[int]]) -> set[int]:
+        seen = set()
+        stack = list(starts)
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(t for t in edges[node] if t not in seen)
+        return seen
+
+    def reachable(self, start: str) -> set[str]:
+        """Names of every node reachable from start (start included)."""
+        if start not in self.ids:
+            return {start}
+        return {self.names[n] for n in self._reach([self.ids[start]], self.edges)}
+
+    def referenced(self) -> set[str]:
+        """Names of every node some other step points to."""
+        return {self.names[t] for targets in self.edges for t in targets}
+
+    def terminals(self) -> list[str]:
+        """Steps with a file and no outgoing transition, sorted."""
+        return sorted(
+            name for node, name in enumerate(self.names)
+            if self.exists[node] and not self.edges[node]
+        )
+
+    def components(self) -> list[list[int]]:
+        """
+        Strongly connected components (iterative Tarjan).
+
+        Components are returned in reverse topological order: every edge
+        leaving a component points to one listed before it.
+        """
+        index = [-1] * len(self.names)
+        low = [0] * len(self.names)
+        on_stack = [False] * len(self.names)
+        stack: list[int] = []
+        components = []
+        counter = 0
+
+        for root in range(len(self.names)):
+            if index[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, child = work.pop()
+                if child == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                elif child > 0:
+                    # Returning from edges[node][child - 1]
+                    low[node] = min(low[node], low[self.edges[node][child - 1]])
+
+                for i in range(child, len(self.edges[node])):
+                    target = self.edges[node][i]
+                    if index[target] == -1:
+                        work.append((node, i + 1))
+                        work.append((target, 0))
+                        break
+                    if on_stack[target]:
+                        low[node] = min(low[node], index[target])
+                else:
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
+    def cycles(self) -> list[list[str]]:
+        """Loops: components of more than one step, each sorted by name."""
+        return sorted(
+            sorted(self.names[n] for n in component)
+            for component in self.components() if len(component) > 1
+        )
+
+    def dead_ends(self, start: str, finals: Optional[Iterable[str]] = None) -> list[str]:
+        """
+        Steps reachable from start from which no final step can be reached.
+
+        finals defaults to terminals(); steps a skill marks as final (e.g.
+        step-99-*) can be added even if they link back to earlier steps.
+        """
+        if start not in self.ids:
+            return []
+        reverse: list[list[int]] = [[] for _ in self.names]
+        for node, targets in enumerate(self.edges):
+            for target in targets:
+                reverse[target].append(node)
+        final_names = self.terminals() if finals is None else finals
+        can_finish = self._reach([self.ids[name] for name in final_names if name in self.ids], reverse)
+        reachable = self._reach([self.ids[start]], self.edges)
+        return sorted(
+            self.names[n] for n in reachable
+            if self.exists[n] and n not in can_finish
+        )
+
+    def longest_path(self, start: str) -> list[str]:
+        """
+        Longest chain of steps from start, counting each loop once.
+
+        Computed on the component DAG; the steps of a loop on the path are
+        listed together, sorted by name.
+        """
+        if start not in self.ids:
+            return []
+        components = self.components()
+        component_of = [0] * len(self.names)
+        for c, component in enumerate(components):
+            for node in component:
+                component_of[node] = c
+
+        # Reverse topological order: successors are settled before their predecessors
+        length = [0] * len(components)
+        best_next: list[Optional[int]] = [None] * len(components)
+        for c, component in enumerate(components):
+            for node in component:
+                for target in self.edges[node]:
+                    t = component_of[target]
+                    if t == c:
+                        continue
+                    if best_next[c] is None or length[t] > length[best_next[c]]:
+                        best_next[c] = t
+            length[c] = len(component) + (length[best_next[c]] if best_next[c] is not None else 0)
+
+        path = []
+        c: Optional[int] = component_of[self.ids[start]]
+        while c is not None:
+            path.extend(sorted(self.names[n] for n in components[c]))
+            c = best_next[c]
+        return path
+
+    def to_dict(self, entry: Optional[str] = None, finals: Optional[Iterable[str]] = None) -> dict:
+        """JSON-serializable summary; reachability fields need an entry step."""
+        result = {
+            "steps": self.steps,
+            "edges": {name: self.successors(name) for name in self.steps},
+            "next_step": {
+                name: self.names[self.next_step[self.ids[name]]]
+                for name in self.steps if self.next_step[self.ids[name]] is not None
+            },
+            "missing": self.missing,
+            "terminals": self.terminals(),
+            "cycles": self.cycles(),
+        }
+        if entry is not None:
+            result["entry"] = entry
+            result["unreachable"] = sorted(set(self.steps) - self.reachable(entry))
+            result["dead_ends"] = self.dead_ends(entry, finals)
+            result["longest_path"] = self.longest_path(entry)
+        return result
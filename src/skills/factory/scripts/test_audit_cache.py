@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Tests for audit_cache.py - persistent cache of skill audit reports."""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import audit_skill
+from audit_cache import AuditCache, audit_key
+from path_index import PathIndex
+from skill_frontmatter import SkillNameIndex
+
+
+def write_skill(root: Path, rel: str, name: str, body: str = "") -> Path:
+    """Create root/rel/SKILL.md declaring name."""
+    skill_path = root / rel
+    skill_path.mkdir(parents=True, exist_ok=True)
+    (skill_path / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: Use when testing.\nuser-invocable: false\n---\n{body}"
+    )
+    return skill_path
+
+
+class TestAuditKey(unittest.TestCase):
+    """audit_key() must change exactly when an input of the audit changes."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir) / "skills"
+        self.skill = write_skill(self.root, "alpha", "alpha")
+        self.other = write_skill(self.root, "beta", "beta")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def key(self) -> str:
+        return audit_key(self.skill, SkillNameIndex(self.root))
+
+    def test_own_file_edit_changes_key(self):
+        """Test that editing SKILL.md, a step or a reference changes the key."""
+        keys = {self.key()}
+        write_skill(self.root, "alpha", "alpha", body="Edited\n")
+        keys.add(self.key())
+        (self.skill / "steps").mkdir()
+        keys.add(self.key())
+        (self.skill / "steps" / "step-00-init.md").write_text("# Init\n")
+        keys.add(self.key())
+        (self.skill / "references").mkdir()
+        (self.skill / "references" / "guide.md").write_text("v1")
+        keys.add(self.key())
+        (self.skill / "references" / "guide.md").write_text("v2")
+        keys.add(self.key())
+
+        self.assertEqual(len(keys), 6)
+
+    def test_unrelated_skill_edit_keeps_key(self):
+        """Test that editing a skill with another name leaves the key unchanged."""
+        before = self.key()
+        write_skill(self.root, "beta", "beta", body="Edited\n")
+        write_skill(self.root, "gamma", "gamma")
+
+        self.assertEqual(self.key(), before)
+
+    def test_same_name_collision_changes_key(self):
+        """Test that another skill taking (or dropping) the same name changes the key."""
+        before = self.key()
+        write_skill(self.root, "beta", "alpha")
+        collided = self.key()
+        write_skill(self.root, "beta", "beta")
+
+        self.assertNotEqual(collided, before)
+        self.assertEqual(self.key(), before)
+
+
+class TestAuditCache(unittest.TestCase):
+    """AuditCache lookups."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir) / "skills"
+        self.skill = write_skill(self.root, "alpha", "alpha")
+        self.cache_path = Path(self.temp_dir) / ".epci-cache" / "audit.json"
+        self.target = self.skill / "references" / "guide.md"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def store(self, probes: dict) -> None:
+        cache = AuditCache(self.cache_path)
+        cache.put(self.skill, "k1", {"skill_name": "alpha"}, probes)
+        cache.save()
+
+    def test_served_until_link_target_appears(self):
+        """Test that an entry is dropped once a path probed as missing exists."""
+        self.store({str(self.target): False})
+        cache = AuditCache(self.cache_path)
+        self.assertEqual(cache.get(self.skill, "k1"), {"skill_name": "alpha"})
+        self.assertIsNone(cache.get(self.skill, "k2"))
+
+        self.target.parent.mkdir()
+        self.target.write_text("guide")
+
+        self.assertIsNone(cache.get(self.skill, "k1"))
+        self.assertIsNone(cache.get(self.skill, "k1", PathIndex(self.root)))
+
+    def test_link_target_disappearing_invalidates(self):
+        """Test that an entry is dropped once a path probed as present is removed."""
+        self.target.parent.mkdir()
+        self.target.write_text("guide")
+        self.store({str(self.target): True})
+        self.assertIsNotNone(AuditCache(self.cache_path).get(self.skill, "k1", PathIndex(self.root)))
+
+        self.target.unlink()
+
+        self.assertIsNone(AuditCache(self.cache_path).get(self.skill, "k1", PathIndex(self.root)))
+
+    def test_fingerprint_bump_discards_entries(self):
+        """Test that a new AUDIT_CACHE_VERSION discards every entry."""
+        self.store({})
+
+        with patch("audit_cache.AUDIT_CACHE_VERSION", 2):
+            self.assertIsNone(AuditCache(self.cache_path).get(self.skill, "k1"))
+
+    def test_removed_skill_dropped_on_save(self):
+        """Test that entries of skills that no longer exist are not written back."""
+        self.store({})
+        shutil.rmtree(self.skill)
+        cache = AuditCache(self.cache_path)
+        cache.save()
+
+        self.assertIsNone(AuditCache(self.cache_path).get(self.skill, "k1"))
+
+
+class TestPartialAudit(unittest.TestCase):
+    """Partial audits (a phase selection) bypass the cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir) / "skills"
+        self.skill = write_skill(self.root, "alpha", "alpha")
+        write_skill(self.root, "beta", "beta")
+        self.cache = AuditCache(Path(self.temp_dir) / "audit.json")
+        SkillNameIndex._shared.clear()
+        PathIndex._shared.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_partial_audit_skips_key_and_indexes(self):
+        """Test that a phase selection builds no whole-tree index and stores nothing."""
+        phases = [audit_skill.AuditPhase.STEP_CHAIN, audit_skill.AuditPhase.TASK_TOOL]
+        with patch.object(audit_skill, "audit_key", side_effect=AssertionError("key computed")):
+            report, cached = audit_skill.audit_skill_cached(self.skill, self.cache, phases=phases)
+            batch = audit_skill.audit_all(self.root, workers=1, cache=self.cache, phases=phases)
+
+        self.assertFalse(cached)
+        self.assertEqual(set(report.phases), set(phases))
+        self.assertEqual(batch.cached, [False, False])
+        self.assertEqual(SkillNameIndex._shared, {})
+        self.assertEqual(PathIndex._shared, {})
+        self.assertFalse(self.cache.path.exists())
+
+    def test_full_audit_cached(self):
+        """Test that a full audit is stored and served, also when all phases are listed."""
+        _, cached = audit_skill.audit_skill_cached(self.skill, self.cache)
+        self.assertFalse(cached)
+
+        report, cached = audit_skill.audit_skill_cached(self.skill, self.cache, phases=list(audit_skill.AuditPhase))
+        self.assertTrue(cached)
+        self.assertEqual(set(report.phases), set(audit_skill.AuditPhase))
+
+
+class TestDefaultCachePath(unittest.TestCase):
+    """default_cache_path() in audit_skill.py."""
+
+    def test_inside_plugin_tree(self):
+        """Test that the cache goes to the project root above .claude-plugin/."""
+        plugin_dir = next(p for p in Path(audit_skill.__file__).resolve().parents if (p / ".claude-plugin").is_dir())
+        self.assertEqual(audit_skill.default_cache_path(), plugin_dir.parent / audit_skill.CACHE_RELPATH)
+
+    def test_outside_plugin_tree_disables_cache(self):
+        """Test that no path (not the cwd) is returned outside a plugin tree."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(audit_skill, "__file__", str(Path(tmpdir) / "audit_skill.py")):
+                self.assertIsNone(audit_skill.default_cache_path())
+
+
+if __name__ == "__main__":
+    unittest.main()
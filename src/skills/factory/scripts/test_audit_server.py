@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for audit_server.py - long-running skill auditor (JSON-RPC)."""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from audit_server import INVALID_PARAMS, METHOD_NOT_FOUND, AuditServer
+from audit_skill import SkillAuditor, report_to_dict
+from path_index import PathIndex
+from skill_frontmatter import SkillNameIndex
+
+SKILLS_DIR = Path(__file__).resolve().parents[2]
+
+
+def write_skill(root: Path, rel: str, name: str) -> Path:
+    skill_path = root / rel
+    skill_path.mkdir(parents=True, exist_ok=True)
+    (skill_path / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: Use when testing.\nuser-invocable: true\n---\n# {name}\n"
+    )
+    return skill_path
+
+
+def step(*targets: str) -> str:
+    return "# Step\n\n## Next Step\n\n" + "".join(f"→ `{target}.md`\n" for target in targets)
+
+
+def standalone_audit(skill_path: Path) -> dict:
+    """Report of a one-shot SkillAuditor run, with fresh shared indexes."""
+    SkillNameIndex._shared.clear()
+    PathIndex._shared.clear()
+    return report_to_dict(SkillAuditor(skill_path).audit())
+
+
+class TestAuditServer(unittest.TestCase):
+    """AuditServer.handle() on a temporary skills root."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir).resolve() / "skills"
+        self.alpha = write_skill(self.root, "alpha", "alpha")
+        self.beta = write_skill(self.root, "beta", "beta")
+        steps = self.alpha / "steps"
+        steps.mkdir()
+        (steps / "step-00-init.md").write_text(step("step-01-work"))
+        (steps / "step-01-work.md").write_text(step())
+        (steps / "step-02-wrap.md").write_text(step())
+        self.server = AuditServer(self.root)
+        self.next_id = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def call(self, method: str, **params) -> dict:
+        self.next_id += 1
+        response = self.server.handle({"jsonrpc": "2.0", "id": self.next_id, "method": method, "params": params})
+        self.assertEqual(response["id"], self.next_id)
+        return response
+
+    def audit(self, skill: str) -> dict:
+        report = self.call("audit", skill_path=skill)["result"]
+        del report["seconds"]
+        return report
+
+    def test_audit_matches_skill_auditor(self):
+        """Test that a served audit equals a one-shot SkillAuditor report."""
+        self.assertEqual(self.audit("alpha"), standalone_audit(self.alpha))
+        self.assertEqual(self.audit(str(self.beta)), standalone_audit(self.beta))
+
+    def test_audit_matches_skill_auditor_on_repository_skills(self):
+        """Test served audits of the plugin's own skills against SkillAuditor."""
+        server = AuditServer(SKILLS_DIR)
+        for rel in ("brainstorm", "core/breakpoint-system", "factory"):
+            with self.subTest(skill=rel):
+                response = server.handle({
+                    "jsonrpc": "2.0", "id": 1, "method": "audit", "params": {"skill_path": rel},
+                })
+                report = response["result"]
+                del report["seconds"]
+                self.assertEqual(report, standalone_audit(SKILLS_DIR / rel))
+
+    def test_step_change_reloads_file_and_drops_graph(self):
+        """Test that didChange on a step re-reads it and rebuilds the step graph."""
+        self.audit("alpha")
+        self.assertIn(self.alpha, self.server.graphs)
+        self.assertIn("step-02-wrap", self.server.graphs[self.alpha].terminals())
+
+        step_file = self.alpha / "steps" / "step-01-work.md"
+        step_file.write_text(step("step-02-wrap"))
+        result = self.call("didChange", paths=["alpha/steps/step-01-work.md"])["result"]
+
+        self.assertEqual(result, {"reloaded": [str(self.alpha)]})
+        self.assertNotIn(self.alpha, self.server.graphs)
+        report = self.audit("alpha")
+        self.assertEqual(report["step_graph"]["edges"]["step-01-work"], ["step-02-wrap"])
+        self.assertEqual(report, standalone_audit(self.alpha))
+
+    def test_new_and_removed_skill(self):
+        """Test that a created SKILL.md loads its skill and a deleted one drops it."""
+        gamma = write_skill(self.root, "gamma", "alpha")
+        result = self.call("didChange", paths=["gamma/SKILL.md"])["result"]
+
+        self.assertEqual(result, {"reloaded": [str(gamma)]})
+        self.assertIn(str(gamma), self.call("status")["result"]["skills"])
+        # The name index sees the duplicate name right away
+        self.assertEqual(self.audit("alpha"), standalone_audit(self.alpha))
+
+        (self.beta / "SKILL.md").unlink()
+        self.call("didChange", paths=["beta/SKILL.md"])
+
+        self.assertNotIn(str(self.beta), self.call("status")["result"]["skills"])
+
+    def test_removed_skill_directory_rescans(self):
+        """Test that deleting a whole skill directory drops it from the loaded skills."""
+        shutil.rmtree(self.beta)
+        self.call("didChange", paths=["beta"])
+
+        self.assertEqual(self.call("status")["result"]["skills"], [str(self.alpha)])
+
+    def test_path_outside_root_is_invalid(self):
+        """Test that paths escaping the skills root are rejected with INVALID_PARAMS."""
+        outside = Path(self.temp_dir) / "elsewhere"
+        for method, params in (
+            ("audit", {"skill_path": "../elsewhere"}),
+            ("audit", {"skill_path": str(outside)}),
+            ("didChange", {"paths": ["alpha/SKILL.md", "../../etc/passwd"]}),
+        ):
+            with self.subTest(method=method, params=params):
+                response = self.call(method, **params)
+                self.assertEqual(response["error"]["code"], INVALID_PARAMS)
+
+    def test_notifications_get_no_reply(self):
+        """Test that requests without an id are processed but never answered."""
+        (self.alpha / "steps" / "step-02-wrap.md").unlink()
+
+        self.assertIsNone(self.server.handle({
+            "jsonrpc": "2.0", "method": "didChange", "params": {"paths": ["alpha/steps/step-02-wrap.md"]},
+        }))
+        self.assertIsNone(self.server.handle({"jsonrpc": "2.0", "method": "noSuchMethod"}))
+        self.assertIsNone(self.server.handle({"jsonrpc": "2.0", "method": "audit", "params": {}}))
+
+        self.assertNotIn("step-02-wrap", self.audit("alpha")["step_graph"]["steps"])
+        self.assertEqual(self.call("noSuchMethod")["error"]["code"], METHOD_NOT_FOUND)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Tests for path_index.py - in-memory existence index of a skill tree."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from path_index import PathIndex
+
+
+class TestIndexed(unittest.TestCase):
+    """Which paths _indexed() answers for, and exists() on each kind."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp()).resolve()
+        self.root = self.temp_dir / "skills"
+        (self.root / "alpha" / "references").mkdir(parents=True)
+        (self.root / "alpha" / "references" / "guide.md").write_text("guide")
+        (self.root / "beta").mkdir()
+        self.outside = self.temp_dir / "shared" / "docs"
+        self.outside.mkdir(parents=True)
+        (self.outside / "common.md").write_text("common")
+        (self.temp_dir / "shared" / "top.md").write_text("top")
+        (self.root / "beta" / "docs").symlink_to(self.outside, target_is_directory=True)
+        (self.root / "beta" / "guide.md").symlink_to(self.root / "alpha" / "references" / "guide.md")
+        self.index = PathIndex(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_plain_paths_answered_from_index(self):
+        """Test that paths under the root are normalized and answered without a stat."""
+        guide = self.root / "alpha" / "references" / "guide.md"
+        self.assertEqual(self.index._indexed(guide), str(guide))
+        self.assertTrue(self.index.exists(guide))
+        self.assertFalse(self.index.exists(self.root / "alpha" / "missing.md"))
+
+        # Created after the walk: the index has not seen it yet
+        (self.root / "alpha" / "late.md").write_text("late")
+        self.assertFalse(self.index.exists(self.root / "alpha" / "late.md"))
+
+    def test_dotdot_inside_root(self):
+        """Test that '..' staying under the root is removed lexically."""
+        path = self.root / "beta" / ".." / "alpha" / "references" / "guide.md"
+
+        self.assertEqual(self.index._indexed(path), str(self.root / "alpha" / "references" / "guide.md"))
+        self.assertTrue(self.index.exists(path))
+        self.assertTrue(self.index.is_inside(path))
+
+    def test_dotdot_leaving_root(self):
+        """Test that a path leaving the root falls back to the filesystem."""
+        path = self.root / "alpha" / ".." / ".." / "shared" / "top.md"
+
+        self.assertIsNone(self.index._indexed(path))
+        self.assertTrue(self.index.exists(path))
+        self.assertFalse(self.index.is_inside(path))
+
+    def test_relative_path(self):
+        """Test that a relative path is taken from the working directory."""
+        cwd = os.getcwd()
+        os.chdir(self.root / "alpha")
+        try:
+            self.assertEqual(self.index._indexed(Path("references/guide.md")),
+                             str(self.root / "alpha" / "references" / "guide.md"))
+            self.assertIsNone(self.index._indexed(Path("../../shared/top.md")))
+        finally:
+            os.chdir(cwd)
+
+    def test_through_symlink(self):
+        """Test that paths through a symbolic link are resolved, not looked up."""
+        for path in (
+            self.root / "beta" / "docs",
+            self.root / "beta" / "docs" / "common.md",
+            self.root / "beta" / "guide.md",
+        ):
+            with self.subTest(path=path):
+                self.assertIsNone(self.index._indexed(path))
+                self.assertTrue(self.index.exists(path))
+        self.assertFalse(self.index.exists(self.root / "beta" / "docs" / "missing.md"))
+        self.assertFalse(self.index.is_inside(self.root / "beta" / "docs" / "common.md"))
+
+    def test_dotdot_after_symlink(self):
+        """Test that '..' after a symbolic link goes to the resolved parent, as the OS does."""
+        path = self.root / "beta" / "docs" / ".." / "top.md"
+
+        self.assertIsNone(self.index._indexed(path))
+        self.assertTrue(self.index.exists(path))
+        self.assertFalse(self.index.exists(self.root / "beta" / "docs" / ".." / "guide.md"))
+
+
+class TestUpdate(unittest.TestCase):
+    """update() with added and removed paths."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp()).resolve()
+        self.root = self.temp_dir / "skills"
+        (self.root / "alpha" / "references").mkdir(parents=True)
+        (self.root / "alpha" / "references" / "guide.md").write_text("guide")
+        self.index = PathIndex(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def assertSameAsRefresh(self):
+        fresh = PathIndex(self.root)
+        self.assertEqual(self.index._paths, fresh._paths)
+        self.assertEqual(self.index._symlinks, fresh._symlinks)
+
+    def test_added_directory_is_walked(self):
+        """Test that a new directory is indexed with everything below it."""
+        gamma = self.root / "gamma"
+        (gamma / "steps" / "deep").mkdir(parents=True)
+        (gamma / "SKILL.md").write_text("skill")
+        (gamma / "steps" / "deep" / "step-00-init.md").write_text("step")
+
+        self.index.update([gamma])
+
+        self.assertTrue(self.index.exists(gamma / "SKILL.md"))
+        self.assertTrue(self.index.exists(gamma / "steps" / "deep" / "step-00-init.md"))
+        self.assertSameAsRefresh()
+
+    def test_removed_directory_drops_descendants(self):
+        """Test that a removed directory takes every path below it out of the index."""
+        references = self.root / "alpha" / "references"
+        (self.root / "alpha" / "references-old.md").write_text("sibling")
+        self.index.update([self.root / "alpha" / "references-old.md"])
+        shutil.rmtree(references)
+
+        self.index.update([references])
+
+        self.assertFalse(self.index.exists(references))
+        self.assertFalse(self.index.exists(references / "guide.md"))
+        self.assertTrue(self.index.exists(self.root / "alpha" / "references-old.md"))
+        self.assertSameAsRefresh()
+
+    def test_directory_replaced_by_symlink(self):
+        """Test that a directory replaced by a symbolic link is no longer descended into."""
+        references = self.root / "alpha" / "references"
+        shutil.rmtree(references)
+        target = self.temp_dir / "elsewhere"
+        target.mkdir()
+        (target / "guide.md").write_text("moved")
+        references.symlink_to(target, target_is_directory=True)
+
+        self.index.update([references])
+
+        self.assertIn(str(references), self.index._symlinks)
+        self.assertIsNone(self.index._indexed(references / "guide.md"))
+        self.assertTrue(self.index.exists(references / "guide.md"))
+        self.assertSameAsRefresh()
+
+    def test_path_outside_root_clears_stat_cache(self):
+        """Test that a change outside the root invalidates the fallback answers."""
+        outside = self.temp_dir / "shared.md"
+        path = self.root / ".." / "shared.md"
+        self.assertFalse(self.index.exists(path))
+
+        outside.write_text("shared")
+        self.index.update([outside])
+
+        self.assertTrue(self.index.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
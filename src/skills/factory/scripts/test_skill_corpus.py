@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Tests for skill_corpus.py - shared skill corpus and PatternSet."""
+
+import re
+import unittest
+from pathlib import Path
+
+from audit_skill import SkillAuditor
+from skill_corpus import PatternSet, _literal_prefixes
+from step_graph import STEP_REF_PATTERNS
+
+SKILLS_DIR = Path(__file__).resolve().parents[2]
+
+
+def finditer_hits(patterns: list[str], text: str, flags: int = re.IGNORECASE) -> dict[str, list[str]]:
+    """Reference result: each pattern run on its own."""
+    return {p: [m.group() for m in re.finditer(p, text, flags)] for p in dict.fromkeys(patterns)}
+
+
+class TestPatternSet(unittest.TestCase):
+    """PatternSet must return exactly what per-pattern re.finditer returns."""
+
+    def assertSameAsFinditer(self, patterns, texts, flags=re.IGNORECASE):
+        pattern_set = PatternSet(patterns, flags=flags)
+        for text in texts:
+            with self.subTest(text=text[:40]):
+                self.assertEqual(pattern_set.search(text), finditer_hits(patterns, text, flags))
+
+    def test_literal_prefixes(self):
+        """Test that each top-level alternative yields its leading literal."""
+        self.assertEqual(_literal_prefixes(r"epci:x|@skill:epci:x|`x`"), ["epci:x", "@skill:epci:x", "`x`"])
+        self.assertEqual(_literal_prefixes(r"type:\s*\w+"), ["type:"])
+        self.assertEqual(_literal_prefixes(r"ab?c|d(e|f)"), ["a", "d"])
+        self.assertEqual(_literal_prefixes(r"a[|(]b|c"), ["a", "c"])
+        self.assertIsNone(_literal_prefixes(r"\|\s*x"))
+        self.assertIsNone(_literal_prefixes(r"(?i:next)"))
+        self.assertIsNone(_literal_prefixes(r"x|[ab]"))
+
+    def test_overlapping_and_repeated_matches(self):
+        """Test overlapping patterns, repeated hits and duplicate patterns."""
+        patterns = [r"epci:core|@skill:epci:core", r"epci:\w+", r"epci:\w+", r"a*", r"type:\s*\w+"]
+        texts = [
+            "",
+            "no match here",
+            "@skill:epci:core then epci:core and EPCI:Stack",
+            "type: user\ntype:   Quiz aaa",
+        ]
+        self.assertSameAsFinditer(patterns, texts)
+
+    def test_case_folding(self):
+        """Test non-ASCII characters that IGNORECASE matches with ASCII letters."""
+        patterns = [r"epci:x", r"skill", r"kit", r"→\s*step", r"éte"]
+        texts = ["EPCİ:X", "epcı:x", "ſkill", "KIT", "ÉTÉ → STEP", "i̇"]
+        self.assertSameAsFinditer(patterns, texts)
+
+    def test_case_sensitive(self):
+        """Test that flags=0 keeps matching case-sensitive."""
+        self.assertSameAsFinditer(STEP_REF_PATTERNS, ["→ `step-01-a.md`", "→ `STEP-01-a`", "Next_Step: step-02-b"], flags=0)
+
+    def test_audit_patterns_on_repository_skills(self):
+        """Test the audit and step-graph patterns against every markdown file of the skills."""
+        core_skills = list(SkillAuditor.DEFAULT_REQUIRED_CORE_SKILLS)
+        for requirements in SkillAuditor.CORE_SKILLS_REQUIREMENTS.values():
+            core_skills += requirements["required"] + requirements["optional"]
+        audit_patterns = [
+            SkillAuditor.BREAKPOINT_SYSTEM_PATTERN,
+            SkillAuditor.BREAKPOINT_TYPE_PATTERN,
+            SkillAuditor.STACK_AUTO_DETECT_PATTERN,
+            SkillAuditor.STACK_SELF_DETECT_PATTERN,
+            *(SkillAuditor._core_skill_pattern(name) for name in core_skills),
+        ]
+        texts = [path.read_text(encoding="utf-8") for path in sorted(SKILLS_DIR.rglob("*.md"))]
+
+        self.assertSameAsFinditer(audit_patterns, texts)
+        self.assertSameAsFinditer(STEP_REF_PATTERNS, texts, flags=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
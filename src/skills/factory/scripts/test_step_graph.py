@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Tests for step_graph.py - step-chain graph of a skill."""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from audit_skill import AuditPhase, SkillAuditor
+from step_graph import StepGraph, parse_step_refs
+
+
+def step(*targets: str) -> str:
+    """Content of a step file whose Next Step section points to targets."""
+    lines = ["# Step", "", "## Next Step", ""]
+    lines += [f"→ `{target}.md`" for target in targets]
+    return "\n".join(lines) + "\n"
+
+
+def graph(**steps: tuple) -> StepGraph:
+    """StepGraph of step files given as name=(target, ...), '_' standing for '-'."""
+    return StepGraph.from_files((name.replace("_", "-"), step(*targets)) for name, targets in steps.items())
+
+
+class TestParseStepRefs(unittest.TestCase):
+    """Reference forms recognized in a step file."""
+
+    def test_reference_forms(self):
+        """Test arrow, table, next_step and backtick references."""
+        content = (
+            "See `step-03-review.md` first.\n"
+            "| Approved | → `step-04-done.md` |\n"
+            "next_step: step-05-retry\n"
+            "## Next Step\n"
+            "→ step-02-plan\n"
+        )
+
+        next_step, refs = parse_step_refs(content)
+
+        self.assertEqual(next_step, "step-02-plan")
+        self.assertEqual(refs, {"step-02-plan", "step-03-review", "step-04-done", "step-05-retry"})
+
+
+class TestStepGraph(unittest.TestCase):
+    """Graph algorithms on small hand-built chains."""
+
+    def test_linear_chain(self):
+        """Test a plain chain: no loop, no dead end, the whole chain is the longest path."""
+        g = graph(step_00_init=("step-01-plan",), step_01_plan=("step-02-done",), step_02_done=())
+
+        self.assertEqual(g.cycles(), [])
+        self.assertEqual(g.terminals(), ["step-02-done"])
+        self.assertEqual(g.dead_ends("step-00-init"), [])
+        self.assertEqual(g.longest_path("step-00-init"), ["step-00-init", "step-01-plan", "step-02-done"])
+
+    def test_self_loop_is_not_an_edge(self):
+        """Test that a step naming itself is neither a cycle nor an outgoing transition."""
+        g = graph(step_00_init=("step-01-loop",), step_01_loop=("step-01-loop",))
+
+        self.assertEqual(g.successors("step-01-loop"), [])
+        self.assertEqual(g.cycles(), [])
+        self.assertEqual(g.terminals(), ["step-01-loop"])
+        self.assertEqual(g.dead_ends("step-00-init"), [])
+
+    def test_two_node_cycle_with_exit(self):
+        """Test that a loop with an exit is a cycle but not a dead end."""
+        g = graph(
+            step_00_init=("step-01-draft",),
+            step_01_draft=("step-02-review",),
+            step_02_review=("step-01-draft", "step-03-done"),
+            step_03_done=(),
+        )
+
+        self.assertEqual(g.cycles(), [["step-01-draft", "step-02-review"]])
+        self.assertEqual(g.dead_ends("step-00-init"), [])
+        self.assertEqual(
+            g.longest_path("step-00-init"),
+            ["step-00-init", "step-01-draft", "step-02-review", "step-03-done"],
+        )
+
+    def test_dead_end_loop(self):
+        """Test that a loop without exit makes its steps dead ends."""
+        g = graph(
+            step_00_init=("step-01-draft", "step-03-done"),
+            step_01_draft=("step-02-review",),
+            step_02_review=("step-01-draft",),
+            step_03_done=(),
+        )
+
+        self.assertEqual(g.cycles(), [["step-01-draft", "step-02-review"]])
+        self.assertEqual(g.dead_ends("step-00-init"), ["step-01-draft", "step-02-review"])
+        self.assertEqual(g.dead_ends("step-00-init", finals=["step-02-review"]), ["step-03-done"])
+        self.assertEqual(g.longest_path("step-00-init"), ["step-00-init", "step-01-draft", "step-02-review"])
+
+    def test_unreachable_step(self):
+        """Test that a step nothing points to is unreachable but not a dead end."""
+        g = graph(step_00_init=("step-01-done",), step_01_done=(), step_05_orphan=("step-99-missing",))
+
+        summary = g.to_dict("step-00-init")
+
+        self.assertEqual(summary["unreachable"], ["step-05-orphan"])
+        self.assertEqual(summary["dead_ends"], [])
+        self.assertEqual(summary["missing"], ["step-99-missing"])
+        self.assertNotIn("step-05-orphan", g.referenced())
+
+    def test_components_in_reverse_topological_order(self):
+        """Test that every edge between components points to an earlier component."""
+        g = graph(
+            step_00_init=("step-01-a", "step-03-c"),
+            step_01_a=("step-02-b",),
+            step_02_b=("step-01-a", "step-03-c"),
+            step_03_c=("step-04-d",),
+            step_04_d=("step-03-c", "step-05-e"),
+            step_05_e=(),
+        )
+        components = g.components()
+        position = {node: i for i, component in enumerate(components) for node in component}
+
+        self.assertEqual(sorted(n for c in components for n in c), list(range(len(g.names))))
+        for node, targets in enumerate(g.edges):
+            for target in targets:
+                self.assertLessEqual(position[target], position[node])
+
+    def test_long_chain_does_not_recurse(self):
+        """Test that Tarjan and the longest path handle chains deeper than the recursion limit."""
+        names = [f"step-00-n{i:04d}" for i in range(3000)]
+        files = [(name, step(nxt)) for name, nxt in zip(names, names[1:])] + [(names[-1], step(names[0]))]
+        g = StepGraph.from_files(files)
+
+        self.assertEqual(g.cycles(), [names])
+        self.assertEqual(len(g.longest_path(names[0])), 3000)
+        self.assertEqual(len(g.dead_ends(names[0])), 3000)
+
+
+class TestDeadEndCheck(unittest.TestCase):
+    """Check P5.6 of the skill audit."""
+
+    def setUp(self):
+        self.skill_path = Path(tempfile.mkdtemp()) / "looping"
+        (self.skill_path / "steps").mkdir(parents=True)
+        (self.skill_path / "SKILL.md").write_text(
+            "---\nname: looping\ndescription: Use when testing.\nuser-invocable: true\n---\n# Looping\n"
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.skill_path.parent, ignore_errors=True)
+
+    def check(self, **steps: tuple):
+        for name, targets in steps.items():
+            (self.skill_path / "steps" / f"{name.replace('_', '-')}.md").write_text(step(*targets))
+        report = SkillAuditor(self.skill_path).audit([AuditPhase.STEP_CHAIN])
+        results = report.phases[AuditPhase.STEP_CHAIN].results
+        return next(r for r in results if r.check_id == "P5.6")
+
+    def test_loop_with_exit_passes(self):
+        """Test that P5.6 passes when the loop can reach the final step."""
+        result = self.check(
+            step_00_init=("step-01-draft",),
+            step_01_draft=("step-02-review",),
+            step_02_review=("step-01-draft", "step-99-finish"),
+            step_99_finish=(),
+        )
+
+        self.assertTrue(result.passed)
+
+    def test_closed_loop_fails(self):
+        """Test that P5.6 reports the steps and the loop that never reach a final step."""
+        result = self.check(
+            step_00_init=("step-01-draft", "step-99-finish"),
+            step_01_draft=("step-02-review",),
+            step_02_review=("step-01-draft",),
+            step_99_finish=(),
+        )
+
+        self.assertFalse(result.passed)
+        self.assertIn("step-01-draft, step-02-review", result.message)
+        self.assertIn("loop between", result.message)
+
+
+if __name__ == "__main__":
+    unittest.main()
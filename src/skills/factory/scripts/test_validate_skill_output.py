@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Tests for validate_skill_output.py - SKILL.md validation rules."""
+
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from report_stream import SARIF_SCHEMA, SARIF_VERSION
+from validate_skill_output import (
+    VALIDATION_RULES,
+    RuleCost,
+    RuleInput,
+    RuleSeverity,
+    SkillValidator,
+    ValidationResult,
+    stream_validation,
+    validation_rule,
+)
+
+
+def write_skill(root: Path, rel: str, name: str, description: str = "Use when testing.") -> Path:
+    """Create root/rel/SKILL.md declaring name."""
+    skill_path = root / rel
+    skill_path.mkdir(parents=True, exist_ok=True)
+    (skill_path / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\n# {name}\n\nSee [guide](references/guide.md).\n"
+    )
+    return skill_path
+
+
+class TestStreaming(unittest.TestCase):
+    """Results streamed through on_result and stream_validation()."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir) / "skills"
+        self.skill = write_skill(self.root, "bad", "Bad_Name")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_streamed_as_completed(self):
+        """Test that on_result sees every result, cheap rules first, and the report keeps registration order."""
+        validator = SkillValidator(self.skill, skills_root=self.root)
+        order = {rule.check_number: i for i, rule in enumerate(validator.rules)}
+        cost = {rule.check_number: rule.cost for rule in validator.rules}
+        for fail_fast in (False, True):
+            with self.subTest(fail_fast=fail_fast):
+                streamed = []
+                report = validator.validate_all(on_result=streamed.append, fail_fast=fail_fast)
+
+                self.assertCountEqual(streamed, report.results)
+                self.assertEqual([cost[r.check_number] for r in streamed],
+                                 sorted((cost[r.check_number] for r in streamed), key=lambda c: c.value))
+                self.assertEqual([order[r.check_number] for r in report.results],
+                                 sorted(order[r.check_number] for r in report.results))
+                # "Name unique" is registered first but is a filesystem rule
+                self.assertNotEqual(streamed[0].name, "Name unique")
+
+    def test_missing_skill_file_streamed(self):
+        """Test that the "File exists" failure is streamed too."""
+        streamed = []
+        report = SkillValidator(Path(self.temp_dir) / "none", skills_root=self.root).validate_all(
+            on_result=streamed.append,
+        )
+
+        self.assertEqual(streamed, report.results)
+        self.assertFalse(streamed[0].passed)
+
+    def test_sarif_output_is_valid_sarif(self):
+        """Test that the SARIF stream parses as one SARIF 2.1.0 log with a result per failure."""
+        validator = SkillValidator(self.skill, skills_root=self.root)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = stream_validation(validator, "sarif")
+
+        log = json.loads(output.getvalue())
+        failed = [r for r in validator.report.results if not r.passed]
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(log["$schema"], SARIF_SCHEMA)
+        self.assertEqual(log["version"], SARIF_VERSION)
+        self.assertEqual(len(log["runs"]), 1)
+        run = log["runs"][0]
+        self.assertEqual(run["tool"]["driver"]["name"], "epci-validate-skill")
+        self.assertEqual(run["properties"], {"skill_count": 1, "failed_count": 1})
+        self.assertCountEqual([r["ruleId"] for r in run["results"]], [str(r.check_number) for r in failed])
+        for result in run["results"]:
+            self.assertIn(result["level"], ("error", "warning", "note"))
+            self.assertTrue(result["message"]["text"])
+            uri = result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"]
+            self.assertTrue(uri.endswith("bad/SKILL.md"))
+
+    def test_ndjson_output_records(self):
+        """Test that NDJSON has a check record per result, then a skill and a summary record."""
+        validator = SkillValidator(self.skill, skills_root=self.root)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            stream_validation(validator, "ndjson")
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        self.assertCountEqual(
+            [r["check_id"] for r in records if r["type"] == "check"],
+            [str(r.check_number) for r in validator.report.results],
+        )
+        self.assertEqual([r["type"] for r in records[-2:]], ["skill", "summary"])
+
+
+class TestRuleRegistry(unittest.TestCase):
+    """Scheduling of rules registered in a caller's registry."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir) / "skills"
+        self.skill = write_skill(self.root, "alpha", "alpha")
+        self.registry = []
+        self.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def register(self, number: int, cost: RuleCost, passed: bool = True,
+                 severity: RuleSeverity = RuleSeverity.REQUIRED) -> None:
+        @validation_rule(number, f"Rule {number}", {RuleInput.FRONTMATTER}, cost,
+                         severity=severity, registry=self.registry)
+        def check(validator, is_warning=False):
+            self.calls.append((number, validator._path_index is not None))
+            validator.report.add(ValidationResult(number, f"Rule {number}", passed, "checked", is_warning))
+
+    def validate(self, **kwargs):
+        return SkillValidator(self.skill, skills_root=self.root, rules=self.registry).validate_all(**kwargs)
+
+    def test_caller_registry_runs_by_cost(self):
+        """Test that rules run and stream cheapest first while the report keeps registration order."""
+        self.register(1, RuleCost.EXPENSIVE)
+        self.register(2, RuleCost.CHEAP)
+        self.register(3, RuleCost.MODERATE)
+        self.register(4, RuleCost.CHEAP)
+        streamed = []
+
+        report = self.validate(on_result=streamed.append)
+
+        self.assertEqual([number for number, _ in self.calls], [2, 4, 3, 1])
+        # The shared indexes are built right before the first filesystem rule
+        self.assertEqual([ready for _, ready in self.calls], [False, False, False, True])
+        self.assertEqual([r.check_number for r in report.results], [1, 2, 3, 4])
+        self.assertEqual([r.check_number for r in streamed], [2, 4, 3, 1])
+        self.assertFalse(any(rule in VALIDATION_RULES for rule in self.registry))
+
+    def test_fail_fast_stops_on_required_failure_in_strict_mode(self):
+        """Test that fail_fast skips the remaining rules after a failed required one only."""
+        self.register(1, RuleCost.CHEAP, passed=False, severity=RuleSeverity.RECOMMENDED)
+        self.register(2, RuleCost.EXPENSIVE)
+        self.register(3, RuleCost.MODERATE, passed=False)
+        self.register(4, RuleCost.CHEAP)
+
+        for kwargs, ran in (
+            ({"fail_fast": True}, [1, 4, 3]),
+            ({"fail_fast": True, "permissive": True}, [1, 4, 3, 2]),
+            ({}, [1, 4, 3, 2]),
+        ):
+            with self.subTest(**kwargs):
+                self.calls.clear()
+                streamed = []
+
+                report = self.validate(on_result=streamed.append, **kwargs)
+
+                self.assertEqual([number for number, _ in self.calls], ran)
+                self.assertEqual([r.check_number for r in report.results], sorted(ran))
+                self.assertEqual([r.check_number for r in streamed], ran)
+                self.assertFalse(report.required_passed)
+
+    def test_recommended_failure_is_warning_when_permissive(self):
+        """Test that recommended rules report warnings, not required failures, in permissive mode."""
+        self.register(1, RuleCost.CHEAP, passed=False, severity=RuleSeverity.RECOMMENDED)
+
+        strict = self.validate()
+        permissive = self.validate(permissive=True)
+
+        self.assertFalse(strict.results[0].is_warning)
+        self.assertTrue(permissive.results[0].is_warning)
+        self.assertFalse(permissive.results[0].required)
+        self.assertTrue(permissive.required_passed)
+        self.assertEqual(permissive.warning_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
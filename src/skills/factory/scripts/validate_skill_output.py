@@ -8,6 +8,8 @@ Implements the 12-point checklist from references/checklist-validation.md.
 Usage:
     python validate_skill_output.py <skill_path>
     python validate_skill_output.py <skill_path> --permissive
+    python validate_skill_output.py <skill_path> --fail-fast    # Stop at the first required failure
+    python validate_skill_output.py <skill_path> --stream ndjson|sarif
 
 Exit codes:
     0 = All checks pass
@@ -18,8 +20,15 @@ import argparse
 import re
 import sys
 from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional
+
+# Import from sibling module
+from path_index import PathIndex
+from report_stream import STREAM_FORMATS, CheckRecord, make_reporter
+from skill_corpus import SkillCorpus
+from skill_frontmatter import SkillDocument, SkillNameIndex
 
 
 @dataclass
@@ -30,6 +39,80 @@ class ValidationResult:
     passed: bool
     message: str
     is_warning: bool = False
+    required: bool = True  # Set from the severity of the rule that produced it
+
+
+class RuleInput(Enum):
+    """What a validation rule reads."""
+    FRONTMATTER = "frontmatter"
+    BODY = "body"
+    FILESYSTEM = "filesystem"
+
+
+class RuleCost(Enum):
+    """Cost class of a validation rule; cheaper classes run first."""
+    CHEAP = 1      # Frontmatter fields only
+    MODERATE = 2   # Scans the SKILL.md body
+    EXPENSIVE = 3  # Reads other files or directory listings
+
+
+class RuleSeverity(Enum):
+    """Whether a failing rule blocks validation."""
+    REQUIRED = "required"        # Always blocking
+    RECOMMENDED = "recommended"  # Blocking in strict mode, warning if permissive
+
+
+@dataclass(frozen=True)
+class ValidationRule:
+    """
+    A registered validation check.
+
+    check(validator) adds its results to validator.report; recommended rules
+    are called as check(validator, is_warning=permissive).
+    """
+    check_number: int
+    name: str
+    check: Callable[..., None]
+    inputs: frozenset[RuleInput]
+    cost: RuleCost
+    severity: RuleSeverity = RuleSeverity.REQUIRED
+
+
+# Rules run by SkillValidator.validate_all(), in report order
+VALIDATION_RULES: list[ValidationRule] = []
+
+
+def validation_rule(
+    check_number: int,
+    name: str,
+    inputs: Iterable[RuleInput],
+    cost: RuleCost,
+    severity: RuleSeverity = RuleSeverity.REQUIRED,
+    registry: Optional[list[ValidationRule]] = None,
+) -> Callable[[Callable[..., None]], Callable[..., None]]:
+    """
+    Decorator registering a rule function (or SkillValidator method).
+
+    Example:
+        @validation_rule(14, "Changelog", {RuleInput.FILESYSTEM}, RuleCost.EXPENSIVE,
+                         severity=RuleSeverity.RECOMMENDED)
+        def check_changelog(validator, is_warning=False):
+            validator.report.add(ValidationResult(14, "Changelog", True, "OK", is_warning))
+
+    Args:
+        registry: Rule list to add to (default: VALIDATION_RULES)
+    """
+    def decorator(func: Callable[..., None]) -> Callable[..., None]:
+        (VALIDATION_RULES if registry is None else registry).append(ValidationRule(
+            check_number=check_number,
+            name=name,
+            check=func,
+            inputs=frozenset(inputs),
+            cost=cost,
+            severity=severity,
+        ))
+        return func
+    return decorator
 
 
 @dataclass
@@ -38,13 +121,16 @@ class ValidationReport:
     skill_name: str
     skill_path: Path
     results: list[ValidationResult] = field(default_factory=list)
+    on_result: Optional[Callable[[ValidationResult], None]] = field(default=None, repr=False, compare=False)
 
     def add(self, result: ValidationResult) -> None:
         self.results.append(result)
+        if self.on_result is not None:
+            self.on_result(result)
 
     @property
     def required_passed(self) -> bool:
-        return all(r.passed for r in self.results if r.check_number <= 9)
+        return all(r.passed for r in self.results if r.required)
 
     @property
     def all_passed(self) -> bool:
@@ -71,23 +157,44 @@ class SkillValidator:
     # Name pattern: lowercase, hyphens allowed, starts with letter
     NAME_PATTERN = re.compile(r"^[a-z][a-z0-9-]*$")
 
-    def __init__(self, skill_path: Path, skills_root: Optional[Path] = None):
+    def __init__(
+        self,
+        skill_path: Path,
+        skills_root: Optional[Path] = None,
+        corpus: Optional[SkillCorpus] = None,
+        name_index: Optional[SkillNameIndex] = None,
+        path_index: Optional[PathIndex] = None,
+        rules: Optional[list[ValidationRule]] = None,
+    ):
         """
         Initialize validator.
 
         Args:
             skill_path: Path to skill directory (containing SKILL.md)
             skills_root: Root directory for uniqueness check (default: auto-detect)
+            corpus: Already loaded skill files to reuse instead of reading from disk
+            name_index: Name index of skills_root (default: shared per-process index)
+            path_index: Existence index of skills_root for links (default: shared per-process index)
+            rules: Rules to run (default: VALIDATION_RULES, including rules registered by callers)
         """
         self.skill_path = Path(skill_path).resolve()
+        self.corpus = corpus
         self.skill_md = self.skill_path / "SKILL.md"
         self.skills_root = skills_root or self._find_skills_root()
         self.report: Optional[ValidationReport] = None
+        self._name_index = name_index
+        self._path_index = path_index
+        self.rules = VALIDATION_RULES if rules is None else rules
 
-        # Cached content
-        self._content: Optional[str] = None
+        # Parsed document (frontmatter eager, body/content lazy)
+        self._doc: Optional[SkillDocument] = None
         self._frontmatter: dict = {}
-        self._body: str = ""
+
+        # Paths whose existence was checked (path -> exists), for result caching
+        self.probed_paths: dict[str, bool] = {}
+
+        # Links of SKILL.md resolving outside skills_root
+        self.outside_links: list[str] = []
 
     def _find_skills_root(self) -> Path:
         """Find the skills/ directory by walking up from skill_path."""
@@ -102,69 +209,54 @@ class SkillValidator:
         return self.skill_path.parent
 
     def _load_skill(self) -> bool:
-        """Load and parse SKILL.md. Returns False if file doesn't exist."""
-        if not self.skill_md.exists():
+        """Load SKILL.md frontmatter. Returns False if file doesn't exist."""
+        if self.corpus is not None:
+            self._doc = self.corpus.document
+            if self._doc is None:
+                return False
+        elif not self.skill_md.exists():
             return False
-
-        self._content = self.skill_md.read_text(encoding="utf-8")
-
-        # Parse frontmatter
-        if self._content.startswith("---"):
-            parts = self._content.split("---", 2)
-            if len(parts) >= 3:
-                self._parse_frontmatter(parts[1])
-                self._body = parts[2]
-            else:
-                self._body = self._content
         else:
-            self._body = self._content
-
+            self._doc = SkillDocument(self.skill_md)
+        self._frontmatter = self._doc.frontmatter.fields
         return True
 
-    def _parse_frontmatter(self, frontmatter_text: str) -> None:
-        """Parse YAML frontmatter into dict."""
-        self._frontmatter = {}
-        current_key = None
-        current_value_lines = []
-
-        for line in frontmatter_text.strip().split("\n"):
-            # Check for new key
-            if ":" in line and not line.startswith(" ") and not line.startswith("\t"):
-                # Save previous key if any
-                if current_key and current_value_lines:
-                    self._frontmatter[current_key] = " ".join(current_value_lines).strip()
-
-                key, _, value = line.partition(":")
-                current_key = key.strip()
-                value = value.strip()
-
-                # Handle multiline indicator
-                if value in (">-", "|", ">"):
-                    current_value_lines = []
-                else:
-                    self._frontmatter[current_key] = value
-                    current_key = None
-                    current_value_lines = []
-            elif current_key:
-                # Continuation of multiline value
-                current_value_lines.append(line.strip())
-
-        # Save last key
-        if current_key and current_value_lines:
-            self._frontmatter[current_key] = " ".join(current_value_lines).strip()
-
-    def validate_all(self, permissive: bool = False) -> ValidationReport:
+    @property
+    def _content(self) -> str:
+        """Full SKILL.md text (read on first access)."""
+        return self._doc.content if self._doc else ""
+
+    @property
+    def _body(self) -> str:
+        """SKILL.md text after the frontmatter (read on first access)."""
+        return self._doc.body if self._doc else ""
+
+    def validate_all(
+        self,
+        permissive: bool = False,
+        on_result: Optional[Callable[[ValidationResult], None]] = None,
+        fail_fast: bool = False,
+    ) -> ValidationReport:
         """
-        Run all validations.
+        Run all validation rules.
+
+        Rules run by cost class (frontmatter-only rules first, filesystem
+        rules last and back to back, after the shared indexes are built);
+        on_result receives the results of each rule as soon as it completes,
+        in execution order, while the returned report lists them in rule
+        registration order.
 
         Args:
             permissive: If True, recommended checks become warnings (non-blocking)
+            on_result: Called with each result as soon as its rule completes
+            fail_fast: In strict mode (not permissive), stop at the first
+                failed required check
 
         Returns:
             ValidationReport with all results
         """
         skill_name = self._frontmatter.get("name", self.skill_path.name)
-        self.report = ValidationReport(skill_name=skill_name, skill_path=self.skill_path)
+        self.report = ValidationReport(skill_name=skill_name, skill_path=self.skill_path, on_result=on_result)
 
         # Load skill first
         if not self._load_skill():
@@ -176,25 +268,52 @@ class SkillValidator:
             ))
             return self.report
 
-        # Required checks (1-9)
-        self._validate_name_format()
-        self._validate_name_unique()
-        self._validate_description_specificity()
-        self._validate_description_length()
-        self._validate_trigger_words()
-        self._validate_line_count()
-        self._validate_references()
-        self._validate_allowed_tools()
-        self._validate_workflow_steps()
-
-        # Recommended checks (10-13) - warnings if permissive
-        self._check_examples(is_warning=permissive)
-        self._check_error_handling(is_warning=permissive)
-        self._check_limitations(is_warning=permissive)
-        self._check_task_tool_documentation(is_warning=permissive)
+        # Results are streamed once their rule completes and .required is set
+        self.report.on_result = None
+        schedule = sorted(range(len(self.rules)), key=lambda i: self.rules[i].cost.value)
+        rule_results: dict[int, list[ValidationResult]] = {}
+        filesystem_ready = False
+
+        for i in schedule:
+            rule = self.rules[i]
+            if rule.cost == RuleCost.EXPENSIVE and not filesystem_ready:
+                self._prepare_filesystem()
+                filesystem_ready = True
+
+            required = rule.severity == RuleSeverity.REQUIRED
+            before = len(self.report.results)
+            if required:
+                rule.check(self)
+            else:
+                rule.check(self, is_warning=permissive)
+            rule_results[i] = self.report.results[before:]
+            for result in rule_results[i]:
+                result.required = required
+
+            self._stream(rule_results[i], on_result)
 
+            if fail_fast and not permissive and required and not all(r.passed for r in rule_results[i]):
+                break
+
+        # Report order is registration order, whatever the execution order
+        self.report.results = [result for i in sorted(rule_results) for result in rule_results[i]]
+        self.report.on_result = on_result
         return self.report
 
+    @staticmethod
+    def _stream(results: list[ValidationResult], on_result: Optional[Callable[[ValidationResult], None]]) -> None:
+        if on_result is not None:
+            for result in results:
+                on_result(result)
+
+    def _prepare_filesystem(self) -> None:
+        """Build the shared indexes once before the filesystem rules run as a batch."""
+        if self._name_index is None:
+            self._name_index = SkillNameIndex.for_root(self.skills_root)
+        if self._path_index is None:
+            self._path_index = PathIndex.for_root(self.skills_root)
+
+    @validation_rule(2, "Name format", {RuleInput.FRONTMATTER}, RuleCost.CHEAP)
     def _validate_name_format(self) -> None:
         """Check 1-2: Name format (kebab-case, lowercase, ≤64 chars)."""
         name = self._frontmatter.get("name", "")
@@ -231,26 +350,20 @@ class SkillValidator:
                 message=f"Name valid: {name} ({len(name)} chars)"
             ))
 
+    @validation_rule(1, "Name unique", {RuleInput.FRONTMATTER, RuleInput.FILESYSTEM}, RuleCost.EXPENSIVE)
     def _validate_name_unique(self) -> None:
         """Check 1: Name is unique across skills/."""
         name = self._frontmatter.get("name", "")
         if not name:
             return  # Already reported in format check
 
-        duplicates = []
-
-        # Search for other skills with same name
-        if self.skills_root.exists():
-            for skill_dir in self.skills_root.rglob("SKILL.md"):
-                if skill_dir.resolve() == self.skill_md.resolve():
-                    continue  # Skip self
-
-                try:
-                    content = skill_dir.read_text(encoding="utf-8")
-                    if f"name: {name}" in content or f"name: {name}\n" in content:
-                        duplicates.append(skill_dir.parent.relative_to(self.skills_root))
-                except (OSError, UnicodeDecodeError):
-                    pass
+        # Look up other skills declaring the same frontmatter name
+        index = self._name_index or SkillNameIndex.for_root(self.skills_root)
+        duplicates = [
+            skill_dir.relative_to(index.skills_root)
+            for skill_dir in index.skills_named(name)
+            if skill_dir != self.skill_path  # Skip self
+        ]
 
         if duplicates:
             self.report.add(ValidationResult(
@@ -267,6 +380,7 @@ class SkillValidator:
                 message=f"Name '{name}' is unique"
             ))
 
+    @validation_rule(3, "Description specific", {RuleInput.FRONTMATTER}, RuleCost.CHEAP)
     def _validate_description_specificity(self) -> None:
         """Check 3: Description is specific (no vague terms)."""
         description = self._frontmatter.get("description", "").lower()
@@ -297,6 +411,7 @@ class SkillValidator:
                 message="Description is specific (no vague terms)"
             ))
 
+    @validation_rule(4, "Description length", {RuleInput.FRONTMATTER}, RuleCost.CHEAP)
     def _validate_description_length(self) -> None:
         """Check 4: Description length < 1024 chars."""
         description = self._frontmatter.get("description", "")
@@ -329,6 +444,7 @@ class SkillValidator:
                 message=f"Description length OK ({word_count} words, {char_count} chars)"
             ))
 
+    @validation_rule(5, "Trigger words", {RuleInput.FRONTMATTER}, RuleCost.CHEAP)
     def _validate_trigger_words(self) -> None:
         """Check 5: Description has trigger words."""
         description = self._frontmatter.get("description", "").lower()
@@ -367,9 +483,10 @@ class SkillValidator:
                 message="Description lacks trigger words (add 'Use when:', 'Triggers:', etc.)"
             ))
 
+    @validation_rule(6, "Line count", {RuleInput.BODY}, RuleCost.MODERATE)
     def _validate_line_count(self) -> None:
         """Check 6: SKILL.md < 500 lines."""
-        line_count = len(self._content.split("\n"))
+        line_count = self._doc.line_count
 
         if line_count >= self.MAX_SKILL_LINES:
             self.report.add(ValidationResult(
@@ -386,11 +503,13 @@ class SkillValidator:
                 message=f"SKILL.md lines OK ({line_count} < {self.MAX_SKILL_LINES})"
             ))
 
+    @validation_rule(7, "References exist", {RuleInput.BODY, RuleInput.FILESYSTEM}, RuleCost.EXPENSIVE)
     def _validate_references(self) -> None:
         """Check 7: All referenced files exist."""
         # Find markdown links in body
         link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
         missing = []
+        index = self._path_index or PathIndex.for_root(self.skills_root)
 
         for match in link_pattern.finditer(self._body):
             link_text, link_path = match.groups()
@@ -399,27 +518,36 @@ class SkillValidator:
             if link_path.startswith(("http://", "https://", "#", "mailto:")):
                 continue
 
-            # Resolve relative path from SKILL.md location
-            full_path = (self.skill_path / link_path).resolve()
+            # Relative to SKILL.md; answered from the index of the skills tree
+            full_path = self.skill_path / link_path
+            exists = index.exists(full_path)
+            self.probed_paths[PathIndex.normalize(full_path)] = exists
 
-            if not full_path.exists():
+            if not exists:
                 missing.append(link_path)
+            if not index.is_inside(full_path):
+                self.outside_links.append(link_path)
 
+        outside = (
+            f" ({len(self.outside_links)} outside {self.skills_root.name}/: {', '.join(self.outside_links)})"
+            if self.outside_links else ""
+        )
         if missing:
             self.report.add(ValidationResult(
                 check_number=7,
                 name="References exist",
                 passed=False,
-                message=f"Missing referenced files: {', '.join(missing)}"
+                message=f"Missing referenced files: {', '.join(missing)}{outside}"
             ))
         else:
             self.report.add(ValidationResult(
                 check_number=7,
                 name="References exist",
                 passed=True,
-                message="All referenced files exist"
+                message=f"All referenced files exist{outside}"
             ))
 
+    @validation_rule(8, "Allowed tools", {RuleInput.FRONTMATTER}, RuleCost.CHEAP)
     def _validate_allowed_tools(self) -> None:
         """Check 8: allowed-tools is appropriate."""
         allowed_tools = self._frontmatter.get("allowed-tools", "")
@@ -459,6 +587,7 @@ class SkillValidator:
                 message=f"allowed-tools valid: {allowed_tools}"
             ))
 
+    @validation_rule(9, "Workflow steps", {RuleInput.BODY}, RuleCost.MODERATE)
     def _validate_workflow_steps(self) -> None:
         """Check 9: Workflow steps are numbered (≥3)."""
         # Look for numbered steps pattern: "1. ", "2. ", etc.
@@ -480,6 +609,8 @@ class SkillValidator:
                 message=f"Workflow needs ≥{self.MIN_WORKFLOW_STEPS} numbered steps (found {len(steps)})"
             ))
 
+    @validation_rule(10, "Examples", {RuleInput.BODY}, RuleCost.MODERATE,
+                     severity=RuleSeverity.RECOMMENDED)
     def _check_examples(self, is_warning: bool = False) -> None:
         """Check 10: Examples included."""
         body_lower = self._body.lower()
@@ -500,6 +631,8 @@ class SkillValidator:
             is_warning=is_warning
         ))
 
+    @validation_rule(11, "Error handling", {RuleInput.BODY}, RuleCost.MODERATE,
+                     severity=RuleSeverity.RECOMMENDED)
     def _check_error_handling(self, is_warning: bool = False) -> None:
         """Check 11: Error handling defined."""
         body_lower = self._body.lower()
@@ -519,6 +652,8 @@ class SkillValidator:
             is_warning=is_warning
         ))
 
+    @validation_rule(12, "Limitations", {RuleInput.BODY}, RuleCost.MODERATE,
+                     severity=RuleSeverity.RECOMMENDED)
     def _check_limitations(self, is_warning: bool = False) -> None:
         """Check 12: Limitations documented."""
         body_lower = self._body.lower()
@@ -538,6 +673,8 @@ class SkillValidator:
             is_warning=is_warning
         ))
 
+    @validation_rule(13, "Task tool docs", {RuleInput.FILESYSTEM}, RuleCost.EXPENSIVE,
+                     severity=RuleSeverity.RECOMMENDED)
     def _check_task_tool_documentation(self, is_warning: bool = False) -> None:
         """Check 13: Task tool documentation for complex workflows with agent delegation."""
         steps_dir = self.skill_path / "steps"
@@ -554,7 +691,12 @@ class SkillValidator:
             return
 
         # Count steps to determine complexity
-        step_files = list(steps_dir.glob("step-*.md"))
+        if self.corpus is not None:
+            step_files = [p for p in self.corpus.step_paths if p.name.startswith("step-")]
+            step_texts = {f.path: f.text for f in self.corpus.step_chain_files}
+        else:
+            step_files = list(steps_dir.glob("step-*.md"))
+            step_texts = {}
 
         # Only check for complex skills (4+ steps)
         if len(step_files) < 4:
@@ -574,7 +716,9 @@ class SkillValidator:
 
         for step_file in step_files:
             try:
-                content = step_file.read_text(encoding="utf-8")
+                content = step_texts.get(step_file)
+                if content is None:
+                    content = step_file.read_text(encoding="utf-8")
                 for agent in delegable_agents:
                     if agent in content:
                         uses_delegable = True
@@ -628,8 +772,8 @@ def print_report(report: ValidationReport, permissive: bool = False) -> int:
     print(f"   Path: {report.skill_path}\n")
 
     # Group results
-    required = [r for r in report.results if r.check_number <= 9]
-    recommended = [r for r in report.results if r.check_number > 9]
+    required = [r for r in report.results if r.required]
+    recommended = [r for r in report.results if not r.required]
 
     print("Required Checks:")
     for r in required:
@@ -670,6 +814,48 @@ def print_report(report: ValidationReport, permissive: bool = False) -> int:
         return 1
 
 
+def validation_exit_code(report: ValidationReport, permissive: bool = False) -> int:
+    """Exit code of a report: 1 if a required check (or, unless permissive, a recommended one) failed."""
+    required_ok = all(r.passed for r in report.results if r.required)
+    recommended_ok = all(r.passed for r in report.results if not r.required)
+    return 0 if required_ok and (recommended_ok or permissive) else 1
+
+
+def stream_validation(validator: SkillValidator, fmt: str, permissive: bool = False, fail_fast: bool = False) -> int:
+    """
+    Validate and stream each check as NDJSON or SARIF as soon as it completes.
+
+    Returns:
+        Exit code, as print_report()
+    """
+    reporter = make_reporter(fmt, sys.stdout, tool="epci-validate-skill")
+
+    def emit(result: ValidationResult) -> None:
+        reporter.check(CheckRecord(
+            skill_name=validator.report.skill_name,
+            skill_path=validator.skill_path,
+            check_id=str(result.check_number),
+            name=result.name,
+            passed=result.passed,
+            message=result.message,
+            severity="warning" if result.is_warning else "error",
+        ))
+
+    report = validator.validate_all(permissive=permissive, on_result=emit, fail_fast=fail_fast)
+    exit_code = validation_exit_code(report, permissive)
+    summary = {
+        "skill_name": report.skill_name,
+        "skill_path": str(report.skill_path),
+        "passed": exit_code == 0,
+        "checks": len(report.results),
+        "failed": sum(1 for r in report.results if not r.passed),
+        "warning_count": report.warning_count,
+    }
+    reporter.skill(summary)
+    reporter.finish({"skill_count": 1, "failed_count": 0 if exit_code == 0 else 1})
+    return exit_code
+
+
 def main() -> int:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -680,6 +866,7 @@ Examples:
   %(prog)s ../brainstorm/              # Validate skill
   %(prog)s ../core/state-manager/      # Validate core skill
   %(prog)s ./my-skill/ --permissive    # Warnings only for recommended
+  %(prog)s ../spec/ --stream sarif     # SARIF for CI annotations
         """
     )
     parser.add_argument(
@@ -692,6 +879,17 @@ Examples:
         action="store_true",
         help="Treat recommended checks as warnings (non-blocking)"
     )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first failed required check (strict mode only)"
+    )
+    parser.add_argument(
+        "--stream",
+        choices=STREAM_FORMATS,
+        default=None,
+        help="Stream each check as NDJSON or SARIF as soon as it completes"
+    )
     parser.add_argument(
         "--skills-root",
         type=Path,
@@ -714,7 +912,9 @@ Examples:
 
     # Run validation
     validator = SkillValidator(skill_path, skills_root=args.skills_root)
-    report = validator.validate_all(permissive=args.permissive)
+    if args.stream:
+        return stream_validation(validator, args.stream, permissive=args.permissive, fail_fast=args.fail_fast)
+    report = validator.validate_all(permissive=args.permissive, fail_fast=args.fail_fast)
 
     return print_report(report, permissive=args.permissive)
 